@@ -0,0 +1,203 @@
+"""Least-effort scores on the remaining assessments for a target grade.
+
+:func:`calculations.what_if` spreads the gap evenly over what is left.
+:func:`allocate` instead finds, for each ungraded assessment, the score that
+reaches the target with the fewest total score points, optionally within
+per-assessment ``[min_score, max_score]`` bounds. One point on an assessment
+is worth its weight, so the optimum raises the heaviest assessments first:
+everything starts at its minimum, then each assessment, heaviest first, is
+raised to its maximum until the target is met, the last one only partly.
+
+An :class:`AllocationPlan` holds a tenant's ungraded assessments in that
+order with the prefix sums of their maximum points. It only depends on the
+data, so :class:`PlanCache` keeps one per ``(tenant, data version)`` and a
+query without bounds is a binary search over the prefix sums.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable, NamedTuple, Sequence
+
+from . import schemas
+from .instrumentation import timed
+
+# Needed points below this count as met (float noise in the prefix sums)
+_EPSILON = 1e-9
+
+
+class InvalidBounds(ValueError):
+    """Raised when score bounds name unknown or graded assessments, or are empty."""
+
+
+class AllocationPlan(NamedTuple):
+    """A tenant's ungraded assessments, ready to answer any target."""
+
+    items: tuple  # ungraded rows in due-date order: id, title, weight_pct
+    order: tuple[int, ...]  # indexes into items, heaviest first
+    prefix: tuple[float, ...]  # prefix[k]: points from 100% on order[:k]
+    earned: float  # weight x score already earned on graded rows
+
+
+class _Item(NamedTuple):
+    id: int
+    title: str
+    weight_pct: float
+
+
+def build_plan(rows: Iterable) -> AllocationPlan:
+    """Plan from a tenant's rows (graded ones only add to ``earned``)."""
+    earned = 0.0
+    items = []
+    for r in rows:
+        if r.score_pct is None:
+            items.append(_Item(r.id, r.title, float(r.weight_pct)))
+        else:
+            earned += float(r.weight_pct) * float(r.score_pct)
+    # Ties keep due-date order: the earlier assessment is raised first
+    order = tuple(sorted(range(len(items)), key=lambda i: -items[i].weight_pct))
+    prefix = [0.0]
+    for i in order:
+        prefix.append(prefix[-1] + items[i].weight_pct * 100.0)
+    return AllocationPlan(tuple(items), order, tuple(prefix), earned)
+
+
+def _round_up(score: float, cap: float) -> float:
+    """Round to 2 decimals without landing below the target."""
+    return min(cap, math.ceil(round(score * 100.0, 6)) / 100.0)
+
+
+def _unbounded(plan: AllocationPlan, needed: float) -> tuple[list[float], float]:
+    scores = [0.0] * len(plan.items)
+    if needed <= _EPSILON:
+        return scores, needed
+    if needed > plan.prefix[-1] + _EPSILON:
+        return [100.0] * len(plan.items), needed - plan.prefix[-1]
+    k = bisect_left(plan.prefix, needed - _EPSILON)
+    for i in plan.order[: k - 1]:
+        scores[i] = 100.0
+    last = plan.order[k - 1]
+    partial = (needed - plan.prefix[k - 1]) / plan.items[last].weight_pct
+    scores[last] = _round_up(partial, 100.0)
+    return scores, 0.0
+
+
+def _bounded(
+    plan: AllocationPlan, needed: float, bounds: dict[int, tuple[float, float]]
+) -> tuple[list[float], float]:
+    lows = [bounds.get(item.id, (0.0, 100.0))[0] for item in plan.items]
+    scores = list(lows)
+    needed -= sum(item.weight_pct * low for item, low in zip(plan.items, lows))
+    for i in plan.order:
+        if needed <= _EPSILON:
+            break
+        weight = plan.items[i].weight_pct
+        low, high = bounds.get(plan.items[i].id, (0.0, 100.0))
+        room = weight * (high - low)
+        if room >= needed:
+            scores[i] = _round_up(low + needed / weight, high)
+            needed = 0.0
+        else:
+            scores[i] = high
+            needed -= room
+    return scores, needed
+
+
+def _check_bounds(
+    plan: AllocationPlan, bounds: Sequence[schemas.ScoreBounds]
+) -> dict[int, tuple[float, float]]:
+    limits = {b.id: (b.min_score, b.max_score) for b in bounds}
+    if len(limits) != len(bounds):
+        raise InvalidBounds("Each assessment may be bounded only once")
+    unknown = sorted(limits.keys() - {item.id for item in plan.items})
+    if unknown:
+        raise InvalidBounds(f"Not ungraded assessments of this gradebook: {unknown}")
+    empty = sorted(i for i, (low, high) in limits.items() if low > high)
+    if empty:
+        raise InvalidBounds(f"min_score exceeds max_score for assessments: {empty}")
+    return limits
+
+
+@timed("calc")
+def allocate(
+    plan: AllocationPlan,
+    target: float,
+    bounds: Sequence[schemas.ScoreBounds] = (),
+) -> schemas.Allocation:
+    """Least-effort score per ungraded assessment to reach ``target``.
+
+    When the target cannot be reached, every assessment is at its maximum
+    and ``feasible`` is false; when it is already secured, at its minimum.
+    """
+    needed = target * 100.0 - plan.earned
+    if bounds:
+        scores, short = _bounded(plan, needed, _check_bounds(plan, bounds))
+    else:
+        scores, short = _unbounded(plan, needed)
+    points = plan.earned + sum(
+        item.weight_pct * score for item, score in zip(plan.items, scores)
+    )
+    return schemas.Allocation(
+        target=target,
+        feasible=short <= _EPSILON,
+        grade=round(points / 100.0, 2),
+        assessments=[
+            schemas.AllocatedScore(
+                id=item.id, title=item.title, weight_pct=item.weight_pct, score=score
+            )
+            for item, score in zip(plan.items, scores)
+        ],
+    )
+
+
+class PlanCache:
+    """Bounded LRU of allocation plans keyed by ``(tenant, data version)``.
+
+    A data version never changes once read, so entries need no invalidation;
+    superseded versions simply age out.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, AllocationPlan] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> AllocationPlan | None:
+        with self._lock:
+            plan = self._entries.get(key)
+            if plan is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return plan
+
+    def put(self, key: Hashable, plan: AllocationPlan) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = plan
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_build(
+        self, key: Hashable, build: Callable[[], AllocationPlan]
+    ) -> AllocationPlan:
+        plan = self.get(key)
+        if plan is None:
+            plan = build()
+            self.put(key, plan)
+        return plan
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -1,23 +1,37 @@
 from typing import NoReturn
-from pathlib import Path
 
-from fastapi import FastAPI, Depends, HTTPException, Response
+from fastapi import Body, FastAPI, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.gzip import GZipMiddleware
 from sqlalchemy.orm import Session
 
-from . import calculations, models, schemas, services
-from .db import SessionLocal, engine
-from .settings import Settings, settings
+from . import allocation, calculations, export, metrics, migrate, models, schemas, services
+from .events import StatsBroadcaster
+from .instrumentation import RequestMetricsMiddleware
+from .responses import RawJSONResponse
+from .static import DIST_DIRNAME, FRONTEND_DIR, PrecompressedStaticFiles
+from .db import get_async_sessionmaker, get_engine, get_sessionmaker
+from .settings import Settings, get_settings
 
 NOT_FOUND_DETAIL = "Assessment not found"
+COURSE_NOT_FOUND_DETAIL = "Course not found"
+STUDENT_NOT_FOUND_DETAIL = "Student not found"
+MAX_PAGE_SIZE = 1000
+MAX_BULK_ITEMS = 1000
+MAX_WHAT_IF_TARGETS = 100
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+ETAG_HEADER = "ETag"
+# Stop reverse proxies (nginx) from buffering the event stream
+STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
 
 
 # -----------------------------
 # Database Dependency
 # -----------------------------
 def get_db():
-    session = SessionLocal()
+    session = get_sessionmaker()()
     try:
         yield session
     finally:
@@ -25,28 +39,180 @@ def get_db():
 
 
 def get_assessment_service(
+    request: Request,
     session: Session = Depends(get_db),
 ) -> services.AssessmentService:
     repository = services.AssessmentRepository(session)
-    return services.AssessmentService(repository)
+    return services.AssessmentService(
+        repository,
+        cache=request.app.state.stats_cache,
+        events=request.app.state.stats_events,
+    )
+
+
+def get_course_assessment_service(
+    course_id: int,
+    request: Request,
+    session: Session = Depends(get_db),
+) -> services.AssessmentService:
+    repository = services.AssessmentRepository(session, course_id=course_id)
+    if not repository.course_exists():
+        raise HTTPException(status_code=404, detail=COURSE_NOT_FOUND_DETAIL)
+    return services.AssessmentService(
+        repository,
+        cache=request.app.state.stats_cache,
+        events=request.app.state.stats_events,
+    )
+
+
+def get_course_service(session: Session = Depends(get_db)) -> services.CourseService:
+    return services.CourseService(services.CourseRepository(session))
+
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as session:
+        yield session
 
 
-def get_settings() -> Settings:
-    return settings
+def get_async_assessment_service(
+    request: Request,
+    session=Depends(get_async_db),
+) -> services.AsyncAssessmentService:
+    repository = services.AsyncAssessmentRepository(session)
+    return services.AsyncAssessmentService(
+        repository,
+        cache=request.app.state.stats_cache,
+        events=request.app.state.stats_events,
+    )
+
+
+async def get_async_course_assessment_service(
+    course_id: int,
+    request: Request,
+    session=Depends(get_async_db),
+) -> services.AsyncAssessmentService:
+    repository = services.AsyncAssessmentRepository(session, course_id=course_id)
+    if not await repository.course_exists():
+        raise HTTPException(status_code=404, detail=COURSE_NOT_FOUND_DETAIL)
+    return services.AsyncAssessmentService(
+        repository,
+        cache=request.app.state.stats_cache,
+        events=request.app.state.stats_events,
+    )
 
 
 def _raise_not_found(err: Exception) -> NoReturn:
     raise HTTPException(status_code=404, detail=NOT_FOUND_DETAIL) from err
 
 
+def _raise_bulk_not_found(err: services.AssessmentsNotFound) -> NoReturn:
+    detail = [{"id": aid, "error": NOT_FOUND_DETAIL} for aid in err.assessment_ids]
+    raise HTTPException(status_code=404, detail=detail) from err
+
+
+def _bulk_results(ids: list[int], status: str) -> list[schemas.BulkItemResult]:
+    return [
+        schemas.BulkItemResult(index=index, id=aid, status=status)
+        for index, aid in enumerate(ids)
+    ]
+
+
+def _page_response(
+    response: Response, rows: list[dict], next_cursor: str | None
+) -> RawJSONResponse:
+    # Rows are plain column dicts: encoded directly, not via the response model
+    headers = dict(response.headers)
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    return RawJSONResponse(rows, headers=headers)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison, so W/ prefixes are ignored
+    tags = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in tags
+
+
+def _revalidate(request: Request, response: Response, etag: str) -> None:
+    """Answer ``304`` when the client already holds this version of the data.
+
+    Raised before any rows are loaded or serialized; otherwise the ETag is
+    attached to the full response, which clients must revalidate each time.
+    """
+    headers = {ETAG_HEADER: etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
+
+
+def _stats_frame(summary: services.TenantSummary) -> bytes:
+    """One SSE ``stats`` event; its id is the data version also used in ETags."""
+    event = schemas.StatsEvent(
+        stats=calculations.current_stats_from_totals(summary.totals),
+        validation=calculations.validate_weights_from_totals(summary.totals),
+    )
+    return b"id: %d\nevent: stats\ndata: %s\n\n" % (
+        summary.version,
+        event.model_dump_json().encode(),
+    )
+
+
+def _history_payload(
+    snapshots: list[calculations.TotalsSnapshot],
+) -> list[schemas.StatsSnapshot]:
+    return [
+        schemas.StatsSnapshot(
+            version=snapshot.version,
+            **calculations.current_stats_from_totals(snapshot.totals).model_dump(),
+        )
+        for snapshot in snapshots
+    ]
+
+
+def _dashboard_payload(rows: list[models.Assessment]) -> dict:
+    agg = calculations.totals(rows)
+    return {
+        "assessments": rows,
+        "stats": calculations.current_stats_from_totals(agg),
+        "validation": calculations.validate_weights_from_totals(agg),
+    }
+
+
 # -----------------------------
 # Application Factory
 # -----------------------------
-def create_app(app_settings: Settings = settings) -> FastAPI:
+def create_app(app_settings: Settings | None = None) -> FastAPI:
+    app_settings = app_settings or get_settings()
     app = FastAPI(
         title=app_settings.app_title,
         version=app_settings.app_version,
     )
+    app.state.stats_cache = services.StatsCache(
+        app_settings.stats_cache_size, app_settings.stats_history_size
+    )
+    app.state.stats_events = StatsBroadcaster(
+        _stats_frame,
+        queue_size=app_settings.stats_stream_queue_size,
+        coalesce_s=app_settings.stats_stream_coalesce_ms / 1000.0,
+        keepalive_s=app_settings.stats_stream_keepalive_s,
+    )
+    app.state.allocation_plans = allocation.PlanCache(
+        app_settings.allocation_cache_size
+    )
+    app.state.simulation_limits = {
+        "budget_s": app_settings.what_if_simulation_budget_ms / 1000.0,
+        "max_trials": app_settings.what_if_simulation_max_trials,
+    }
+
+    # Per-endpoint query counts and timings (and the optional Server-Timing header)
+    if app_settings.metrics_enabled or app_settings.server_timing:
+        app.add_middleware(
+            RequestMetricsMiddleware, server_timing=app_settings.server_timing
+        )
 
     # CORS
     app.add_middleware(
@@ -55,28 +221,44 @@ def create_app(app_settings: Settings = settings) -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER, ETAG_HEADER],
     )
 
-    # Auto-create tables (SQLite or Postgres)
+    # Compress API responses; static files come precompressed and SSE and
+    # already-encoded responses are passed through
+    if app_settings.gzip_level > 0:
+        app.add_middleware(
+            GZipMiddleware,
+            minimum_size=app_settings.gzip_min_size,
+            compresslevel=app_settings.gzip_level,
+        )
+
+    # Create missing tables and migrate existing ones (SQLite or Postgres)
     if app_settings.auto_create_tables:
 
         @app.on_event("startup")
         def _create_tables() -> None:
-            models.Base.metadata.create_all(bind=engine)
+            migrate.upgrade(get_engine())
 
     # -----------------------------
     # Monitoring: Prometheus Instrumentation
     # -----------------------------
-    try:
-        from prometheus_fastapi_instrumentator import Instrumentator
-
-        Instrumentator().instrument(app).expose(app)
-    except Exception:
-        # Safe fallback — tests may not have this package installed
-        pass
+    if app_settings.metrics_enabled and metrics.available():
+        try:
+            from prometheus_fastapi_instrumentator import Instrumentator
+
+            # Request metrics only; /metrics itself is served below
+            Instrumentator(excluded_handlers=["/metrics"]).instrument(app)
+        except ImportError:
+            pass  # HTTP-level histograms are optional
+        app.add_route(
+            "/metrics",
+            metrics.MetricsEndpoint(ttl_s=app_settings.metrics_cache_s).scrape,
+            include_in_schema=False,
+        )
 
     # Register API routes
-    _register_routes(app)
+    _register_routes(app, async_db=app_settings.async_db)
 
     return app
 
@@ -84,65 +266,148 @@ def create_app(app_settings: Settings = settings) -> FastAPI:
 # -----------------------------
 # Routes / API Endpoints
 # -----------------------------
-def _register_routes(app: FastAPI) -> None:
+def _register_routes(app: FastAPI, async_db: bool = False) -> None:
 
     # ---- Health Check ---------------------------------------------------
     @app.get("/health")
     def health():
         return {"ok": True}
 
-    # ---- Basic Metrics Endpoint (backup) --------------------------------
-    # Instrumentator already exposes /metrics, but this is a fallback
-    try:
-        from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+    # ---- Tenants: students and courses -----------------------------------
+    _register_course_routes(app)
+
+    # The same assessment/stats API serves the default gradebook at the top
+    # level and each course under /courses/{course_id}.
+    scopes = (
+        ("", get_assessment_service, get_async_assessment_service),
+        (
+            "/courses/{course_id}",
+            get_course_assessment_service,
+            get_async_course_assessment_service,
+        ),
+    )
+    for prefix, sync_service, async_service in scopes:
+        # Registered before /assessments/{aid} so "bulk"/"export" are not ids
+        _register_bulk_routes(app, prefix, sync_service)
+        if async_db:
+            _register_async_core_routes(app, prefix, async_service)
+        else:
+            _register_core_routes(app, prefix, sync_service)
 
-        @app.get("/metrics")
-        def metrics():
-            data = generate_latest()
-            return Response(content=data, media_type=CONTENT_TYPE_LATEST)
+    # ---- Serve Frontend --------------------------------------------------
+    # The build output (python -m backend.cli build-frontend) shadows the
+    # sources; neither directory is touched until the first static request
+    app.mount(
+        "/",
+        PrecompressedStaticFiles(
+            directories=[FRONTEND_DIR / DIST_DIRNAME, FRONTEND_DIR], html=True
+        ),
+        name="frontend",
+    )
 
-    except Exception:
-        pass
+
+def _register_course_routes(app: FastAPI) -> None:
+    @app.post("/students", response_model=schemas.StudentOut)
+    def create_student(
+        payload: schemas.StudentIn,
+        service: services.CourseService = Depends(get_course_service),
+    ):
+        return service.create_student(payload)
+
+    @app.get("/students", response_model=list[schemas.StudentOut])
+    def list_students(
+        service: services.CourseService = Depends(get_course_service),
+    ):
+        return service.list_students()
+
+    @app.post("/courses", response_model=schemas.CourseOut)
+    def create_course(
+        payload: schemas.CourseIn,
+        service: services.CourseService = Depends(get_course_service),
+    ):
+        try:
+            return service.create_course(payload)
+        except services.StudentNotFound as err:
+            raise HTTPException(status_code=404, detail=STUDENT_NOT_FOUND_DETAIL) from err
+
+    @app.get("/courses", response_model=list[schemas.CourseOut])
+    def list_courses(
+        student_id: int | None = None,
+        service: services.CourseService = Depends(get_course_service),
+    ):
+        return service.list_courses(student_id)
+
+    @app.get("/courses/{course_id}", response_model=schemas.CourseOut)
+    def get_course(
+        course_id: int,
+        service: services.CourseService = Depends(get_course_service),
+    ):
+        try:
+            return service.get_course(course_id)
+        except services.CourseNotFound as err:
+            raise HTTPException(status_code=404, detail=COURSE_NOT_FOUND_DETAIL) from err
+
+
+def _register_core_routes(
+    app: FastAPI, prefix: str = "", get_service=get_assessment_service
+) -> None:
+    def fresh_summary(
+        request: Request,
+        response: Response,
+        service: services.AssessmentService = Depends(get_service),
+    ) -> services.TenantSummary:
+        summary = service.stats_summary()
+        _revalidate(request, response, service.etag(summary))
+        return summary
 
     # ---- CRUD: Assessments ----------------------------------------------
-    @app.post("/assessments", response_model=schemas.AssessmentOut)
+    @app.post(prefix + "/assessments", response_model=schemas.AssessmentOut)
     def create_assessment(
         payload: schemas.AssessmentIn,
-        service: services.AssessmentService = Depends(get_assessment_service),
+        service: services.AssessmentService = Depends(get_service),
     ):
         return service.create_assessment(payload)
 
-    @app.get("/assessments", response_model=list[schemas.AssessmentOut])
+    @app.get(prefix + "/assessments", response_model=list[schemas.AssessmentOut])
     def list_assessments(
-        service: services.AssessmentService = Depends(get_assessment_service),
+        response: Response,
+        limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+        after: str | None = None,
+        fields: str | None = None,
+        service: services.AssessmentService = Depends(get_service),
+        _: services.TenantSummary = Depends(fresh_summary),
     ):
-        return service.list_assessments()
+        try:
+            rows, next_cursor = service.list_page(limit, after, fields)
+        except services.InvalidPageRequest as err:
+            raise HTTPException(status_code=422, detail=str(err)) from err
+        return _page_response(response, rows, next_cursor)
 
-    @app.get("/assessments/{aid}", response_model=schemas.AssessmentOut)
+    @app.get(prefix + "/assessments/{aid}", response_model=schemas.AssessmentOut)
     def get_assessment(
         aid: int,
-        service: services.AssessmentService = Depends(get_assessment_service),
+        service: services.AssessmentService = Depends(get_service),
     ):
         try:
             return service.get_assessment(aid)
         except services.AssessmentNotFound as err:
             _raise_not_found(err)
 
-    @app.put("/assessments/{aid}", response_model=schemas.AssessmentOut)
+    @app.put(prefix + "/assessments/{aid}", response_model=schemas.AssessmentOut)
     def update_assessment(
         aid: int,
         payload: schemas.AssessmentUpdate,
-        service: services.AssessmentService = Depends(get_assessment_service),
+        service: services.AssessmentService = Depends(get_service),
     ):
         try:
             return service.update_assessment(aid, payload)
         except services.AssessmentNotFound as err:
             _raise_not_found(err)
 
-    @app.delete("/assessments/{aid}")
+    @app.delete(prefix + "/assessments/{aid}")
     def delete_assessment(
         aid: int,
-        service: services.AssessmentService = Depends(get_assessment_service),
+        service: services.AssessmentService = Depends(get_service),
     ):
         try:
             service.delete_assessment(aid)
@@ -151,35 +416,313 @@ def _register_routes(app: FastAPI) -> None:
             _raise_not_found(err)
 
     # ---- Stats: current / what-if / validate ----------------------------
-    @app.get("/stats/current", response_model=schemas.CurrentStats)
+    @app.get(prefix + "/stats/current", response_model=schemas.CurrentStats)
     def current_stats(
-        service: services.AssessmentService = Depends(get_assessment_service),
+        summary: services.TenantSummary = Depends(fresh_summary),
     ):
-        return calculations.current_stats(service.list_for_stats())
+        return calculations.current_stats_from_totals(summary.totals)
 
-    @app.get("/stats/what-if", response_model=schemas.WhatIf)
+    @app.get(prefix + "/stats/what-if", response_model=schemas.WhatIf)
     def what_if(
         target: float,
-        service: services.AssessmentService = Depends(get_assessment_service),
+        summary: services.TenantSummary = Depends(fresh_summary),
+    ):
+        return calculations.what_if_from_totals(summary.totals, target)
+
+    @app.get(prefix + "/stats/what-if/batch", response_model=list[schemas.WhatIf])
+    def what_if_batch(
+        target: list[float] = Query(min_length=1, max_length=MAX_WHAT_IF_TARGETS),
+        summary: services.TenantSummary = Depends(fresh_summary),
+    ):
+        return calculations.what_if_many_from_totals(summary.totals, target)
+
+    @app.get(
+        prefix + "/stats/what-if/simulate", response_model=schemas.WhatIfSimulation
+    )
+    def what_if_simulate(
+        request: Request,
+        target: float,
+        precision: float = Query(default=0.01, gt=0, le=0.5),
+        seed: int | None = Query(default=None, ge=0),
+        service: services.AssessmentService = Depends(get_service),
+        _: services.TenantSummary = Depends(fresh_summary),
+    ):
+        limits = request.app.state.simulation_limits
+        return service.simulate_what_if(
+            target, precision=precision, seed=seed, **limits
+        )
+
+    @app.post(prefix + "/stats/what-if/allocate", response_model=schemas.Allocation)
+    def what_if_allocate(
+        request: Request,
+        payload: schemas.AllocationRequest,
+        service: services.AssessmentService = Depends(get_service),
     ):
-        return calculations.what_if(service.list_for_stats(), target)
+        plan = service.allocation_plan(request.app.state.allocation_plans)
+        try:
+            return allocation.allocate(plan, payload.target, payload.bounds)
+        except allocation.InvalidBounds as err:
+            raise HTTPException(status_code=422, detail=str(err)) from err
+
+    @app.get(prefix + "/stats/history", response_model=list[schemas.StatsSnapshot])
+    def stats_history(
+        service: services.AssessmentService = Depends(get_service),
+        _: services.TenantSummary = Depends(fresh_summary),
+    ):
+        return _history_payload(service.stats_history())
 
-    @app.get("/stats/validate", response_model=schemas.Validation)
+    @app.get(prefix + "/stats/validate", response_model=schemas.Validation)
     def validate_weights(
-        service: services.AssessmentService = Depends(get_assessment_service),
+        summary: services.TenantSummary = Depends(fresh_summary),
     ):
-        return calculations.validate_weights(service.list_for_stats())
+        return calculations.validate_weights_from_totals(summary.totals)
 
-    # ---- Serve Frontend --------------------------------------------------
-    frontend_dir = Path(__file__).resolve().parents[1] / "frontend"
+    # ---- Stats stream: a StatsEvent after every committed write ----------
+    @app.get(prefix + "/stats/stream", response_class=StreamingResponse)
+    async def stats_stream(
+        request: Request,
+        service: services.AssessmentService = Depends(get_service),
+    ):
+        events: StatsBroadcaster = request.app.state.stats_events
+        # Subscribe before reading the snapshot so no write falls in between
+        queue = events.subscribe(service.tenant)
+        try:
+            summary = await run_in_threadpool(service.stats_summary)
+            await run_in_threadpool(service.release)
+        except BaseException:
+            events.unsubscribe(service.tenant, queue)
+            raise
+        return StreamingResponse(
+            events.stream(service.tenant, queue, _stats_frame(summary)),
+            media_type="text/event-stream",
+            headers=STREAM_HEADERS,
+        )
+
+    # ---- Dashboard: list + stats + validation in one read ---------------
+    @app.get(prefix + "/dashboard", response_model=schemas.Dashboard)
+    def dashboard(
+        service: services.AssessmentService = Depends(get_service),
+        _: services.TenantSummary = Depends(fresh_summary),
+    ):
+        return _dashboard_payload(service.list_assessments())
+
+
+def _register_async_core_routes(
+    app: FastAPI, prefix: str = "", get_service=get_async_assessment_service
+) -> None:
+    """Same contract as the sync core routes, served by the async DB stack."""
+
+    async def fresh_summary(
+        request: Request,
+        response: Response,
+        service: services.AsyncAssessmentService = Depends(get_service),
+    ) -> services.TenantSummary:
+        summary = await service.stats_summary()
+        _revalidate(request, response, service.etag(summary))
+        return summary
+
+    # ---- CRUD: Assessments ----------------------------------------------
+    @app.post(prefix + "/assessments", response_model=schemas.AssessmentOut)
+    async def create_assessment(
+        payload: schemas.AssessmentIn,
+        service: services.AsyncAssessmentService = Depends(get_service),
+    ):
+        return await service.create_assessment(payload)
+
+    @app.get(prefix + "/assessments", response_model=list[schemas.AssessmentOut])
+    async def list_assessments(
+        response: Response,
+        limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+        after: str | None = None,
+        fields: str | None = None,
+        service: services.AsyncAssessmentService = Depends(get_service),
+        _: services.TenantSummary = Depends(fresh_summary),
+    ):
+        try:
+            rows, next_cursor = await service.list_page(limit, after, fields)
+        except services.InvalidPageRequest as err:
+            raise HTTPException(status_code=422, detail=str(err)) from err
+        return _page_response(response, rows, next_cursor)
+
+    @app.get(prefix + "/assessments/{aid}", response_model=schemas.AssessmentOut)
+    async def get_assessment(
+        aid: int,
+        service: services.AsyncAssessmentService = Depends(get_service),
+    ):
+        try:
+            return await service.get_assessment(aid)
+        except services.AssessmentNotFound as err:
+            _raise_not_found(err)
+
+    @app.put(prefix + "/assessments/{aid}", response_model=schemas.AssessmentOut)
+    async def update_assessment(
+        aid: int,
+        payload: schemas.AssessmentUpdate,
+        service: services.AsyncAssessmentService = Depends(get_service),
+    ):
+        try:
+            return await service.update_assessment(aid, payload)
+        except services.AssessmentNotFound as err:
+            _raise_not_found(err)
+
+    @app.delete(prefix + "/assessments/{aid}")
+    async def delete_assessment(
+        aid: int,
+        service: services.AsyncAssessmentService = Depends(get_service),
+    ):
+        try:
+            await service.delete_assessment(aid)
+            return {"ok": True}
+        except services.AssessmentNotFound as err:
+            _raise_not_found(err)
+
+    # ---- Stats: current / what-if / validate ----------------------------
+    @app.get(prefix + "/stats/current", response_model=schemas.CurrentStats)
+    async def current_stats(
+        summary: services.TenantSummary = Depends(fresh_summary),
+    ):
+        return calculations.current_stats_from_totals(summary.totals)
+
+    @app.get(prefix + "/stats/what-if", response_model=schemas.WhatIf)
+    async def what_if(
+        target: float,
+        summary: services.TenantSummary = Depends(fresh_summary),
+    ):
+        return calculations.what_if_from_totals(summary.totals, target)
+
+    @app.get(prefix + "/stats/what-if/batch", response_model=list[schemas.WhatIf])
+    async def what_if_batch(
+        target: list[float] = Query(min_length=1, max_length=MAX_WHAT_IF_TARGETS),
+        summary: services.TenantSummary = Depends(fresh_summary),
+    ):
+        return calculations.what_if_many_from_totals(summary.totals, target)
 
-    if frontend_dir.exists():
-        app.mount(
-            "/", StaticFiles(directory=str(frontend_dir), html=True), name="frontend"
+    @app.get(
+        prefix + "/stats/what-if/simulate", response_model=schemas.WhatIfSimulation
+    )
+    async def what_if_simulate(
+        request: Request,
+        target: float,
+        precision: float = Query(default=0.01, gt=0, le=0.5),
+        seed: int | None = Query(default=None, ge=0),
+        service: services.AsyncAssessmentService = Depends(get_service),
+        _: services.TenantSummary = Depends(fresh_summary),
+    ):
+        limits = request.app.state.simulation_limits
+        return await service.simulate_what_if(
+            target, precision=precision, seed=seed, **limits
+        )
+
+    @app.post(prefix + "/stats/what-if/allocate", response_model=schemas.Allocation)
+    async def what_if_allocate(
+        request: Request,
+        payload: schemas.AllocationRequest,
+        service: services.AsyncAssessmentService = Depends(get_service),
+    ):
+        plan = await service.allocation_plan(request.app.state.allocation_plans)
+        try:
+            return allocation.allocate(plan, payload.target, payload.bounds)
+        except allocation.InvalidBounds as err:
+            raise HTTPException(status_code=422, detail=str(err)) from err
+
+    @app.get(prefix + "/stats/history", response_model=list[schemas.StatsSnapshot])
+    async def stats_history(
+        service: services.AsyncAssessmentService = Depends(get_service),
+        _: services.TenantSummary = Depends(fresh_summary),
+    ):
+        return _history_payload(await service.stats_history())
+
+    @app.get(prefix + "/stats/validate", response_model=schemas.Validation)
+    async def validate_weights(
+        summary: services.TenantSummary = Depends(fresh_summary),
+    ):
+        return calculations.validate_weights_from_totals(summary.totals)
+
+    # ---- Stats stream: a StatsEvent after every committed write ----------
+    @app.get(prefix + "/stats/stream", response_class=StreamingResponse)
+    async def stats_stream(
+        request: Request,
+        service: services.AsyncAssessmentService = Depends(get_service),
+    ):
+        events: StatsBroadcaster = request.app.state.stats_events
+        queue = events.subscribe(service.tenant)
+        try:
+            summary = await service.stats_summary()
+            await service.release()
+        except BaseException:
+            events.unsubscribe(service.tenant, queue)
+            raise
+        return StreamingResponse(
+            events.stream(service.tenant, queue, _stats_frame(summary)),
+            media_type="text/event-stream",
+            headers=STREAM_HEADERS,
+        )
+
+    # ---- Dashboard: list + stats + validation in one read ---------------
+    @app.get(prefix + "/dashboard", response_model=schemas.Dashboard)
+    async def dashboard(
+        service: services.AsyncAssessmentService = Depends(get_service),
+        _: services.TenantSummary = Depends(fresh_summary),
+    ):
+        return _dashboard_payload(await service.list_assessments())
+
+
+def _register_bulk_routes(
+    app: FastAPI, prefix: str = "", get_service=get_assessment_service
+) -> None:
+    # ---- Bulk: validated up front, applied in a single transaction -------
+    @app.post(prefix + "/assessments/bulk", response_model=list[schemas.BulkItemResult])
+    def bulk_create_assessments(
+        payload: list[schemas.AssessmentIn] = Body(max_length=MAX_BULK_ITEMS),
+        service: services.AssessmentService = Depends(get_service),
+    ):
+        return _bulk_results(service.bulk_create(payload), "created")
+
+    @app.put(prefix + "/assessments/bulk", response_model=list[schemas.BulkItemResult])
+    def bulk_update_assessments(
+        payload: list[schemas.AssessmentBulkUpdate] = Body(max_length=MAX_BULK_ITEMS),
+        service: services.AssessmentService = Depends(get_service),
+    ):
+        try:
+            return _bulk_results(service.bulk_update(payload), "updated")
+        except services.DuplicateAssessmentIds as err:
+            raise HTTPException(status_code=422, detail=str(err)) from err
+        except services.AssessmentsNotFound as err:
+            _raise_bulk_not_found(err)
+
+    @app.delete(prefix + "/assessments/bulk", response_model=list[schemas.BulkItemResult])
+    def bulk_delete_assessments(
+        ids: list[int] = Body(max_length=MAX_BULK_ITEMS),
+        service: services.AssessmentService = Depends(get_service),
+    ):
+        try:
+            return _bulk_results(service.bulk_delete(ids), "deleted")
+        except services.AssessmentsNotFound as err:
+            _raise_bulk_not_found(err)
+
+    @app.get(prefix + "/assessments/export")
+    def export_assessments(
+        fmt: export.ExportFormat = Query(default="ndjson", alias="format"),
+        service: services.AssessmentService = Depends(get_service),
+    ):
+        return StreamingResponse(
+            export.encode(fmt, service.export_batches()),
+            media_type=export.MEDIA_TYPES[fmt],
         )
 
 
 # -----------------------------
 # ASGI Server Entrypoint
 # -----------------------------
-app = create_app()
+_app: FastAPI | None = None
+
+
+def __getattr__(name: str):
+    # ``backend.app:app`` (uvicorn, tests) is built on first access, so
+    # importing this module for create_app or get_db does not build an app
+    global _app
+    if name == "app":
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,184 @@
+"""Maintenance commands.
+
+    python -m backend.cli migrate
+    python -m backend.cli reconcile-summary [--dry-run]
+    python -m backend.cli importtime [--module backend.app] [--top 15]
+    python -m backend.cli build-frontend [--src frontend] [--out frontend/dist]
+    python -m backend.cli recompute-summary [--workers N] [--checkpoint PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+from . import migrate, services, static
+from .db import get_engine, get_sessionmaker
+
+
+def _format(totals) -> str:
+    if totals is None:
+        return "missing"
+    return "total={:.6f} done={:.6f} weighted={:.6f}".format(*totals)
+
+
+def migrate_schema(args: argparse.Namespace) -> int:
+    """Upgrade the configured database to the current schema."""
+    applied = migrate.upgrade(get_engine())
+    for step in applied:
+        print(step)
+    print("schema is current" if not applied else f"{len(applied)} steps applied")
+    return 0
+
+
+def reconcile_summary(args: argparse.Namespace) -> int:
+    """Rebuild ``grade_summary`` from ``assessments`` and print any drift."""
+    migrate.upgrade(get_engine())
+    with get_sessionmaker()() as session:
+        drift = services.reconcile_summaries(
+            session, fix=not args.dry_run, tolerance=args.tolerance
+        )
+    for entry in drift:
+        scope = "default" if entry.course_id is None else f"course {entry.course_id}"
+        stored, actual = _format(entry.stored), _format(entry.actual)
+        print(f"{scope}: stored {stored} != actual {actual}")
+    action = "found" if args.dry_run else "repaired"
+    print(f"{len(drift)} drifted summaries {action}")
+    # A dry run doubles as a check: non-zero exit when anything drifted
+    return 1 if args.dry_run and drift else 0
+
+
+class ImportTime(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def import_profile(module: str) -> list[ImportTime]:
+    """Import ``module`` in a fresh interpreter under ``-X importtime``."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        entries.append(ImportTime(name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def importtime(args: argparse.Namespace) -> int:
+    """Summarize where importing ``args.module`` spends its time."""
+    entries = import_profile(args.module)
+    packages: dict[str, int] = {}
+    for entry in entries:
+        top = entry.module.split(".", 1)[0]
+        packages[top] = packages.get(top, 0) + entry.self_us
+    total_us = sum(entry.self_us for entry in entries)
+    print(f"import {args.module}: {total_us / 1000:.1f} ms, {len(entries)} modules")
+    print("by package (self time):")
+    for name, self_us in sorted(packages.items(), key=lambda kv: -kv[1])[: args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {name}")
+    print("slowest modules (self time):")
+    for entry in sorted(entries, key=lambda e: -e.self_us)[: args.top]:
+        print(f"  {entry.self_us / 1000:8.1f} ms  {entry.module}")
+    return 0
+
+
+def build_frontend(args: argparse.Namespace) -> int:
+    """Fingerprint and precompress the static frontend."""
+    manifest = static.build_frontend(args.src, args.out)
+    for source, built in manifest.items():
+        print(f"{source} -> {built}")
+    if static.brotli is None:
+        print("brotli not installed: wrote .gz variants only")
+    return 0
+
+
+def _print_progress(status) -> None:
+    eta = "?" if status.eta_s is None else f"{status.eta_s:.0f}s"
+    print(
+        f"\r{status.done}/{status.total} tenants, {status.rows} rows, "
+        f"{status.rate:.0f} tenants/s, eta {eta}",
+        end="",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def recompute_summary(args: argparse.Namespace) -> int:
+    """Recompute every tenant's stats on a process pool."""
+    from .recompute import recompute_summaries
+
+    migrate.upgrade(get_engine())
+    if args.checkpoint and args.checkpoint.exists():
+        print(f"resuming from {args.checkpoint}", file=sys.stderr)
+    status = recompute_summaries(
+        workers=args.workers,
+        batch_size=args.batch_size,
+        checkpoint=args.checkpoint,
+        progress=_print_progress,
+    )
+    print(file=sys.stderr)
+    print(
+        f"{status.done - status.resumed} tenants ({status.rows} rows) recomputed "
+        f"in {status.elapsed_s:.1f}s; {status.invalid_weights} do not sum to 100%"
+    )
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m backend.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    upgrade = commands.add_parser(
+        "migrate", help="add missing columns, indexes and summary rows"
+    )
+    upgrade.set_defaults(handler=migrate_schema)
+
+    reconcile = commands.add_parser(
+        "reconcile-summary", help="rebuild grade_summary and report drift"
+    )
+    reconcile.add_argument("--dry-run", action="store_true", help="report only")
+    reconcile.add_argument("--tolerance", type=float, default=1e-6)
+    reconcile.set_defaults(handler=reconcile_summary)
+
+    profile = commands.add_parser(
+        "importtime", help="summarize python -X importtime for a module"
+    )
+    profile.add_argument("--module", default="backend.app")
+    profile.add_argument("--top", type=int, default=15)
+    profile.set_defaults(handler=importtime)
+
+    frontend = commands.add_parser(
+        "build-frontend", help="fingerprint and precompress frontend assets"
+    )
+    frontend.add_argument("--src", type=Path, default=static.FRONTEND_DIR)
+    frontend.add_argument("--out", type=Path, default=None, help="default: SRC/dist")
+    frontend.set_defaults(handler=build_frontend)
+
+    recompute = commands.add_parser(
+        "recompute-summary", help="recompute every tenant's stats on a process pool"
+    )
+    recompute.add_argument("--workers", type=int, default=0, help="0: one per CPU")
+    recompute.add_argument(
+        "--batch-size", type=int, default=200, help="tenants per task and transaction"
+    )
+    recompute.add_argument(
+        "--checkpoint", type=Path, default=None, help="resume from / record progress"
+    )
+    recompute.set_defaults(handler=recompute_summary)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
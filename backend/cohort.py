@@ -0,0 +1,175 @@
+"""Columnar stats for a whole cohort at once.
+
+A :class:`Cohort` holds one row per student (gradebook) and one column per
+assessment slot: ``weights`` (0 for padding) and ``scores`` (NaN when
+ungraded or padding). Every result is an array over students and matches
+:mod:`backend.calculations` exactly, float for float:
+
+- totals are accumulated column by column, in row order, the same
+  left-to-right additions ``calculations.totals`` makes (padding adds 0.0);
+  NumPy's pairwise ``sum`` would round differently;
+- rounding to 2 decimals reproduces Python's ``round``: ``np.round`` agrees
+  except next to a tie, and only those few values are rounded in Python.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, NamedTuple, Sequence
+
+import numpy as np
+
+from .calculations import AssessmentScore
+from .instrumentation import timed
+
+# |x * 100 - (k + 0.5)| below this may round differently in NumPy and Python
+_TIE_TOLERANCE = 1e-6
+
+
+class CohortTotals(NamedTuple):
+    total_weight: np.ndarray
+    weight_done: np.ndarray
+    weighted_sum: np.ndarray
+
+
+class CohortStats(NamedTuple):
+    """``calculations.CurrentStats`` per student."""
+
+    current_weighted: np.ndarray
+    weight_done: np.ndarray
+    remaining_weight: np.ndarray
+
+
+class CohortWhatIf(NamedTuple):
+    """``calculations.WhatIf`` per student; ``required_avg`` is NaN for None."""
+
+    target: float
+    required_avg: np.ndarray
+    attainable: np.ndarray
+
+
+def round2(values: np.ndarray) -> np.ndarray:
+    """Element-wise ``round(value, 2)`` with Python's exact semantics."""
+    values = np.asarray(values, dtype=np.float64)
+    rounded = np.round(values, 2)
+    scaled = values * 100.0
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < _TIE_TOLERANCE
+    for i in np.flatnonzero(near_tie):
+        rounded.flat[i] = round(float(values.flat[i]), 2)
+    return rounded
+
+
+class Cohort:
+    """Weights and scores of ``len(keys)`` students, padded to one width."""
+
+    def __init__(
+        self, weights: np.ndarray, scores: np.ndarray, keys: Sequence | None = None
+    ) -> None:
+        weights = np.asarray(weights, dtype=np.float64)
+        scores = np.asarray(scores, dtype=np.float64)
+        if weights.ndim != 2 or weights.shape != scores.shape:
+            raise ValueError("weights and scores must be 2-D arrays of one shape")
+        self.weights = weights
+        self.scores = scores
+        self.keys = list(range(len(weights))) if keys is None else list(keys)
+        if len(self.keys) != len(weights):
+            raise ValueError("one key per student row is required")
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    @classmethod
+    def from_rows(
+        cls,
+        students: Iterable[Iterable[AssessmentScore]],
+        keys: Sequence | None = None,
+    ) -> "Cohort":
+        """Build from one iterable of assessment rows per student."""
+        grouped = [
+            [(float(r.weight_pct), getattr(r, "score_pct", None)) for r in rows]
+            for rows in students
+        ]
+        width = max((len(rows) for rows in grouped), default=0)
+        weights = np.zeros((len(grouped), width))
+        scores = np.full((len(grouped), width), np.nan)
+        for i, rows in enumerate(grouped):
+            for j, (weight, score) in enumerate(rows):
+                weights[i, j] = weight
+                if score is not None:
+                    scores[i, j] = score
+        return cls(weights, scores, keys)
+
+    @classmethod
+    def from_columns(
+        cls, student_keys: np.ndarray, weights: np.ndarray, scores: np.ndarray
+    ) -> "Cohort":
+        """Build from flat columns, one entry per assessment row.
+
+        Rows must be grouped by ``student_keys`` (e.g. ``ORDER BY course_id,
+        id``); order within a student is the order its totals add up in.
+        ``scores`` holds None or NaN for ungraded rows.
+        """
+        student_keys = np.asarray(student_keys)
+        weights = np.asarray(weights, dtype=np.float64)
+        scores = np.asarray(scores, dtype=np.float64)  # None becomes NaN
+        if len(student_keys) == 0:
+            return cls(np.zeros((0, 0)), np.zeros((0, 0)), [])
+        starts = np.flatnonzero(
+            np.concatenate(([True], student_keys[1:] != student_keys[:-1]))
+        )
+        counts = np.diff(np.append(starts, len(student_keys)))
+        student = np.repeat(np.arange(len(starts)), counts)
+        slot = np.arange(len(student_keys)) - np.repeat(starts, counts)
+        shape = (len(starts), int(counts.max()))
+        padded_weights = np.zeros(shape)
+        padded_scores = np.full(shape, np.nan)
+        padded_weights[student, slot] = weights
+        padded_scores[student, slot] = scores
+        return cls(padded_weights, padded_scores, student_keys[starts].tolist())
+
+    @timed("calc", "cohort.totals")
+    def totals(self) -> CohortTotals:
+        """``calculations.totals`` for every student, one column at a time."""
+        n = len(self.weights)
+        total = np.zeros(n)
+        done = np.zeros(n)
+        weighted = np.zeros(n)
+        for weight, score in zip(self.weights.T, self.scores.T):
+            graded = ~np.isnan(score)
+            total += weight
+            done += np.where(graded, weight, 0.0)
+            weighted += np.where(graded, weight * score, 0.0)
+        return CohortTotals(total, done, weighted)
+
+    @timed("calc", "cohort.current_stats")
+    def current_stats(self, agg: CohortTotals | None = None) -> CohortStats:
+        if agg is None:
+            agg = self.totals()
+        current = np.where(agg.weight_done > 0, agg.weighted_sum / 100.0, 0.0)
+        remaining = np.maximum(0.0, 100.0 - agg.weight_done)
+        return CohortStats(round2(current), round2(agg.weight_done), round2(remaining))
+
+    @timed("calc", "cohort.what_if")
+    def what_if(self, target: float, stats: CohortStats | None = None) -> CohortWhatIf:
+        """Required average on the remaining weight, as ``calculations.what_if``."""
+        if stats is None:
+            stats = self.current_stats()
+        remaining = stats.remaining_weight
+        open_ = remaining != 0
+        # Nothing left to grade: divide by 1, then report required_avg as NaN
+        divisor = np.where(open_, remaining, 1.0)
+        required = (target - stats.current_weighted) * 100.0 / divisor
+        attainable = np.where(
+            open_,
+            (required >= 0) & (required <= 100),
+            stats.current_weighted >= target,
+        )
+        required_avg = np.where(open_, round2(required), np.nan)
+        return CohortWhatIf(target, required_avg, attainable)
+
+
+def percentiles(values: np.ndarray, qs: Sequence[float]) -> dict[float, float]:
+    """Linear-interpolated percentiles of ``values``, ignoring NaN."""
+    values = np.asarray(values, dtype=np.float64)
+    if not np.any(~np.isnan(values)):
+        return {q: float("nan") for q in qs}
+    return dict(zip(qs, np.nanpercentile(values, qs).tolist()))
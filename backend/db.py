@@ -1,37 +1,265 @@
-import os
-from sqlalchemy import create_engine
+import threading
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy.engine.url import make_url
+from sqlalchemy.engine.url import URL, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from .metrics import multiprocess_enabled
+from .settings import Settings, get_settings
+
+try:
+    from prometheus_client import Gauge, Histogram
+
+    _POOL_CHECKOUT_SECONDS = Histogram(
+        "gradeapp_db_pool_checkout_seconds",
+        "Time spent waiting for a pooled database connection",
+        buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+    )
+    # livesum: with several workers, the scrape adds up the live processes
+    _POOL_CHECKED_OUT = Gauge(
+        "gradeapp_db_pool_checked_out",
+        "Connections currently checked out",
+        multiprocess_mode="livesum",
+    )
+    _POOL_SIZE = Gauge(
+        "gradeapp_db_pool_size", "Configured pool size", multiprocess_mode="livesum"
+    )
+    _POOL_OVERFLOW = Gauge(
+        "gradeapp_db_pool_overflow",
+        "Connections opened beyond the pool size",
+        multiprocess_mode="livesum",
+    )
+except ImportError:  # monitoring is optional
+    _POOL_CHECKOUT_SECONDS = None
+    _POOL_CHECKED_OUT = _POOL_SIZE = _POOL_OVERFLOW = None
+
+
+def normalize_url(raw_url: str) -> str:
+    """Map provider URLs (Railway hands out ``postgresql://``) to our driver."""
+    for prefix in ("postgres://", "postgresql://"):
+        if raw_url.startswith(prefix):
+            return "postgresql+psycopg2://" + raw_url[len(prefix) :]
+    return raw_url
 
 
-def _connect_args_from_url(db_url: str) -> dict:
+def _is_sqlite(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite"
+
+
+def _is_memory_sqlite(url: URL) -> bool:
+    return _is_sqlite(url) and url.database in (None, "", ":memory:")
+
+
+def _connect_args_from_url(db_url: str, app_settings: Settings | None = None) -> dict:
     """Detect correct connect_args based on backend."""
+    app_settings = app_settings or get_settings()
     url = make_url(db_url)
 
     # SQLite requires this for FastAPI multithreading
     if url.get_backend_name() == "sqlite":
         return {"check_same_thread": False}
 
-    # Postgres / MySQL / others do not need connect_args
+    timeout_ms = app_settings.db_statement_timeout_ms
+    if url.get_backend_name() == "postgresql" and timeout_ms > 0:
+        if url.get_driver_name() == "asyncpg":
+            return {"server_settings": {"statement_timeout": str(timeout_ms)}}
+        return {"options": f"-c statement_timeout={timeout_ms}"}
+
+    # Postgres without timeouts / MySQL / others do not need connect_args
     return {}
 
 
-# Load DATABASE_URL safely
-raw_url = os.getenv("DATABASE_URL")
+class _TimedPoolMixin:
+    """Records how long each checkout waits, for sizing pools and workers."""
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            if _POOL_CHECKOUT_SECONDS is not None:
+                _POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - started)
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(
+    db_url: str, app_settings: Settings | None = None, is_async: bool = False
+) -> dict:
+    """Keyword arguments for ``create_engine`` / ``create_async_engine``."""
+    app_settings = app_settings or get_settings()
+    url = make_url(db_url)
+    options: dict = {
+        "connect_args": _connect_args_from_url(db_url, app_settings),
+        "pool_pre_ping": app_settings.db_pool_pre_ping,
+    }
+    if _is_memory_sqlite(url):
+        # A single shared connection; queue-pool sizing does not apply
+        return options
+    options.update(
+        poolclass=TimedAsyncQueuePool if is_async else TimedQueuePool,
+        pool_size=app_settings.db_pool_size,
+        max_overflow=app_settings.db_max_overflow,
+        pool_timeout=app_settings.db_pool_timeout,
+        pool_recycle=app_settings.db_pool_recycle,
+    )
+    return options
+
+
+def _install_sqlite_pragmas(target: Engine, url: URL, app_settings: Settings) -> None:
+    pragmas = [
+        f"PRAGMA busy_timeout = {int(app_settings.sqlite_busy_timeout_ms)}",
+        f"PRAGMA synchronous = {app_settings.sqlite_synchronous}",
+    ]
+    if app_settings.sqlite_wal and not _is_memory_sqlite(url):
+        pragmas.insert(0, "PRAGMA journal_mode = WAL")
+
+    @event.listens_for(target, "connect")
+    def _set_pragmas(dbapi_connection, _record) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+def _export_pool_gauges(target: Engine) -> None:
+    """Pool gauges are read at scrape time, not on every checkout.
 
-if raw_url:
-    # Railway provides postgresql:// which needs to be adapted
-    DATABASE_URL = raw_url.replace("postgresql://", "postgresql+psycopg2binary://")
-else:
-    # Fallback: used in GitHub Actions tests
-    DATABASE_URL = "sqlite:///./test.db"
+    Multiprocess mode only exports values written to its files, so there the
+    gauges are set on checkout/checkin instead (one mmap write each). Both
+    read ``target.pool`` each time: ``dispose()`` swaps in a new pool.
+    """
+    if _POOL_CHECKED_OUT is None or not isinstance(target.pool, QueuePool):
+        return
+    if not multiprocess_enabled():
+        _POOL_CHECKED_OUT.set_function(lambda: target.pool.checkedout())
+        _POOL_SIZE.set_function(lambda: target.pool.size())
+        _POOL_OVERFLOW.set_function(lambda: max(0, target.pool.overflow()))
+        return
 
+    _POOL_SIZE.set(target.pool.size())
 
-# Create engine with proper connect args
-engine = create_engine(DATABASE_URL, connect_args=_connect_args_from_url(DATABASE_URL))
+    def _update(*_args) -> None:
+        _POOL_CHECKED_OUT.set(target.pool.checkedout())
+        _POOL_OVERFLOW.set(max(0, target.pool.overflow()))
+
+    event.listen(target.pool, "checkout", _update)
+    event.listen(target.pool, "checkin", _update)
+
+
+def build_engine(app_settings: Settings | None = None) -> Engine:
+    app_settings = app_settings or get_settings()
+    db_url = normalize_url(app_settings.database_url)
+    new_engine = create_engine(db_url, **engine_options(db_url, app_settings))
+    if _is_sqlite(new_engine.url):
+        _install_sqlite_pragmas(new_engine, new_engine.url, app_settings)
+    _export_pool_gauges(new_engine)
+    return new_engine
+
+
+# The engine and session factory are built on first use, not at import:
+# importing models or the CLI never opens a pool or reads the environment
+_engine: Engine | None = None
+_session_factory: sessionmaker | None = None
+_init_lock = threading.Lock()  # sync routes may race to build them
+
+
+def get_engine() -> Engine:
+    """The app's engine, with pool and pragma settings from Settings."""
+    global _engine
+    if _engine is None:
+        with _init_lock:
+            if _engine is None:
+                _engine = build_engine(get_settings())
+    return _engine
+
+
+def get_sessionmaker() -> sessionmaker:
+    global _session_factory
+    if _session_factory is None:
+        bind = get_engine()
+        with _init_lock:
+            if _session_factory is None:
+                _session_factory = sessionmaker(
+                    autocommit=False, autoflush=False, bind=bind
+                )
+    return _session_factory
+
+
+def __getattr__(name: str):
+    # Former import-time globals, kept importable
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_sessionmaker()
+    if name == "DATABASE_URL":
+        return normalize_url(get_settings().database_url)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Base class for models
 Base = declarative_base()
+
+
+def after_fork() -> None:
+    """Reset state a forked worker must not share with its parent.
+
+    Drops inherited pooled connections without closing them (they belong to
+    the parent) and writes this process's own pool-size gauge.
+    """
+    if _engine is None:
+        return
+    _engine.dispose(close=False)
+    if _POOL_SIZE is not None and multiprocess_enabled():
+        if isinstance(_engine.pool, QueuePool):
+            _POOL_SIZE.set(_engine.pool.size())
+
+
+# -----------------------------
+# Optional async stack
+# -----------------------------
+_ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def async_url(db_url: str) -> str:
+    """Swap the sync driver of ``db_url`` for its asyncio counterpart."""
+    url = make_url(normalize_url(db_url))
+    driver = _ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver configured for {url.get_backend_name()!r}")
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+_async_session_factory = None
+
+
+def get_async_sessionmaker():
+    """Create the async engine on first use.
+
+    Importing this module never requires greenlet, aiosqlite or asyncpg; only
+    apps started with ``async_db`` enabled do.
+    """
+    global _async_session_factory
+    if _async_session_factory is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        app_settings = get_settings()
+        db_url = async_url(app_settings.database_url)
+        async_engine = create_async_engine(
+            db_url, **engine_options(db_url, app_settings, is_async=True)
+        )
+        if _is_sqlite(async_engine.url):
+            _install_sqlite_pragmas(
+                async_engine.sync_engine, async_engine.url, app_settings
+            )
+        _async_session_factory = async_sessionmaker(async_engine, expire_on_commit=False)
+    return _async_session_factory
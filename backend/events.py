@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, Callable, Hashable
+
+from .services import TenantSummary
+
+# Ends a subscriber's stream (sent after it fell too far behind)
+_CLOSED = None
+
+
+class StatsBroadcaster:
+    """In-process fan-out of per-tenant stats to Server-Sent Events streams.
+
+    A subscriber is one bounded ``asyncio.Queue``; an idle connection costs no
+    thread and no timer beyond its keep-alive. Writers :meth:`publish` from any
+    thread. Within ``coalesce_s`` only the newest version per tenant is kept,
+    encoded once and offered to every queue; a subscriber whose queue is full
+    is dropped rather than allowed to hold back the others or grow memory.
+    Events only reach subscribers of the same worker process.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[TenantSummary], bytes],
+        queue_size: int = 16,
+        coalesce_s: float = 0.05,
+        keepalive_s: float = 15.0,
+    ) -> None:
+        self.queue_size = queue_size
+        self.coalesce_s = coalesce_s
+        self.keepalive_s = keepalive_s
+        self.dropped = 0
+        self._encode = encode
+        self._subscribers: dict[Hashable, set[asyncio.Queue]] = {}
+        self._pending: dict[Hashable, TenantSummary] = {}
+        self._sent_version: dict[Hashable, int] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def watching(self, key: Hashable) -> bool:
+        """Cheap check writers use to skip building a payload nobody reads."""
+        return bool(self._subscribers.get(key))
+
+    def subscribe(self, key: Hashable) -> asyncio.Queue:
+        """Register a queue for ``key``; must run on the serving event loop."""
+        self._loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        self._subscribers.setdefault(key, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, key: Hashable, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(key)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[key]
+                self._sent_version.pop(key, None)
+
+    def publish(self, key: Hashable, summary: TenantSummary) -> None:
+        """Schedule ``summary`` for ``key``'s subscribers; safe from any thread."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._stage(key, summary)
+        else:
+            loop.call_soon_threadsafe(self._stage, key, summary)
+
+    def _stage(self, key: Hashable, summary: TenantSummary) -> None:
+        pending = self._pending.get(key)
+        if pending is None:
+            self._loop.call_later(self.coalesce_s, self._flush, key)
+        elif pending.version >= summary.version:
+            return  # a newer write already arrived (threads can finish out of order)
+        self._pending[key] = summary
+
+    def _flush(self, key: Hashable) -> None:
+        summary = self._pending.pop(key, None)
+        queues = self._subscribers.get(key)
+        if summary is None or not queues:
+            return
+        if summary.version <= self._sent_version.get(key, -1):
+            return
+        self._sent_version[key] = summary.version
+        frame = self._encode(summary)
+        for queue in list(queues):
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                self._drop(key, queue)
+
+    def _drop(self, key: Hashable, queue: asyncio.Queue) -> None:
+        self.unsubscribe(key, queue)
+        self.dropped += 1
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(_CLOSED)
+
+    async def stream(
+        self, key: Hashable, queue: asyncio.Queue, first: bytes
+    ) -> AsyncIterator[bytes]:
+        """Yield ``first`` and then every frame for ``queue`` until dropped.
+
+        Comment lines keep idle connections (and their proxies) alive and let
+        the server notice clients that went away.
+        """
+        try:
+            yield first
+            while True:
+                try:
+                    frame = await asyncio.wait_for(queue.get(), self.keepalive_s)
+                except asyncio.TimeoutError:
+                    yield b": keep-alive\n\n"
+                    continue
+                if frame is _CLOSED:
+                    return
+                yield frame
+        finally:
+            self.unsubscribe(key, queue)
@@ -0,0 +1,42 @@
+import csv
+import io
+import json
+from typing import Iterable, Iterator, Literal, Sequence
+
+from .services import PROJECTABLE_FIELDS
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _ndjson(batches: Iterable[Sequence]) -> Iterator[bytes]:
+    for batch in batches:
+        lines = []
+        for row in batch:
+            record = dict(zip(PROJECTABLE_FIELDS, row))
+            record["due_date"] = record["due_date"].isoformat()
+            lines.append(json.dumps(record))
+        yield ("\n".join(lines) + "\n").encode()
+
+
+def _csv(batches: Iterable[Sequence]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(PROJECTABLE_FIELDS)
+    for batch in batches:
+        writer.writerows(batch)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    # header only when there were no rows
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def encode(fmt: ExportFormat, batches: Iterable[Sequence]) -> Iterator[bytes]:
+    """Encode row batches lazily, one chunk per batch."""
+    return _csv(batches) if fmt == "csv" else _ndjson(batches)
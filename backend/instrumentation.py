@@ -0,0 +1,211 @@
+"""Per-endpoint query and timing metrics, plus an optional Server-Timing header.
+
+:class:`RequestMetricsMiddleware` opens a :class:`RequestTimings` for every
+HTTP request. SQLAlchemy cursor events and :func:`timed` functions add to it
+through a context variable; the context is copied into threadpool workers,
+so sync routes are covered too. Histograms are observed once per request,
+labelled by the route template (``/courses/{course_id}/stats/what-if``,
+never the raw path), so cardinality stays bounded.
+
+Outside a request (CLI, benchmarks, tests calling services directly) every
+hook costs a single context-variable lookup.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+try:
+    from prometheus_client import Histogram
+
+    _QUERIES_PER_REQUEST = Histogram(
+        "gradeapp_db_queries_per_request",
+        "SQL statements executed while serving one request",
+        ["endpoint"],
+        buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100),
+    )
+    _QUERY_SECONDS = Histogram(
+        "gradeapp_db_query_seconds",
+        "Duration of individual SQL statements",
+        ["endpoint"],
+        buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+    )
+    _FUNCTION_SECONDS = Histogram(
+        "gradeapp_function_seconds",
+        "Time spent in instrumented calculations and service methods",
+        ["endpoint", "function"],
+        buckets=(0.00001, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0),
+    )
+except ImportError:  # monitoring is optional
+    _QUERIES_PER_REQUEST = _QUERY_SECONDS = _FUNCTION_SECONDS = None
+
+UNMATCHED_ENDPOINT = "other"  # static files, 404s: one label, not one per path
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class RequestTimings:
+    """What one request spent in SQL, calculations and the service layer."""
+
+    __slots__ = ("queries", "query_seconds", "functions", "totals", "_depth")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.query_seconds: list[float] = []
+        self.functions: list[tuple[str, float]] = []
+        # Outermost time per category, so nested timed calls are not summed twice
+        self.totals: dict[str, float] = {}
+        self._depth: dict[str, int] = {}
+
+    def server_timing(self) -> str:
+        entries = [
+            f'db;dur={sum(self.query_seconds) * 1000:.2f};desc="{self.queries} queries"'
+        ]
+        entries += [
+            f"{category};dur={seconds * 1000:.2f}"
+            for category, seconds in self.totals.items()
+        ]
+        return ", ".join(entries)
+
+    def observe(self, endpoint: str) -> None:
+        if _QUERIES_PER_REQUEST is None:
+            return
+        _QUERIES_PER_REQUEST.labels(endpoint).observe(self.queries)
+        query_seconds = _QUERY_SECONDS.labels(endpoint)
+        for seconds in self.query_seconds:
+            query_seconds.observe(seconds)
+        for name, seconds in self.functions:
+            _FUNCTION_SECONDS.labels(endpoint, name).observe(seconds)
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def current() -> RequestTimings | None:
+    return _current.get()
+
+
+# -----------------------------
+# SQLAlchemy hooks (every engine, sync and async)
+# -----------------------------
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timings = _current.get()
+    started = conn.info.get("query_started")
+    if timings is None or not started:
+        return
+    timings.queries += 1
+    timings.query_seconds.append(time.perf_counter() - started.pop())
+
+
+# -----------------------------
+# Function timing
+# -----------------------------
+def _record(timings: RequestTimings, category: str, name: str, started: float) -> None:
+    elapsed = time.perf_counter() - started
+    timings.functions.append((name, elapsed))
+    depth = timings._depth[category] - 1
+    timings._depth[category] = depth
+    if depth == 0:
+        timings.totals[category] = timings.totals.get(category, 0.0) + elapsed
+
+
+def timed(category: str, name: str | None = None) -> Callable[[F], F]:
+    """Record the wrapped function's duration on the current request.
+
+    ``category`` groups functions in the Server-Timing header (``calc``,
+    ``service``); the histogram label is ``name`` (default: qualified name).
+    """
+
+    def decorate(fn: F) -> F:
+        label = name or f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__qualname__}"
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                timings = _current.get()
+                if timings is None:
+                    return await fn(*args, **kwargs)
+                timings._depth[category] = timings._depth.get(category, 0) + 1
+                started = time.perf_counter()
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    _record(timings, category, label, started)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            timings = _current.get()
+            if timings is None:
+                return fn(*args, **kwargs)
+            timings._depth[category] = timings._depth.get(category, 0) + 1
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _record(timings, category, label, started)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def timed_methods(category: str) -> Callable[[type], type]:
+    """Class decorator applying :func:`timed` to every public method."""
+
+    def decorate(cls: type) -> type:
+        for attr, value in list(vars(cls).items()):
+            if not attr.startswith("_") and inspect.isfunction(value):
+                setattr(cls, attr, timed(category, f"{cls.__name__}.{attr}")(value))
+        return cls
+
+    return decorate
+
+
+# -----------------------------
+# ASGI middleware
+# -----------------------------
+class RequestMetricsMiddleware:
+    """Pure ASGI middleware: no per-request task or body buffering."""
+
+    def __init__(self, app, server_timing: bool = False) -> None:
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current.set(timings)
+
+        async def send_with_header(message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timings.server_timing().encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_header if self.server_timing else send)
+        finally:
+            _current.reset(token)
+            route = scope.get("route")
+            timings.observe(getattr(route, "path", None) or UNMATCHED_ENDPOINT)
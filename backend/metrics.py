@@ -0,0 +1,74 @@
+"""The app's single ``/metrics`` endpoint.
+
+With ``PROMETHEUS_MULTIPROC_DIR`` set (several uvicorn/gunicorn workers),
+prometheus_client writes every sample to per-process files in that directory
+and a scrape merges all of them; otherwise the in-process default registry is
+served. The directory must exist and be emptied before the workers start.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        REGISTRY,
+        CollectorRegistry,
+        generate_latest,
+        multiprocess,
+    )
+except ImportError:  # monitoring is optional
+    generate_latest = None
+
+MULTIPROC_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def available() -> bool:
+    return generate_latest is not None
+
+
+def multiprocess_enabled() -> bool:
+    return bool(os.environ.get(MULTIPROC_ENV))
+
+
+def _registry():
+    if multiprocess_enabled():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+def _render() -> bytes:
+    return generate_latest(_registry())
+
+
+class MetricsEndpoint:
+    """Renders the exposition text in a worker thread, never on the event loop.
+
+    Scrapes that arrive while a render is running share its result instead of
+    serializing the registry again; ``ttl_s`` additionally reuses a finished
+    render for that long (useful with several scrapers).
+    """
+
+    def __init__(self, ttl_s: float = 0.0) -> None:
+        self.ttl_s = ttl_s
+        self._body = b""
+        self._rendered_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    async def scrape(self, request: Request) -> Response:
+        arrived = time.monotonic()
+        async with self._lock:
+            # A render that finished after this scrape arrived was running
+            # while it waited for the lock: reuse it
+            if self._rendered_at < arrived - self.ttl_s:
+                self._body = await run_in_threadpool(_render)
+                self._rendered_at = time.monotonic()
+        return Response(self._body, media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,89 @@
+"""Bring an existing database up to the current schema.
+
+    python -m backend.cli migrate
+
+``create_all`` only creates missing tables; it never alters one that exists,
+so a database created before per-course gradebooks lacks
+``assessments.course_id`` and every query on it fails. :func:`upgrade` runs
+``create_all`` and then the in-place steps it cannot do, each one skipped
+when already applied, so it is safe on every startup:
+
+- add ``assessments.course_id`` (existing rows stay in the default gradebook);
+- create the models' indexes missing from existing tables and drop the ones
+  they superseded;
+- store a ``grade_summary`` row, version 0, for every gradebook that has
+  assessments but no row yet, in one ``INSERT ... SELECT``.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Connection, Engine, case, func, inspect, insert, select, text
+
+from . import models
+
+# Indexes replaced by a model index that covers the same queries
+SUPERSEDED_INDEXES = {"assessments": ["ix_assessments_due_date_id"]}
+
+
+def _add_course_id(conn: Connection) -> bool:
+    columns = {c["name"] for c in inspect(conn).get_columns("assessments")}
+    if "course_id" in columns:
+        return False
+    conn.execute(
+        text(
+            "ALTER TABLE assessments ADD COLUMN course_id INTEGER "
+            "REFERENCES courses (id) ON DELETE CASCADE"
+        )
+    )
+    return True
+
+
+def _sync_indexes(conn: Connection) -> list[str]:
+    inspector = inspect(conn)
+    applied = []
+    for table in models.Base.metadata.sorted_tables:
+        existing = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(conn)
+                applied.append(f"created index {index.name}")
+        for name in SUPERSEDED_INDEXES.get(table.name, []):
+            if name in existing:
+                conn.execute(text(f"DROP INDEX {name}"))
+                applied.append(f"dropped index {name}")
+    return applied
+
+
+def _backfill_summaries(conn: Connection) -> int:
+    table = models.Assessment
+    summary = models.GradeSummary
+    scope = func.coalesce(table.course_id, models.DEFAULT_SCOPE_ID)
+    weight, score = table.weight_pct, table.score_pct
+    graded = score.is_not(None)
+    missing = (
+        select(
+            scope,
+            func.sum(weight),
+            func.sum(case((graded, weight), else_=0.0)),
+            func.coalesce(func.sum(weight * score), 0.0),
+            0,
+        )
+        .where(scope.not_in(select(summary.scope_id)))
+        .group_by(scope)
+    )
+    columns = ["scope_id", "total_weight", "weight_done", "weighted_sum", "version"]
+    return conn.execute(insert(summary).from_select(columns, missing)).rowcount
+
+
+def upgrade(engine: Engine) -> list[str]:
+    """Apply every missing step; returns what was done (empty when current)."""
+    models.Base.metadata.create_all(bind=engine)
+    applied = []
+    with engine.begin() as conn:
+        if _add_course_id(conn):
+            applied.append("added assessments.course_id")
+        applied += _sync_indexes(conn)
+        backfilled = _backfill_summaries(conn)
+        if backfilled:
+            applied.append(f"backfilled {backfilled} grade_summary rows")
+    return applied
@@ -1,17 +1,61 @@
 from sqlalchemy.orm import declarative_base
-from sqlalchemy import Column, Integer, String, Float, Date
+from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey, Index
 
 Base = declarative_base()
 
+# grade_summary key for the default gradebook (assessments with no course)
+DEFAULT_SCOPE_ID = 0
+
+
+class Student(Base):
+    __tablename__ = "students"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+
+
+class Course(Base):
+    """One student's gradebook for one course; the tenant for assessments."""
+
+    __tablename__ = "courses"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    student_id = Column(
+        Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=True, index=True
+    )
+
 
 class Assessment(Base):
     __tablename__ = "assessments"
 
     id = Column(Integer, primary_key=True, index=True)
+    # NULL = the default, unscoped gradebook served by the top-level routes
+    course_id = Column(
+        Integer, ForeignKey("courses.id", ondelete="CASCADE"), nullable=True
+    )
     title = Column(String, nullable=False)
     weight_pct = Column(Float, nullable=False)  # e.g., 20.0
     due_date = Column(Date, nullable=False)
     score_pct = Column(Float, nullable=True)  # None until graded
 
+    # Per-tenant reads filter on course_id and keyset-paginate on (due_date, id)
+    __table_args__ = (
+        Index("ix_assessments_course_due_date", "course_id", "due_date", "id"),
+    )
+
+
+class GradeSummary(Base):
+    """Per-tenant running aggregates, maintained by delta on every write."""
+
+    __tablename__ = "grade_summary"
+
+    scope_id = Column(Integer, primary_key=True)  # course id or DEFAULT_SCOPE_ID
+    total_weight = Column(Float, nullable=False, default=0.0)
+    weight_done = Column(Float, nullable=False, default=0.0)
+    weighted_sum = Column(Float, nullable=False, default=0.0)
+    # Bumped by every write; clients revalidate against it through ETags
+    version = Column(Integer, nullable=False, default=0)
+
 
 # 10452
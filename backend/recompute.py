@@ -0,0 +1,200 @@
+"""Recompute every tenant's stats on a process pool.
+
+    python -m backend.cli recompute-summary --workers 4 --checkpoint recompute.json
+
+Tenants are split into batches of ``batch_size`` and handed to worker
+processes. Each worker opens its own engine, streams a tenant's assessments
+through :func:`calculations.totals`, the row-by-row calculation, and
+writes the batch's ``grade_summary`` rows in one transaction. The
+``/stats`` endpoints derive ``CurrentStats`` and ``Validation`` from those
+rows, so this is what they serve next; every rewritten row gets a new version
+(clients' ETags go stale).
+
+A row is only overwritten if its version has not moved since it was read
+before streaming (:meth:`~services.AssessmentRepository.replace_summary`);
+when an API write landed in between, that tenant is recomputed in a further
+transaction, so the job can run while the API takes writes. An API process that keeps a stats cache
+is not told, though, and serves its cached totals until restarted.
+
+Finished batches are recorded in the checkpoint file, so an interrupted job
+resumes where it stopped; the file is removed once every tenant is done.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Iterable, NamedTuple
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from . import calculations, services
+from .db import build_engine
+from .settings import Settings, get_settings
+from .workers import worker_count
+
+
+class BatchResult(NamedTuple):
+    course_ids: list[int | None]
+    rows: int
+    invalid_weights: int  # tenants whose weights do not sum to 100%
+
+
+class Progress(NamedTuple):
+    done: int
+    total: int
+    rows: int
+    invalid_weights: int
+    elapsed_s: float
+    resumed: int = 0  # tenants already done in the checkpoint
+
+    @property
+    def rate(self) -> float:
+        """Tenants per second in this run."""
+        if self.elapsed_s <= 0:
+            return 0.0
+        return (self.done - self.resumed) / self.elapsed_s
+
+    @property
+    def eta_s(self) -> float | None:
+        return (self.total - self.done) / self.rate if self.rate else None
+
+
+# -----------------------------
+# Worker side
+# -----------------------------
+_worker_sessions: sessionmaker | None = None
+
+
+def _init_worker(app_settings: Settings) -> None:
+    """Give each process its own engine; pools must not cross a fork."""
+    global _worker_sessions
+    _worker_sessions = sessionmaker(bind=build_engine(app_settings), autoflush=False)
+
+
+def tenant_totals(
+    repository: services.AssessmentRepository, stream_batch: int
+) -> tuple[calculations.WeightTotals, int]:
+    """Totals of one tenant from its streamed rows, and how many rows it has."""
+    seen = 0
+
+    def rows():
+        nonlocal seen
+        for batch in repository.stream(stream_batch):
+            seen += len(batch)
+            yield from batch
+
+    return calculations.totals(rows()), seen
+
+
+def recompute_batch(
+    session: Session, course_ids: list[int | None], stream_batch: int = 1000
+) -> BatchResult:
+    """Recompute and store ``course_ids``' summaries in one transaction.
+
+    Tenants an API write reached in the meantime are recomputed in a new
+    transaction after the others are committed: re-reading in the same one
+    may see its old snapshot again (Postgres REPEATABLE READ, an explicit
+    ``BEGIN`` on SQLite), so the retry would loop or fail to serialize.
+    """
+    rows = invalid = 0
+    pending = list(course_ids)
+    while pending:
+        computed = []
+        for course_id in pending:
+            repository = services.AssessmentRepository(session, course_id)
+            read = repository.stored_summary()
+            agg, seen = tenant_totals(repository, stream_batch)
+            computed.append((repository, read, agg, seen))
+        pending = []
+        for repository, read, agg, seen in computed:
+            if not repository.replace_summary(agg, read):
+                pending.append(repository.course_id)
+                continue
+            rows += seen
+            valid = calculations.validate_weights_from_totals(agg).is_exactly_100
+            invalid += not valid
+        session.commit()
+    return BatchResult(course_ids, rows, invalid)
+
+
+def _run_batch(course_ids: list[int | None], stream_batch: int) -> BatchResult:
+    with _worker_sessions() as session:
+        return recompute_batch(session, course_ids, stream_batch)
+
+
+# -----------------------------
+# Checkpoints
+# -----------------------------
+def load_checkpoint(path: Path) -> set[int | None]:
+    if not path.exists():
+        return set()
+    return set(json.loads(path.read_text())["done"])
+
+
+def save_checkpoint(path: Path, done: Iterable[int | None]) -> None:
+    """Write atomically: a crash mid-write leaves the previous checkpoint."""
+    ordered = sorted(done, key=lambda cid: -1 if cid is None else cid)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps({"done": ordered}))
+    os.replace(tmp, path)
+
+
+# -----------------------------
+# Driver
+# -----------------------------
+def recompute_summaries(
+    app_settings: Settings | None = None,
+    workers: int = 0,
+    batch_size: int = 200,
+    stream_batch: int = 1000,
+    checkpoint: Path | None = None,
+    progress: Callable[[Progress], None] | None = None,
+) -> Progress:
+    """Recompute every tenant's summary; ``workers=0`` uses one per CPU."""
+    app_settings = app_settings or get_settings()
+    workers = worker_count(workers)
+
+    engine = build_engine(app_settings)
+    with Session(engine) as session:
+        tenants = services.CourseRepository(session).scopes()
+    engine.dispose()  # before forking workers
+
+    done = load_checkpoint(checkpoint) if checkpoint else set()
+    pending = [cid for cid in tenants if cid not in done]
+    batches = [pending[i : i + batch_size] for i in range(0, len(pending), batch_size)]
+
+    started = time.perf_counter()
+    resumed = len(tenants) - len(pending)
+    status = Progress(resumed, len(tenants), 0, 0, 0.0, resumed)
+    pool = ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(app_settings,)
+    )
+    try:
+        running = {pool.submit(_run_batch, batch, stream_batch) for batch in batches}
+        while running:
+            finished, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                result = future.result()
+                done.update(result.course_ids)
+                if checkpoint:
+                    save_checkpoint(checkpoint, done)
+                status = status._replace(
+                    done=status.done + len(result.course_ids),
+                    rows=status.rows + result.rows,
+                    invalid_weights=status.invalid_weights + result.invalid_weights,
+                    elapsed_s=time.perf_counter() - started,
+                )
+                if progress:
+                    progress(status)
+    except BaseException:
+        # Finished batches are checkpointed; drop the queued ones
+        pool.shutdown(wait=True, cancel_futures=True)
+        raise
+    pool.shutdown()
+    if checkpoint:
+        checkpoint.unlink(missing_ok=True)
+    return status
@@ -0,0 +1,20 @@
+from typing import Any
+
+from fastapi.responses import Response
+from pydantic_core import to_json
+
+
+class RawJSONResponse(Response):
+    """JSON response encoded by pydantic-core, bypassing the response model.
+
+    For routes that already hold trusted, plain data (dicts of column values
+    straight from the database): skipping per-row model validation is what
+    makes large lists cheap. Pre-encoded ``bytes`` are sent as they are.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return to_json(content)
@@ -1,6 +1,30 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import date
-from typing import Optional
+from typing import Literal, Optional
+
+# --------- Tenant (student / course) models ----------
+
+
+class StudentIn(BaseModel):
+    name: str
+
+
+class StudentOut(StudentIn):
+    id: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CourseIn(BaseModel):
+    name: str
+    student_id: Optional[int] = None
+
+
+class CourseOut(CourseIn):
+    id: int
+
+    model_config = ConfigDict(from_attributes=True)
+
 
 # --------- Assessment I/O models ----------
 
@@ -23,11 +47,14 @@ class AssessmentUpdate(BaseModel):
     score_pct: Optional[float] = Field(default=None, ge=0, le=100)
 
 
+class AssessmentBulkUpdate(AssessmentUpdate):
+    id: int
+
+
 class AssessmentOut(AssessmentBase):
     id: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # --------- Stats response models ----------
@@ -39,13 +66,94 @@ class CurrentStats(BaseModel):
     remaining_weight: float
 
 
+class StatsSnapshot(CurrentStats):
+    """``CurrentStats`` at one data version, for grade-over-time charts."""
+
+    version: int
+
+
 class WhatIf(BaseModel):
     target: float
     required_avg: Optional[float]  # None if no remaining work
     attainable: bool
 
 
+class SimulatedAssessment(BaseModel):
+    id: int
+    title: str
+    weight_pct: float
+    # Score needed here if every other remaining assessment lands on
+    # expected_score; None for a zero-weight assessment
+    required_score: Optional[float]
+
+
+class WhatIfSimulation(BaseModel):
+    """Monte Carlo answer to "how likely am I to reach ``target``"."""
+
+    target: float
+    probability: float
+    ci_low: float  # 95% (Wilson) interval of probability
+    ci_high: float
+    trials: int
+    stopped: Literal["exact", "converged", "budget", "max_trials"]
+    expected_score: float  # mean and spread of the fitted score distribution
+    score_sd: float
+    assessments: list[SimulatedAssessment]  # the ungraded ones, by due date
+
+
+class ScoreBounds(BaseModel):
+    id: int
+    min_score: float = Field(default=0.0, ge=0, le=100)
+    max_score: float = Field(default=100.0, ge=0, le=100)
+
+
+class AllocationRequest(BaseModel):
+    target: float
+    bounds: list[ScoreBounds] = Field(default_factory=list)
+
+
+class AllocatedScore(BaseModel):
+    id: int
+    title: str
+    weight_pct: float
+    score: float
+
+
+class Allocation(BaseModel):
+    """Least-effort scores on the ungraded assessments to reach ``target``."""
+
+    target: float
+    feasible: bool
+    grade: float  # final weighted grade with these scores
+    assessments: list[AllocatedScore]  # by due date
+
+
 class Validation(BaseModel):
     total_weight: float
     is_exactly_100: bool
     message: str
+
+
+class StatsEvent(BaseModel):
+    """Payload of one ``/stats/stream`` event."""
+
+    stats: CurrentStats
+    validation: Validation
+
+
+# --------- Bulk response models ----------
+
+
+class BulkItemResult(BaseModel):
+    index: int  # position in the request array
+    id: int
+    status: Literal["created", "updated", "deleted"]
+
+
+# --------- Dashboard response model ----------
+
+
+class Dashboard(BaseModel):
+    assessments: list[AssessmentOut]
+    stats: CurrentStats
+    validation: Validation
@@ -0,0 +1,191 @@
+"""Production entry point: a pre-forking uvicorn.
+
+    python -m backend.server [--workers N] [--host 0.0.0.0] [--port 8000]
+
+The parent creates or migrates the tables once, builds the app with :func:`create_app`
+and binds the listening socket; each worker is then forked from it, so the
+imports and the app are loaded once and shared copy-on-write instead of being
+rebuilt per worker. Workers use uvloop and httptools when installed
+(``uvicorn[standard]``) and fall back to asyncio and h11. A worker that dies
+is replaced; SIGTERM/SIGINT shut every worker down gracefully.
+
+With more than one worker, Prometheus samples go to ``PROMETHEUS_MULTIPROC_DIR``
+(a temporary directory unless set) and the in-process stats cache is turned
+off: another worker's write would not invalidate it. Other per-process state
+stays per worker too: ``/stats/stream`` subscribers only hear of the writes
+their own worker handled (the frontend refetches ``/dashboard`` after its
+writes for that reason) and ``/stats/history`` is the current version only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import os
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import traceback
+
+import uvicorn
+
+from .settings import Settings, get_settings
+from .workers import worker_count
+
+MULTIPROC_ENV = "PROMETHEUS_MULTIPROC_DIR"  # read by prometheus_client on import
+
+
+def event_loop() -> str:
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def http_protocol() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+def worker_settings(app_settings: Settings, workers: int) -> Settings:
+    """Settings the workers' app is built with.
+
+    The parent already created the tables, so workers skip the startup hook;
+    several workers cannot share the per-process stats cache.
+    """
+    update: dict = {"auto_create_tables": False}
+    if workers > 1:
+        update["stats_cache_size"] = 0
+    return app_settings.model_copy(update=update)
+
+
+def _bind(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+class Supervisor:
+    """Forks ``workers`` uvicorn servers sharing one listening socket."""
+
+    def __init__(self, config: uvicorn.Config, sock: socket.socket, workers: int):
+        self.config = config
+        self.sock = sock
+        self.workers = workers
+        self.children: set[int] = set()
+        self.stopping = False
+
+    def _spawn(self) -> None:
+        pid = os.fork()
+        if pid:
+            self.children.add(pid)
+            return
+        # Worker: uvicorn installs its own graceful-shutdown handlers
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        from .db import after_fork
+
+        after_fork()
+        code = 0
+        try:
+            uvicorn.Server(self.config).run(sockets=[self.sock])
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+        os._exit(code)
+
+    def _stop(self, signum, _frame) -> None:
+        self.stopping = True
+        for pid in self.children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def run(self) -> int:
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        _mark_dead(os.getpid())  # the parent serves nothing; drop its live gauges
+        for _ in range(self.workers):
+            self._spawn()
+        while self.children:
+            try:
+                pid, _status = os.wait()
+            except ChildProcessError:
+                break
+            except InterruptedError:
+                continue
+            self.children.discard(pid)
+            _mark_dead(pid)
+            if not self.stopping:
+                print(f"worker {pid} exited; starting a replacement", file=sys.stderr)
+                self._spawn()
+        return 0
+
+
+def _mark_dead(pid: int) -> None:
+    if not os.environ.get(MULTIPROC_ENV):
+        return
+    try:
+        from prometheus_client import multiprocess
+    except ImportError:
+        return
+    multiprocess.mark_process_dead(pid)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m backend.server")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 8000)))
+    parser.add_argument(
+        "--workers", type=int, default=None, help="0: one per CPU"
+    )
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args(argv)
+    app_settings = get_settings()
+    workers = worker_count(
+        app_settings.workers if args.workers is None else args.workers
+    )
+
+    # Must be set before anything imports prometheus_client
+    metrics_dir = None
+    if workers > 1 and not os.environ.get(MULTIPROC_ENV):
+        metrics_dir = tempfile.mkdtemp(prefix="gradeapp-metrics-")
+        os.environ[MULTIPROC_ENV] = metrics_dir
+
+    from . import migrate
+    from .app import create_app
+    from .db import get_engine
+
+    if app_settings.auto_create_tables:
+        migrate.upgrade(get_engine())
+        get_engine().dispose()
+
+    config = uvicorn.Config(
+        create_app(worker_settings(app_settings, workers)),
+        loop=event_loop(),
+        http=http_protocol(),
+        log_level=args.log_level,
+        proxy_headers=True,
+    )
+    sock = _bind(args.host, args.port)
+    print(
+        f"serving on {args.host}:{args.port} with {workers} worker(s), "
+        f"{config.loop} loop, {config.http} parser",
+        file=sys.stderr,
+    )
+    try:
+        if workers == 1:
+            uvicorn.Server(config).run(sockets=[sock])
+            return 0
+        return Supervisor(config, sock, workers).run()
+    finally:
+        sock.close()
+        if metrics_dir is not None:
+            shutil.rmtree(metrics_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
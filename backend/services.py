@@ -1,10 +1,46 @@
 from __future__ import annotations
 
-from typing import Iterable
+import asyncio
+import base64
+import binascii
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from datetime import date
+from typing import (
+    TYPE_CHECKING,
+    ContextManager,
+    Hashable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Sequence,
+)
 
+from sqlalchemy import and_, delete, func, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from . import models, schemas
+from . import allocation, calculations, models, schemas
+from .instrumentation import timed_methods
+
+if TYPE_CHECKING:  # the async stack is optional (needs greenlet + an async driver)
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from .cohort import Cohort
+    from .events import StatsBroadcaster
+
+try:
+    from prometheus_client import Counter
+
+    _CACHE_HITS = Counter(
+        "gradeapp_stats_cache_hits_total", "Stats reads served from the cache"
+    )
+    _CACHE_MISSES = Counter(
+        "gradeapp_stats_cache_misses_total", "Stats reads that went to the database"
+    )
+except ImportError:  # monitoring is optional
+    _CACHE_HITS = _CACHE_MISSES = None
 
 
 class AssessmentNotFound(Exception):
@@ -15,41 +51,872 @@ class AssessmentNotFound(Exception):
         self.assessment_id = assessment_id
 
 
+class CourseNotFound(Exception):
+    """Raised when a course (tenant) cannot be located."""
+
+    def __init__(self, course_id: int) -> None:
+        super().__init__(f"Course {course_id} not found")
+        self.course_id = course_id
+
+
+class StudentNotFound(Exception):
+    """Raised when a student cannot be located."""
+
+    def __init__(self, student_id: int) -> None:
+        super().__init__(f"Student {student_id} not found")
+        self.student_id = student_id
+
+
+class AssessmentsNotFound(Exception):
+    """Raised when a bulk request references ids that do not exist."""
+
+    def __init__(self, assessment_ids: Sequence[int]) -> None:
+        super().__init__(f"Assessments not found: {list(assessment_ids)}")
+        self.assessment_ids = list(assessment_ids)
+
+
+class DuplicateAssessmentIds(ValueError):
+    """Raised when a bulk update lists the same id more than once."""
+
+
+class InvalidPageRequest(ValueError):
+    """Raised when a pagination cursor or field projection is malformed."""
+
+
+PROJECTABLE_FIELDS = ("id", "title", "weight_pct", "due_date", "score_pct")
+# Column order of a full list row, matching the AssessmentOut JSON layout
+OUT_FIELDS = tuple(schemas.AssessmentOut.model_fields)
+
+
+def encode_cursor(due_date: date, assessment_id: int) -> str:
+    """Opaque keyset cursor pointing just past ``(due_date, id)``."""
+    raw = f"{due_date.isoformat()}|{assessment_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[date, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw_date, raw_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return date.fromisoformat(raw_date), int(raw_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as err:
+        raise InvalidPageRequest(f"Invalid cursor: {cursor!r}") from err
+
+
+def parse_fields(fields: str) -> tuple[str, ...]:
+    """Validate a comma separated projection; ``id`` is always included."""
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = sorted(set(requested) - set(PROJECTABLE_FIELDS))
+    if unknown:
+        raise InvalidPageRequest(f"Unknown fields: {', '.join(unknown)}")
+    return tuple(name for name in PROJECTABLE_FIELDS if name == "id" or name in requested)
+
+
+# The delta engine lives in calculations; these names predate the move
+ScoreSnapshot = calculations.ScoreSnapshot
+
+
+def _snapshot(assessment: models.Assessment) -> ScoreSnapshot:
+    return ScoreSnapshot(assessment.weight_pct, assessment.score_pct)
+
+
+class TenantSummary(NamedTuple):
+    """A tenant's aggregates and the data version they were read at."""
+
+    totals: calculations.WeightTotals
+    version: int
+
+
+class StatsCache:
+    """Bounded LRU of per-tenant aggregates kept current by write-through.
+
+    Writers wrap their commit in :meth:`writing` and then :meth:`apply` the
+    row delta. A reader that missed only stores what it loaded if no write
+    was in flight or finished meanwhile, so a stale load never overwrites a
+    newer delta. Each entry is a :class:`calculations.IncrementalTotals`
+    remembering its last ``history_size`` versions for :meth:`history`.
+    """
+
+    def __init__(self, max_entries: int = 1024, history_size: int = 0) -> None:
+        self.max_entries = max_entries
+        self.history_size = history_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, calculations.IncrementalTotals] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._writes_in_flight = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> TenantSummary | None:
+        agg = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                agg = TenantSummary(entry.totals, entry.version)
+        counter = _CACHE_MISSES if agg is None else _CACHE_HITS
+        if counter is not None:
+            counter.inc()
+        return agg
+
+    def history(self, key: Hashable) -> list[calculations.TotalsSnapshot] | None:
+        """Versions seen since ``key`` was loaded, oldest first; None if not cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else entry.history()
+
+    def token(self) -> int:
+        """Generation to pass back to :meth:`put` after loading from the DB."""
+        with self._lock:
+            return self._generation
+
+    def put(self, key: Hashable, agg: TenantSummary, token: int) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            if self._writes_in_flight or token != self._generation:
+                return
+            self._entries[key] = calculations.IncrementalTotals(
+                agg.totals, agg.version, self.history_size
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @contextmanager
+    def writing(self) -> Iterator[None]:
+        with self._lock:
+            self._writes_in_flight += 1
+            self._generation += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._writes_in_flight -= 1
+                self._generation += 1
+
+    def apply(
+        self, key: Hashable, old: ScoreSnapshot | None, new: ScoreSnapshot | None
+    ) -> None:
+        self.apply_many(key, [(old, new)])
+
+    def apply_many(
+        self, key: Hashable, changes: Iterable[calculations.RowChange]
+    ) -> None:
+        """Apply one committed write, however many rows it touched.
+
+        The cached version moves by one, as ``grade_summary.version`` does.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.apply_many(changes)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _in_course(course_id: int | None):
+    """Tenant filter: ``None`` selects the default, unscoped gradebook."""
+    column = models.Assessment.course_id
+    return column.is_(None) if course_id is None else column == course_id
+
+
+def _list_query(course_id: int | None, ordered: bool):
+    query = select(models.Assessment).where(_in_course(course_id))
+    if ordered:
+        query = query.order_by(models.Assessment.due_date, models.Assessment.id)
+    return query
+
+
+def _page_query(
+    course_id: int | None,
+    limit: int | None,
+    after: tuple[date, int] | None,
+    fields: Sequence[str] | None,
+):
+    table = models.Assessment
+    names = OUT_FIELDS if fields is None else dict.fromkeys((*fields, "due_date", "id"))
+    query = select(*(getattr(table, name) for name in names))
+    query = query.where(_in_course(course_id))
+    if after is not None:
+        after_date, after_id = after
+        query = query.where(
+            or_(
+                table.due_date > after_date,
+                and_(table.due_date == after_date, table.id > after_id),
+            )
+        )
+    query = query.order_by(table.due_date, table.id)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def _lock_row_query(course_id: int | None, assessment_id: int):
+    """No-op update returning the row's stats columns as they are now.
+
+    Being a write, it locks what it reads until commit: the row on Postgres
+    (as ``FOR UPDATE`` would), the database on SQLite (as ``BEGIN IMMEDIATE``
+    would), so a concurrent write to the row waits instead of reusing them.
+    """
+    table = models.Assessment
+    return (
+        update(table)
+        .where(table.id == assessment_id, _in_course(course_id))
+        .values(id=table.id)
+        .returning(table.weight_pct, table.score_pct)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _delete_row_query(course_id: int | None, assessment_id: int):
+    """Delete one row, returning its stats columns; nothing when already gone."""
+    table = models.Assessment
+    return (
+        delete(table)
+        .where(table.id == assessment_id, _in_course(course_id))
+        .returning(table.weight_pct, table.score_pct)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _totals_query(course_id: int | None):
+    weight = models.Assessment.weight_pct
+    score = models.Assessment.score_pct
+    return select(
+        func.coalesce(func.sum(weight), 0.0),
+        func.coalesce(func.sum(weight).filter(score.is_not(None)), 0.0),
+        func.coalesce(func.sum(weight * score), 0.0),
+    ).where(_in_course(course_id))
+
+
+def _to_totals(row: Sequence) -> calculations.WeightTotals:
+    total, done, weighted = row
+    return calculations.WeightTotals(float(total), float(done), float(weighted))
+
+
+# ---- grade_summary: one materialized WeightTotals row per tenant ----
+def _scope_id(course_id: int | None) -> int:
+    return models.DEFAULT_SCOPE_ID if course_id is None else course_id
+
+
+def _summary_query(course_id: int | None):
+    summary = models.GradeSummary
+    return select(
+        summary.total_weight, summary.weight_done, summary.weighted_sum, summary.version
+    ).where(summary.scope_id == _scope_id(course_id))
+
+
+def _to_summary(row: Sequence) -> TenantSummary:
+    return TenantSummary(_to_totals(row[:3]), row[3])
+
+
+def _summary_delta_query(course_id: int | None, delta: calculations.WeightTotals):
+    """Atomic ``x = x + d`` so concurrent writers never lose an update."""
+    summary = models.GradeSummary
+    return (
+        update(summary)
+        .where(summary.scope_id == _scope_id(course_id))
+        .values(
+            total_weight=summary.total_weight + delta.total_weight,
+            weight_done=summary.weight_done + delta.weight_done,
+            weighted_sum=summary.weighted_sum + delta.weighted_sum,
+            version=summary.version + 1,
+        )
+    )
+
+
+def _summary_store_queries(course_id: int | None, agg: calculations.WeightTotals):
+    """Overwrite the row as a new version, or insert it if the update matched nothing."""
+    summary = models.GradeSummary
+    scope = _scope_id(course_id)
+    values = agg._asdict()
+    return (
+        update(summary)
+        .where(summary.scope_id == scope)
+        .values(version=summary.version + 1, **values),
+        insert(summary).values(scope_id=scope, version=1, **values),
+    )
+
+
+def _summary_replace_query(
+    course_id: int | None, agg: calculations.WeightTotals, version: int
+):
+    """Overwrite the row as a new version only if it is still at ``version``.
+
+    Compare-and-set: a write committed since ``version`` was read (or still
+    holding the row) makes it match nothing instead of being overwritten.
+    """
+    summary = models.GradeSummary
+    return (
+        update(summary)
+        .where(summary.scope_id == _scope_id(course_id), summary.version == version)
+        .values(version=version + 1, **agg._asdict())
+    )
+
+
+def _summary_backfill_query(course_id: int | None, agg: calculations.WeightTotals):
+    """Version 0: the data predates the row, so nothing has been served yet."""
+    return insert(models.GradeSummary).values(
+        scope_id=_scope_id(course_id), version=0, **agg._asdict()
+    )
+
+
 class AssessmentRepository:
-    """Persistence boundary for assessments."""
+    """Persistence boundary for one tenant's (course's) assessments."""
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: Session, course_id: int | None = None) -> None:
         self._session = session
+        self.course_id = course_id
+
+    def course_exists(self) -> bool:
+        if self.course_id is None:
+            return True
+        return self._session.get(models.Course, self.course_id) is not None
 
     def list(self, ordered: bool = True) -> list[models.Assessment]:
-        query = self._session.query(models.Assessment)
-        if ordered:
-            query = query.order_by(models.Assessment.due_date)
-        return query.all()
+        query = _list_query(self.course_id, ordered)
+        return list(self._session.execute(query).scalars())
+
+    def page(
+        self,
+        limit: int | None,
+        after: tuple[date, int] | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> Sequence:
+        """Keyset page ordered by ``(due_date, id)``.
+
+        Returns column rows, never ORM objects: every ``AssessmentOut`` column,
+        or only ``fields`` (plus the ordering keys) when a projection is requested.
+        """
+        query = _page_query(self.course_id, limit, after, fields)
+        return self._session.execute(query).all()
+
+    def aggregate_totals(self) -> calculations.WeightTotals:
+        """Aggregate weights and scores in one SQL query, without hydrating rows."""
+        query = _totals_query(self.course_id)
+        return _to_totals(self._session.execute(query).one())
+
+    def summary(self) -> TenantSummary:
+        """Primary-key lookup of the materialized ``grade_summary`` row.
+
+        A tenant without a row yet (data loaded behind the app's back) is
+        aggregated once and the result stored for later reads.
+        """
+        stored = self.stored_summary()
+        if stored is not None:
+            return stored
+        agg = self.aggregate_totals()
+        try:
+            self._session.execute(_summary_backfill_query(self.course_id, agg))
+            self._session.commit()
+        except IntegrityError:  # a concurrent request stored it first
+            self._session.rollback()
+            return self.summary()
+        return TenantSummary(agg, 0)
+
+    def totals(self) -> calculations.WeightTotals:
+        return self.summary().totals
+
+    def stored_summary(self) -> TenantSummary | None:
+        row = self._session.execute(_summary_query(self.course_id)).one_or_none()
+        return None if row is None else _to_summary(row)
+
+    def rebuild_summary(self) -> calculations.WeightTotals:
+        """Overwrite the summary with a fresh aggregate of ``assessments``.
+
+        Safe while the API is writing: the aggregate is retaken until no
+        write lands between reading it and storing it, each time in a new
+        transaction so the re-read cannot see the old snapshot again.
+        """
+        while True:
+            read = self.stored_summary()
+            actual = self.aggregate_totals()
+            if self.replace_summary(actual, read):
+                self._session.commit()
+                return actual
+            self._session.rollback()
+
+    def replace_summary(
+        self, agg: calculations.WeightTotals, read: TenantSummary | None
+    ) -> bool:
+        """Store ``agg``, aggregated after ``read``, in the caller's transaction.
+
+        Returns False, storing nothing, when the row changed since ``read``
+        (a concurrent write): aggregate again on top of it and retry.
+        """
+        if read is None:
+            _, create = _summary_store_queries(self.course_id, agg)
+            self._session.execute(create)
+            return True
+        query = _summary_replace_query(self.course_id, agg, read.version)
+        return self._session.execute(query).rowcount > 0
+
+    def _store_summary(self, agg: calculations.WeightTotals) -> None:
+        overwrite, create = _summary_store_queries(self.course_id, agg)
+        if self._session.execute(overwrite).rowcount == 0:
+            self._session.execute(create)
+
+    def _bump_summary(self, delta: calculations.WeightTotals) -> None:
+        """Apply ``delta`` inside the caller's transaction (pending writes flushed)."""
+        query = _summary_delta_query(self.course_id, delta)
+        if self._session.execute(query).rowcount == 0:
+            self._store_summary(self.aggregate_totals())
+
+    def stream(self, batch_size: int) -> Iterator[Sequence]:
+        """Yield batches of column rows in ``(due_date, id)`` order.
+
+        Uses a server-side cursor (``yield_per``) so memory stays bounded by
+        ``batch_size`` rather than the table size.
+        """
+        table = models.Assessment
+        query = (
+            select(*(getattr(table, name) for name in PROJECTABLE_FIELDS))
+            .where(_in_course(self.course_id))
+            .order_by(table.due_date, table.id)
+            .execution_options(yield_per=batch_size)
+        )
+        yield from self._session.execute(query).partitions()
+
+    def release(self) -> None:
+        """End the session's transaction and hand its connection back to the pool."""
+        self._session.close()
 
     def get(self, assessment_id: int) -> models.Assessment | None:
-        return self._session.get(models.Assessment, assessment_id)
+        assessment = self._session.get(models.Assessment, assessment_id)
+        if assessment is None or assessment.course_id != self.course_id:
+            return None
+        return assessment
 
     def save(self, assessment: models.Assessment) -> models.Assessment:
+        """Insert ``assessment`` and bump its tenant summary in one commit."""
+        assessment.course_id = self.course_id
         self._session.add(assessment)
+        self._session.flush()
+        delta = calculations.apply_delta(
+            calculations.NO_TOTALS, None, _snapshot(assessment)
+        )
+        self._bump_summary(delta)
         self._session.commit()
         self._session.refresh(assessment)
         return assessment
 
-    def delete(self, assessment: models.Assessment) -> None:
-        self._session.delete(assessment)
+    # Updates and deletes take the old values from the statement that locks
+    # or removes the row, never from an earlier read: two requests on the
+    # same row (a double-click) must not both apply their delta.
+    def update(
+        self, assessment_id: int, changes: dict
+    ) -> tuple[models.Assessment, calculations.RowChange] | None:
+        """Apply ``changes`` to one row and its summary in one commit.
+
+        Returns the updated row and the change applied to the summary, or
+        ``None`` when the row does not exist (anymore).
+        """
+        old = self._session.execute(
+            _lock_row_query(self.course_id, assessment_id)
+        ).one_or_none()
+        if old is None:
+            self._session.rollback()
+            return None
+        old = ScoreSnapshot(*old)
+        assessment = self._session.get(
+            models.Assessment, assessment_id, populate_existing=True
+        )
+        for field, value in changes.items():
+            setattr(assessment, field, value)
+        self._session.flush()
+        new = _snapshot(assessment)
+        self._bump_summary(calculations.apply_delta(calculations.NO_TOTALS, old, new))
         self._session.commit()
+        self._session.refresh(assessment)
+        return assessment, (old, new)
 
+    def delete(self, assessment_id: int) -> ScoreSnapshot | None:
+        """Delete one row and bump its summary; ``None`` when nothing matched."""
+        old = self._session.execute(
+            _delete_row_query(self.course_id, assessment_id)
+        ).one_or_none()
+        if old is None:
+            self._session.rollback()
+            return None
+        old = ScoreSnapshot(*old)
+        self._bump_summary(calculations.apply_delta(calculations.NO_TOTALS, old, None))
+        self._session.commit()
+        return old
 
-class AssessmentService:
-    """Encapsulates CRUD operations for assessments."""
+    def existing_ids(self, assessment_ids: Iterable[int]) -> set[int]:
+        query = select(models.Assessment.id).where(
+            models.Assessment.id.in_(set(assessment_ids)), _in_course(self.course_id)
+        )
+        return set(self._session.execute(query).scalars())
 
-    def __init__(self, repository: AssessmentRepository) -> None:
+    # Bulk writes: one executemany per statement and a single commit.
+    def bulk_insert(self, rows: list[dict]) -> list[int]:
+        query = insert(models.Assessment).returning(
+            models.Assessment.id, sort_by_parameter_order=True
+        )
+        rows = [{**row, "course_id": self.course_id} for row in rows]
+        ids = list(self._session.execute(query, rows).scalars())
+        self._bump_summary(
+            calculations.sum_deltas(
+                (None, ScoreSnapshot(row["weight_pct"], row.get("score_pct")))
+                for row in rows
+            )
+        )
+        self._session.commit()
+        return ids
+
+    # Old values of bulk updates/deletes are never loaded, so the summary is
+    # re-aggregated once in the same transaction instead of patched by delta.
+    def bulk_update(self, rows: list[dict]) -> None:
+        """Update by primary key; every dict carries ``id`` plus changed columns."""
+        self._session.execute(update(models.Assessment), rows)
+        self._store_summary(self.aggregate_totals())
+        self._session.commit()
+
+    def bulk_delete(self, assessment_ids: Iterable[int]) -> None:
+        query = delete(models.Assessment).where(
+            models.Assessment.id.in_(set(assessment_ids)), _in_course(self.course_id)
+        )
+        self._session.execute(query)
+        self._store_summary(self.aggregate_totals())
+        self._session.commit()
+
+
+class CourseRepository:
+    """Persistence boundary for students and their courses (the tenants)."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def list_students(self) -> list[models.Student]:
+        query = select(models.Student).order_by(models.Student.id)
+        return list(self._session.execute(query).scalars())
+
+    def get_student(self, student_id: int) -> models.Student | None:
+        return self._session.get(models.Student, student_id)
+
+    def list_courses(self, student_id: int | None = None) -> list[models.Course]:
+        query = select(models.Course).order_by(models.Course.id)
+        if student_id is not None:
+            query = query.where(models.Course.student_id == student_id)
+        return list(self._session.execute(query).scalars())
+
+    def get_course(self, course_id: int) -> models.Course | None:
+        return self._session.get(models.Course, course_id)
+
+    def save(self, row: models.Student | models.Course):
+        self._session.add(row)
+        self._session.commit()
+        self._session.refresh(row)
+        return row
+
+    def scopes(self) -> list[int | None]:
+        """Every tenant: the default gradebook, then each course by id."""
+        query = select(models.Course.id).order_by(models.Course.id)
+        return [None, *self._session.execute(query).scalars()]
+
+
+class AsyncAssessmentRepository:
+    """Async twin of :class:`AssessmentRepository` for the opt-in async stack."""
+
+    def __init__(self, session: AsyncSession, course_id: int | None = None) -> None:
+        self._session = session
+        self.course_id = course_id
+
+    async def course_exists(self) -> bool:
+        if self.course_id is None:
+            return True
+        return await self._session.get(models.Course, self.course_id) is not None
+
+    async def list(self, ordered: bool = True) -> list[models.Assessment]:
+        query = _list_query(self.course_id, ordered)
+        return list((await self._session.execute(query)).scalars())
+
+    async def page(
+        self,
+        limit: int | None,
+        after: tuple[date, int] | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> Sequence:
+        query = _page_query(self.course_id, limit, after, fields)
+        return (await self._session.execute(query)).all()
+
+    async def aggregate_totals(self) -> calculations.WeightTotals:
+        query = _totals_query(self.course_id)
+        return _to_totals((await self._session.execute(query)).one())
+
+    async def summary(self) -> TenantSummary:
+        row = (await self._session.execute(_summary_query(self.course_id))).one_or_none()
+        if row is not None:
+            return _to_summary(row)
+        agg = await self.aggregate_totals()
+        try:
+            await self._session.execute(_summary_backfill_query(self.course_id, agg))
+            await self._session.commit()
+        except IntegrityError:
+            await self._session.rollback()
+            return await self.summary()
+        return TenantSummary(agg, 0)
+
+    async def totals(self) -> calculations.WeightTotals:
+        return (await self.summary()).totals
+
+    async def _store_summary(self, agg: calculations.WeightTotals) -> None:
+        overwrite, create = _summary_store_queries(self.course_id, agg)
+        if (await self._session.execute(overwrite)).rowcount == 0:
+            await self._session.execute(create)
+
+    async def _bump_summary(self, delta: calculations.WeightTotals) -> None:
+        query = _summary_delta_query(self.course_id, delta)
+        if (await self._session.execute(query)).rowcount == 0:
+            await self._store_summary(await self.aggregate_totals())
+
+    async def release(self) -> None:
+        await self._session.close()
+
+    async def get(self, assessment_id: int) -> models.Assessment | None:
+        assessment = await self._session.get(models.Assessment, assessment_id)
+        if assessment is None or assessment.course_id != self.course_id:
+            return None
+        return assessment
+
+    async def save(self, assessment: models.Assessment) -> models.Assessment:
+        assessment.course_id = self.course_id
+        self._session.add(assessment)
+        await self._session.flush()
+        delta = calculations.apply_delta(
+            calculations.NO_TOTALS, None, _snapshot(assessment)
+        )
+        await self._bump_summary(delta)
+        await self._session.commit()
+        await self._session.refresh(assessment)
+        return assessment
+
+    async def update(
+        self, assessment_id: int, changes: dict
+    ) -> tuple[models.Assessment, calculations.RowChange] | None:
+        old = (
+            await self._session.execute(_lock_row_query(self.course_id, assessment_id))
+        ).one_or_none()
+        if old is None:
+            await self._session.rollback()
+            return None
+        old = ScoreSnapshot(*old)
+        assessment = await self._session.get(
+            models.Assessment, assessment_id, populate_existing=True
+        )
+        for field, value in changes.items():
+            setattr(assessment, field, value)
+        await self._session.flush()
+        new = _snapshot(assessment)
+        await self._bump_summary(
+            calculations.apply_delta(calculations.NO_TOTALS, old, new)
+        )
+        await self._session.commit()
+        await self._session.refresh(assessment)
+        return assessment, (old, new)
+
+    async def delete(self, assessment_id: int) -> ScoreSnapshot | None:
+        old = (
+            await self._session.execute(
+                _delete_row_query(self.course_id, assessment_id)
+            )
+        ).one_or_none()
+        if old is None:
+            await self._session.rollback()
+            return None
+        old = ScoreSnapshot(*old)
+        await self._bump_summary(
+            calculations.apply_delta(calculations.NO_TOTALS, old, None)
+        )
+        await self._session.commit()
+        return old
+
+
+class CourseService:
+    """Creates and looks up students and courses."""
+
+    def __init__(self, repository: CourseRepository) -> None:
         self._repository = repository
 
+    def list_students(self) -> list[models.Student]:
+        return self._repository.list_students()
+
+    def create_student(self, payload: schemas.StudentIn) -> models.Student:
+        return self._repository.save(models.Student(**payload.dict()))
+
+    def list_courses(self, student_id: int | None = None) -> list[models.Course]:
+        return self._repository.list_courses(student_id)
+
+    def get_course(self, course_id: int) -> models.Course:
+        course = self._repository.get_course(course_id)
+        if course is None:
+            raise CourseNotFound(course_id)
+        return course
+
+    def create_course(self, payload: schemas.CourseIn) -> models.Course:
+        if payload.student_id is not None:
+            if self._repository.get_student(payload.student_id) is None:
+                raise StudentNotFound(payload.student_id)
+        return self._repository.save(models.Course(**payload.dict()))
+
+
+class SummaryDrift(NamedTuple):
+    """Stored vs. recomputed ``grade_summary`` values for one tenant."""
+
+    course_id: int | None
+    stored: calculations.WeightTotals | None
+    actual: calculations.WeightTotals
+
+
+def reconcile_summaries(
+    session: Session, fix: bool = True, tolerance: float = 1e-6
+) -> list[SummaryDrift]:
+    """Compare every tenant's summary with its assessments; optionally rebuild.
+
+    Returns the tenants whose row was missing or off by more than ``tolerance``
+    (delta maintenance accumulates float rounding, so tiny drift is expected).
+    """
+    drift = []
+    for course_id in CourseRepository(session).scopes():
+        repository = AssessmentRepository(session, course_id)
+        row = repository.stored_summary()
+        stored = None if row is None else row.totals
+        actual = repository.aggregate_totals()
+        have = calculations.NO_TOTALS if stored is None else stored
+        if any(abs(x - y) > tolerance for x, y in zip(have, actual)):
+            drift.append(SummaryDrift(course_id, stored, actual))
+        if fix:
+            repository.rebuild_summary()
+    return drift
+
+
+def load_cohort(session: Session, course_ids: Iterable[int] | None = None) -> Cohort:
+    """Every gradebook's assessments as one :class:`~backend.cohort.Cohort`.
+
+    Students are keyed by scope id (``DEFAULT_SCOPE_ID`` for the default
+    gradebook) and their rows kept in id order. NumPy is only imported here.
+    """
+    from .cohort import Cohort
+
+    scope = func.coalesce(models.Assessment.course_id, models.DEFAULT_SCOPE_ID)
+    stmt = select(
+        scope, models.Assessment.weight_pct, models.Assessment.score_pct
+    ).order_by(scope, models.Assessment.id)
+    if course_ids is not None:
+        stmt = stmt.where(models.Assessment.course_id.in_(list(course_ids)))
+    rows = session.execute(stmt).all()
+    if not rows:
+        return Cohort.from_columns([], [], [])
+    return Cohort.from_columns(*zip(*rows))
+
+
+class _ServiceBase:
+    """State and helpers shared by the sync and async services."""
+
+    def __init__(
+        self,
+        repository,
+        cache: StatsCache | None = None,
+        events: StatsBroadcaster | None = None,
+    ) -> None:
+        self._repository = repository
+        self._cache = cache
+        self._events = events
+        self._tenant = repository.course_id  # cache key: one entry per course
+
+    @property
+    def tenant(self) -> int | None:
+        return self._tenant
+
+    def _watched(self) -> bool:
+        return self._events is not None and self._events.watching(self._tenant)
+
+    def _writing(self) -> ContextManager[None]:
+        return self._cache.writing() if self._cache is not None else nullcontext()
+
+    def _record(self, old: ScoreSnapshot | None, new: ScoreSnapshot | None) -> None:
+        """Apply the change the repository committed (never a value read earlier)."""
+        if self._cache is not None:
+            self._cache.apply(self._tenant, old, new)
+
+    def _record_many(self, changes: Iterable[calculations.RowChange]) -> None:
+        if self._cache is not None:
+            self._cache.apply_many(self._tenant, changes)
+
+    def _forget(self) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(self._tenant)
+
+    def etag(self, summary: TenantSummary) -> str:
+        """Strong validator for every read derived from this tenant's data."""
+        return f'"{_scope_id(self._tenant)}-{summary.version}"'
+
+    @staticmethod
+    def _page_request(
+        limit: int | None, after: str | None, fields: str | None
+    ) -> tuple[int | None, tuple[date, int] | None, tuple[str, ...] | None]:
+        position = decode_cursor(after) if after else None
+        projection = parse_fields(fields) if fields else None
+        fetch = None if limit is None else limit + 1
+        return fetch, position, projection
+
+    @staticmethod
+    def _page_result(
+        rows: Sequence, limit: int | None, projection: tuple[str, ...] | None
+    ) -> tuple[list[dict], str | None]:
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].due_date, rows[-1].id)
+        if projection is None:
+            return [row._asdict() for row in rows], next_cursor
+        rows = [{name: getattr(row, name) for name in projection} for row in rows]
+        return rows, next_cursor
+
+
+@timed_methods("service")
+class AssessmentService(_ServiceBase):
+    """Encapsulates CRUD operations for assessments."""
+
+    _repository: AssessmentRepository
+
     def list_assessments(self, ordered: bool = True) -> list[models.Assessment]:
         return self._repository.list(ordered)
 
+    def list_page(
+        self,
+        limit: int | None,
+        after: str | None = None,
+        fields: str | None = None,
+    ) -> tuple[list[dict], str | None]:
+        """Return one keyset page and the cursor for the next one (or ``None``).
+
+        Rows are plain dicts (of ``fields`` when given), ready to encode as JSON
+        without passing through the response model.
+        """
+        fetch, position, projection = self._page_request(limit, after, fields)
+        rows = self._repository.page(fetch, position, projection)
+        return self._page_result(rows, limit, projection)
+
+    def export_batches(self, batch_size: int = 1000) -> Iterator[Sequence]:
+        return self._repository.stream(batch_size)
+
     def get_assessment(self, assessment_id: int) -> models.Assessment:
         assessment = self._repository.get(assessment_id)
         if assessment is None:
@@ -58,20 +925,230 @@ class AssessmentService:
 
     def create_assessment(self, payload: schemas.AssessmentIn) -> models.Assessment:
         assessment = models.Assessment(**payload.dict())
-        return self._repository.save(assessment)
+        with self._writing():
+            saved = self._repository.save(assessment)
+            self._record(None, _snapshot(saved))
+        self._publish()
+        return saved
 
     def update_assessment(
         self, assessment_id: int, payload: schemas.AssessmentUpdate
     ) -> models.Assessment:
-        assessment = self.get_assessment(assessment_id)
-        for field, value in payload.dict(exclude_unset=True).items():
-            setattr(assessment, field, value)
-        return self._repository.save(assessment)
+        with self._writing():
+            applied = self._repository.update(
+                assessment_id, payload.dict(exclude_unset=True)
+            )
+            if applied is not None:
+                self._record(*applied[1])  # what the summary got, not a prior read
+        if applied is None:
+            raise AssessmentNotFound(assessment_id)
+        self._publish()
+        return applied[0]
 
     def delete_assessment(self, assessment_id: int) -> None:
-        assessment = self.get_assessment(assessment_id)
-        self._repository.delete(assessment)
+        with self._writing():
+            old = self._repository.delete(assessment_id)
+            if old is not None:
+                self._record(old, None)
+        if old is None:
+            raise AssessmentNotFound(assessment_id)
+        self._publish()
+
+    # ---- Bulk operations: validate everything, then apply in one commit ----
+    def _require_existing(self, assessment_ids: Sequence[int]) -> None:
+        found = self._repository.existing_ids(assessment_ids)
+        missing = [aid for aid in dict.fromkeys(assessment_ids) if aid not in found]
+        if missing:
+            raise AssessmentsNotFound(missing)
+
+    def bulk_create(self, payloads: Sequence[schemas.AssessmentIn]) -> list[int]:
+        if not payloads:
+            return []
+        with self._writing():
+            ids = self._repository.bulk_insert([payload.dict() for payload in payloads])
+            # One transaction, so one version: the same bump as grade_summary
+            self._record_many(
+                (None, ScoreSnapshot(payload.weight_pct, payload.score_pct))
+                for payload in payloads
+            )
+        self._publish()
+        return ids
+
+    def bulk_update(self, payloads: Sequence[schemas.AssessmentBulkUpdate]) -> list[int]:
+        ids = [payload.id for payload in payloads]
+        if len(set(ids)) != len(ids):
+            raise DuplicateAssessmentIds("Each id may appear only once per bulk update")
+        self._require_existing(ids)
+        rows = [payload.dict(exclude_unset=True) for payload in payloads]
+        rows = [row for row in rows if len(row) > 1]  # skip id-only no-ops
+        if rows:
+            with self._writing():
+                self._repository.bulk_update(rows)
+                self._forget()  # old values were never loaded; reload on next read
+            self._publish()
+        return ids
+
+    def bulk_delete(self, assessment_ids: Sequence[int]) -> list[int]:
+        self._require_existing(assessment_ids)
+        if assessment_ids:
+            with self._writing():
+                self._repository.bulk_delete(assessment_ids)
+                self._forget()
+            self._publish()
+        return list(assessment_ids)
 
     def list_for_stats(self) -> Iterable[models.Assessment]:
         """Internal helper to keep stats queries consistent."""
         return self.list_assessments(ordered=False)
+
+    def stats_summary(self) -> TenantSummary:
+        """Aggregates and data version, from the cache when warm."""
+        if self._cache is None:
+            return self._repository.summary()
+        summary = self._cache.get(self._tenant)
+        if summary is None:
+            token = self._cache.token()
+            summary = self._repository.summary()
+            self._cache.put(self._tenant, summary, token)
+        return summary
+
+    def stats_totals(self) -> calculations.WeightTotals:
+        """Aggregates for the stats endpoints, from the cache when warm."""
+        return self.stats_summary().totals
+
+    def stats_history(self) -> list[calculations.TotalsSnapshot]:
+        """Recent versions of the aggregates, oldest first.
+
+        The stats cache records one per write it applies, so nothing is
+        re-scanned. History lives only in this process: an uncached tenant,
+        or any tenant when the cache is disabled (``stats_cache_size=0``, as
+        under several server workers), only has its current version.
+        """
+        summary = self.stats_summary()
+        history = self._cache.history(self._tenant) if self._cache else None
+        return history or [calculations.TotalsSnapshot(summary.version, summary.totals)]
+
+    def allocation_plan(self, plans: allocation.PlanCache) -> allocation.AllocationPlan:
+        """This tenant's allocation plan at the current data version."""
+        key = (self._tenant, self.stats_summary().version)
+        return plans.get_or_build(
+            key, lambda: allocation.build_plan(self.list_assessments())
+        )
+
+    def simulate_what_if(self, target: float, **options) -> schemas.WhatIfSimulation:
+        """Monte Carlo what-if (:mod:`backend.simulation`); imports NumPy."""
+        from .simulation import simulate_what_if
+
+        return simulate_what_if(self.list_assessments(), target, **options)
+
+    def release(self) -> None:
+        """Free the DB connection before a long-lived response (a stream)."""
+        self._repository.release()
+
+    def _publish(self) -> None:
+        """Push the committed stats to stream subscribers, if there are any."""
+        if self._watched():
+            self._events.publish(self._tenant, self.stats_summary())
+
+
+@timed_methods("service")
+class AsyncAssessmentService(_ServiceBase):
+    """Async variant of :class:`AssessmentService` for the core CRUD and stats."""
+
+    _repository: AsyncAssessmentRepository
+
+    async def list_assessments(self, ordered: bool = True) -> list[models.Assessment]:
+        return await self._repository.list(ordered)
+
+    async def list_page(
+        self,
+        limit: int | None,
+        after: str | None = None,
+        fields: str | None = None,
+    ) -> tuple[list[dict], str | None]:
+        fetch, position, projection = self._page_request(limit, after, fields)
+        rows = await self._repository.page(fetch, position, projection)
+        return self._page_result(rows, limit, projection)
+
+    async def get_assessment(self, assessment_id: int) -> models.Assessment:
+        assessment = await self._repository.get(assessment_id)
+        if assessment is None:
+            raise AssessmentNotFound(assessment_id)
+        return assessment
+
+    async def create_assessment(
+        self, payload: schemas.AssessmentIn
+    ) -> models.Assessment:
+        assessment = models.Assessment(**payload.dict())
+        with self._writing():
+            saved = await self._repository.save(assessment)
+            self._record(None, _snapshot(saved))
+        await self._publish()
+        return saved
+
+    async def update_assessment(
+        self, assessment_id: int, payload: schemas.AssessmentUpdate
+    ) -> models.Assessment:
+        with self._writing():
+            applied = await self._repository.update(
+                assessment_id, payload.dict(exclude_unset=True)
+            )
+            if applied is not None:
+                self._record(*applied[1])
+        if applied is None:
+            raise AssessmentNotFound(assessment_id)
+        await self._publish()
+        return applied[0]
+
+    async def delete_assessment(self, assessment_id: int) -> None:
+        with self._writing():
+            old = await self._repository.delete(assessment_id)
+            if old is not None:
+                self._record(old, None)
+        if old is None:
+            raise AssessmentNotFound(assessment_id)
+        await self._publish()
+
+    async def stats_summary(self) -> TenantSummary:
+        if self._cache is None:
+            return await self._repository.summary()
+        summary = self._cache.get(self._tenant)
+        if summary is None:
+            token = self._cache.token()
+            summary = await self._repository.summary()
+            self._cache.put(self._tenant, summary, token)
+        return summary
+
+    async def stats_totals(self) -> calculations.WeightTotals:
+        return (await self.stats_summary()).totals
+
+    async def stats_history(self) -> list[calculations.TotalsSnapshot]:
+        summary = await self.stats_summary()
+        history = self._cache.history(self._tenant) if self._cache else None
+        return history or [calculations.TotalsSnapshot(summary.version, summary.totals)]
+
+    async def allocation_plan(
+        self, plans: allocation.PlanCache
+    ) -> allocation.AllocationPlan:
+        key = (self._tenant, (await self.stats_summary()).version)
+        plan = plans.get(key)
+        if plan is None:
+            plan = allocation.build_plan(await self.list_assessments())
+            plans.put(key, plan)
+        return plan
+
+    async def simulate_what_if(
+        self, target: float, **options
+    ) -> schemas.WhatIfSimulation:
+        from .simulation import simulate_what_if
+
+        rows = await self.list_assessments()
+        # CPU-bound: keep the event loop free while it samples
+        return await asyncio.to_thread(simulate_what_if, rows, target, **options)
+
+    async def release(self) -> None:
+        await self._repository.release()
+
+    async def _publish(self) -> None:
+        if self._watched():
+            self._events.publish(self._tenant, await self.stats_summary())
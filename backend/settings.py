@@ -1,5 +1,6 @@
-from typing import List
+from typing import List, Literal
 
+from pydantic import AliasChoices, Field
 from pydantic_settings import BaseSettings
 
 
@@ -8,17 +9,76 @@ class Settings(BaseSettings):
 
     app_title: str = "Grade & What-If Tracker"
     app_version: str = "1.0"
-    database_url: str = "sqlite:///./grades.db"
+    # Railway injects a bare DATABASE_URL; GRADEAPP_DATABASE_URL takes precedence
+    database_url: str = Field(
+        default="sqlite:///./grades.db",
+        validation_alias=AliasChoices("GRADEAPP_DATABASE_URL", "DATABASE_URL"),
+    )
     allowed_origins: List[str] = [
         "http://127.0.0.1:5500",
         "http://localhost:5500",
     ]
     auto_create_tables: bool = True
+    # Per-tenant stats aggregates kept in process; 0 disables the cache
+    stats_cache_size: int = 1024
+    # /stats/history: versions kept per cached tenant (in process only, so
+    # a single point when the stats cache is disabled)
+    stats_history_size: int = 50
+    # Serve CRUD/stats from async routes on an AsyncSession (aiosqlite/asyncpg)
+    async_db: bool = False
+    # /stats/stream: per-subscriber backlog before it is dropped, write
+    # coalescing window, and keep-alive interval for idle connections
+    stats_stream_queue_size: int = 16
+    stats_stream_coalesce_ms: int = 50
+    stats_stream_keepalive_s: float = 15.0
+    # Prometheus: request/query metrics and the /metrics endpoint
+    metrics_enabled: bool = True
+    metrics_cache_s: float = 0.0  # reuse a rendered scrape for this long
+    # GZip responses of at least gzip_min_size bytes; level 0 disables it
+    gzip_min_size: int = 1024
+    gzip_level: int = 5
+    # /stats/what-if/simulate: time budget and trial cap per request
+    what_if_simulation_budget_ms: float = Field(default=50.0, ge=0)
+    what_if_simulation_max_trials: int = Field(default=200_000, gt=0)
+    # /stats/what-if/allocate: allocation plans kept per (tenant, data version)
+    allocation_cache_size: int = 1024
+    # Add a Server-Timing header (db / calc / service time) to every response
+    server_timing: bool = False
+
+    # python -m backend.server: worker processes, 0 for one per CPU
+    workers: int = 0
+
+    # Connection pool (ignored for in-memory SQLite, which uses one connection)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_pre_ping: bool = True
+    db_pool_recycle: int = 1800  # seconds; -1 disables
+    db_statement_timeout_ms: int = 0  # Postgres only; 0 disables
+    # SQLite connection pragmas
+    sqlite_wal: bool = True
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
 
     class Config:
         env_prefix = "GRADEAPP_"
         env_file = ".env"
+        populate_by_name = True
+
+
+_settings: Settings | None = None
+
+
+def get_settings() -> Settings:
+    """The app's settings, read from the environment and ``.env`` on first use."""
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
 
 
-# Singleton settings instance for the app
-settings = Settings()
+def __getattr__(name: str):
+    # ``settings`` used to be built at import time; it is still importable
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
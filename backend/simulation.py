@@ -0,0 +1,178 @@
+"""Monte Carlo what-if: the probability of reaching a target grade.
+
+:func:`calculations.what_if` answers "what flat average do I need on what is
+left". :func:`simulate_what_if` answers "how likely am I to get there":
+
+- the graded ``score_pct`` values are fitted with a Beta distribution (method
+  of moments, shrunk towards a prior worth ``PRIOR_STRENGTH`` scores so one
+  or two grades do not make it degenerate);
+- each trial draws a score for every ungraded assessment from it,
+  independently, and checks the final weighted grade against the target;
+- trials run in vectorized chunks of at most ``DRAWS_PER_CHUNK`` score draws
+  (``CHUNK_TRIALS`` trials for small gradebooks, fewer for large ones) until
+  the 95% Wilson interval of the probability is within ``precision`` on
+  either side, ``max_trials`` is reached, or the next chunk, timed by the
+  last one, would end past the time budget. The first chunk always runs, so
+  the latency is bounded by the budget or one chunk, whichever is larger.
+
+When the target is already secured or cannot be reached even with 100% on
+everything left, the answer is exact and nothing is sampled.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import Iterable, NamedTuple
+
+import numpy as np
+
+from . import schemas
+from .instrumentation import timed
+
+# Prior for the score distribution, as a fraction of 100%
+PRIOR_MEAN = 0.75
+PRIOR_SD = 0.15
+PRIOR_STRENGTH = 2.0  # worth this many graded scores
+# Keep the fit strictly inside (0, 1), where a Beta distribution exists
+_MEAN_BOUNDS = (0.005, 0.995)
+_Z95 = 1.959963984540054
+CHUNK_TRIALS = 4096
+DRAWS_PER_CHUNK = 1 << 16  # a few milliseconds of beta draws
+
+
+class ScoreDistribution(NamedTuple):
+    alpha: float
+    beta: float
+
+    @property
+    def mean(self) -> float:
+        return self.alpha / (self.alpha + self.beta)
+
+    @property
+    def sd(self) -> float:
+        total = self.alpha + self.beta
+        return math.sqrt(self.alpha * self.beta / (total * total * (total + 1)))
+
+
+def fit_scores(scores: Iterable[float]) -> ScoreDistribution:
+    """Beta distribution of ``scores`` (percentages), shrunk to the prior."""
+    values = np.asarray(list(scores), dtype=np.float64) / 100.0
+    n = len(values)
+    observed_var = float(values.var()) if n else 0.0
+    mean = (float(values.sum()) + PRIOR_STRENGTH * PRIOR_MEAN) / (n + PRIOR_STRENGTH)
+    var = (n * observed_var + PRIOR_STRENGTH * PRIOR_SD**2) / (n + PRIOR_STRENGTH)
+    mean = min(max(mean, _MEAN_BOUNDS[0]), _MEAN_BOUNDS[1])
+    var = min(var, 0.99 * mean * (1 - mean))
+    concentration = mean * (1 - mean) / var - 1
+    return ScoreDistribution(mean * concentration, (1 - mean) * concentration)
+
+
+def wilson_interval(successes: int, trials: int) -> tuple[float, float]:
+    """95% Wilson score interval of ``successes / trials``."""
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    z2 = _Z95 * _Z95
+    denominator = 1 + z2 / trials
+    centre = (p + z2 / (2 * trials)) / denominator
+    half = _Z95 * math.sqrt(p * (1 - p) / trials + z2 / (4 * trials * trials))
+    half /= denominator
+    low = 0.0 if successes == 0 else max(0.0, centre - half)
+    high = 1.0 if successes == trials else min(1.0, centre + half)
+    return low, high
+
+
+def _required_scores(
+    remaining: list, needed: float, expected: float
+) -> list[schemas.SimulatedAssessment]:
+    """Score on each assessment if all the others land on ``expected``."""
+    expected_points = sum(float(r.weight_pct) for r in remaining) * expected
+    out = []
+    for r in remaining:
+        weight = float(r.weight_pct)
+        required = None
+        if weight > 0:
+            required = (needed - expected_points + weight * expected) / weight
+        out.append(
+            schemas.SimulatedAssessment(
+                id=r.id,
+                title=r.title,
+                weight_pct=weight,
+                required_score=None if required is None else round(required, 2),
+            )
+        )
+    return out
+
+
+@timed("calc")
+def simulate_what_if(
+    rows: Iterable,
+    target: float,
+    *,
+    precision: float = 0.01,
+    budget_s: float = 0.05,
+    max_trials: int = 200_000,
+    seed: int | None = None,
+) -> schemas.WhatIfSimulation:
+    """Probability that the final weighted grade reaches ``target``.
+
+    ``rows`` are assessments (``id``, ``title``, ``weight_pct``,
+    ``score_pct``); the ungraded ones are simulated, in the order given.
+    """
+    if max_trials < 1:
+        raise ValueError(f"max_trials must be at least 1, got {max_trials}")
+    rows = list(rows)
+    graded = [r for r in rows if r.score_pct is not None]
+    remaining = [r for r in rows if r.score_pct is None]
+    dist = fit_scores(float(r.score_pct) for r in graded)
+    earned = sum(float(r.weight_pct) * float(r.score_pct) for r in graded)
+    weights = np.array([float(r.weight_pct) for r in remaining])
+    # Weighted points (weight x score) still needed from the remaining work
+    needed = target * 100.0 - earned
+
+    def result(successes: int, trials: int, stopped: str) -> schemas.WhatIfSimulation:
+        if stopped == "exact":
+            probability = float(successes)
+            low = high = probability
+        else:
+            probability = successes / trials
+            low, high = wilson_interval(successes, trials)
+        return schemas.WhatIfSimulation(
+            target=target,
+            probability=round(probability, 4),
+            ci_low=round(low, 4),
+            ci_high=round(high, 4),
+            trials=trials,
+            stopped=stopped,
+            expected_score=round(dist.mean * 100.0, 2),
+            score_sd=round(dist.sd * 100.0, 2),
+            assessments=_required_scores(remaining, needed, dist.mean * 100.0),
+        )
+
+    if needed <= 0:
+        return result(1, 0, "exact")
+    if needed > float(weights.sum()) * 100.0:
+        return result(0, 0, "exact")
+
+    rng = np.random.default_rng(seed)
+    chunk_trials = max(1, min(CHUNK_TRIALS, DRAWS_PER_CHUNK // len(weights)))
+    chunk_started = time.perf_counter()
+    deadline = chunk_started + budget_s
+    successes = trials = 0
+    while True:
+        chunk = min(chunk_trials, max_trials - trials)
+        scores = rng.beta(dist.alpha, dist.beta, size=(chunk, len(weights)))
+        points = scores @ (weights * 100.0)
+        successes += int(np.count_nonzero(points >= needed))
+        trials += chunk
+        low, high = wilson_interval(successes, trials)
+        if (high - low) / 2 <= precision:
+            return result(successes, trials, "converged")
+        if trials >= max_trials:
+            return result(successes, trials, "max_trials")
+        # Checked before drawing: stop if another chunk would overrun
+        now = time.perf_counter()
+        if now + (now - chunk_started) > deadline:
+            return result(successes, trials, "budget")
+        chunk_started = now
@@ -0,0 +1,190 @@
+"""Frontend build step and the static file mount that serves its output.
+
+    python -m backend.cli build-frontend
+
+:func:`build_frontend` copies ``frontend/`` to ``frontend/dist/`` with every
+asset renamed to ``<name>.<hash>.<ext>``, rewrites the references in the HTML
+pages, and writes ``.gz`` (and, with the ``brotli`` package, ``.br``)
+variants next to each text file. :class:`PrecompressedStaticFiles` serves the
+best variant the client accepts without compressing anything per request;
+fingerprinted files are cached for a year as immutable, HTML is revalidated.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import shutil
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+try:
+    import brotli
+except ImportError:  # .br variants are optional
+    brotli = None
+
+FRONTEND_DIR = Path(__file__).parent.parent / "frontend"
+DIST_DIRNAME = "dist"
+MANIFEST_NAME = "manifest.json"
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+COMPRESSIBLE_SUFFIXES = {".html", ".css", ".js", ".json", ".svg", ".txt", ".map"}
+# Preferred first; the suffix of each precompressed variant
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+_FINGERPRINT = re.compile(r"\.[0-9a-f]{10}\.[^./]+$")
+# href="styles.css", src="app.js?v=2": local references, query dropped
+_REFERENCE = re.compile(
+    r'(?P<attr>\b(?:href|src)=")(?P<path>[^"?#:]+)(?:[?#][^"]*)?"'
+)
+
+
+# -----------------------------
+# Build
+# -----------------------------
+def fingerprinted_name(relative: str, content: bytes) -> str:
+    digest = hashlib.sha256(content).hexdigest()[:10]
+    stem, dot, suffix = relative.rpartition(".")
+    return f"{stem}.{digest}.{suffix}" if dot else f"{relative}.{digest}"
+
+
+def _write_variants(path: Path, content: bytes) -> None:
+    if path.suffix not in COMPRESSIBLE_SUFFIXES:
+        return
+    variants = [(".gz", gzip.compress(content, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append((".br", brotli.compress(content, quality=11)))
+    for suffix, compressed in variants:
+        if len(compressed) < len(content):
+            path.with_name(path.name + suffix).write_bytes(compressed)
+
+
+def build_frontend(src: Path, out: Path | None = None) -> dict[str, str]:
+    """Build ``src`` into ``out`` (default ``src/dist``); return the manifest.
+
+    The manifest maps each source asset to its fingerprinted name. HTML pages
+    keep their names so ``/`` and bookmarks still resolve.
+    """
+    out = out or src / DIST_DIRNAME
+    if out.exists():
+        shutil.rmtree(out)
+    out.mkdir(parents=True)
+
+    files = sorted(
+        path
+        for path in src.rglob("*")
+        if path.is_file() and out not in path.parents and path.name != MANIFEST_NAME
+    )
+    manifest = {}
+    pages = []
+    for path in files:
+        relative = path.relative_to(src).as_posix()
+        if path.suffix == ".html":
+            pages.append((relative, path.read_text()))
+            continue
+        content = path.read_bytes()
+        manifest[relative] = fingerprinted_name(relative, content)
+        target = out / manifest[relative]
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+        _write_variants(target, content)
+
+    def rewrite(match: re.Match) -> str:
+        hashed = manifest.get(match["path"].removeprefix("./"))
+        if hashed is None:
+            return match[0]
+        return f'{match["attr"]}{hashed}"'
+
+    for relative, html in pages:
+        target = out / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        content = _REFERENCE.sub(rewrite, html).encode()
+        target.write_bytes(content)
+        _write_variants(target, content)
+
+    (out / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    return manifest
+
+
+# -----------------------------
+# Serve
+# -----------------------------
+def accepted_encodings(header: str | None) -> set[str]:
+    """Content codings the client accepts (``q=0`` excludes one)."""
+    accepted = set()
+    for part in (header or "").split(","):
+        coding, *params = part.strip().split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding and quality > 0:
+            accepted.add(coding.strip().lower())
+    if "*" in accepted:
+        accepted.update(name for name, _ in ENCODINGS)
+    return accepted
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """``StaticFiles`` over several directories, serving prebuilt variants.
+
+    ``directories`` are searched in order, so the built ``dist`` shadows the
+    sources when it exists and development works without a build. Missing
+    directories are skipped rather than reported.
+    """
+
+    def __init__(self, *, directories: list[str | os.PathLike], html: bool = False):
+        super().__init__(directory=directories[0], html=html, check_dir=False)
+        self.all_directories = [str(directory) for directory in directories]
+
+    async def check_config(self) -> None:
+        return None
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        full_path = str(full_path)
+        cache_control = IMMUTABLE if _FINGERPRINT.search(full_path) else REVALIDATE
+        headers = {"Cache-Control": cache_control}
+        path, stat = full_path, stat_result
+        if Path(full_path).suffix in COMPRESSIBLE_SUFFIXES:
+            headers["Vary"] = "Accept-Encoding"
+            accepted = accepted_encodings(request_headers.get("accept-encoding"))
+            for encoding, suffix in ENCODINGS:
+                if encoding not in accepted:
+                    continue
+                try:
+                    stat = os.stat(full_path + suffix)
+                except FileNotFoundError:
+                    continue
+                path = full_path + suffix
+                headers["Content-Encoding"] = encoding
+                break
+
+        response = FileResponse(
+            path,
+            status_code=status_code,
+            stat_result=stat,
+            headers=headers,
+            media_type=mimetypes.guess_type(full_path)[0] or "text/plain",
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
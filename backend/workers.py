@@ -0,0 +1,17 @@
+"""How many worker processes to run: shared by the server and batch jobs."""
+
+from __future__ import annotations
+
+import os
+
+
+def cpu_count() -> int:
+    """CPUs this process may run on (respects affinity and cgroup cpusets)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def worker_count(requested: int = 0) -> int:
+    """``requested`` workers, or one per CPU when it is 0."""
+    return requested if requested > 0 else cpu_count()
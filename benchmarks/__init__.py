@@ -0,0 +1,6 @@
+"""Performance benchmarks for the grade tracker.
+
+Each module is runnable on its own, e.g. ``python -m benchmarks.bench_stats``.
+They default to a throwaway SQLite file so they run offline; pass
+``--database-url`` to point them at Postgres instead.
+"""
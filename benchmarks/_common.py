@@ -0,0 +1,101 @@
+"""Shared helpers for the benchmark scripts."""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Iterator
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend import models
+
+SEED_CHUNK = 10_000
+
+
+def add_database_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--database-url",
+        default=None,
+        help="SQLAlchemy URL to benchmark against (default: temporary SQLite file)",
+    )
+
+
+def temp_sqlite_url() -> str:
+    directory = Path(tempfile.mkdtemp(prefix="gradebench-"))
+    return f"sqlite:///{directory / 'bench.db'}"
+
+
+def make_engine(database_url: str | None) -> Engine:
+    """Create an engine with a fresh ``assessments`` schema."""
+    url = database_url or temp_sqlite_url()
+    engine = create_engine(url)
+    models.Base.metadata.drop_all(bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def make_session(engine: Engine) -> Session:
+    return sessionmaker(bind=engine, autoflush=False)()
+
+
+def iter_fake_rows(n: int, graded_ratio: float = 0.5, seed: int = 0) -> Iterator[dict]:
+    rng = random.Random(seed)
+    start = date(2025, 1, 1)
+    for i in range(n):
+        graded = rng.random() < graded_ratio
+        yield {
+            "title": f"Assessment {i}",
+            "weight_pct": round(rng.uniform(0.0, 10.0), 2),
+            "due_date": start + timedelta(days=i % 365),
+            "score_pct": round(rng.uniform(40.0, 100.0), 2) if graded else None,
+        }
+
+
+def fake_rows(n: int, graded_ratio: float = 0.5, seed: int = 0) -> list[dict]:
+    return list(iter_fake_rows(n, graded_ratio, seed))
+
+
+def seed(engine: Engine, n: int, graded_ratio: float = 0.5) -> None:
+    """Insert ``n`` synthetic assessments in chunked executemany batches.
+
+    Rows are generated one chunk at a time, so seeding 1M rows stays small.
+    """
+    rows = iter_fake_rows(n, graded_ratio)
+    with engine.begin() as conn:
+        while chunk := list(itertools.islice(rows, SEED_CHUNK)):
+            conn.execute(insert(models.Assessment), chunk)
+
+
+def time_call(fn: Callable[[], object], repeat: int) -> list[float]:
+    """Return wall-clock seconds for ``repeat`` calls of ``fn`` (after one warm-up)."""
+    fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    return {
+        "min_ms": min(samples) * 1000.0,
+        "median_ms": statistics.median(samples) * 1000.0,
+        "max_ms": max(samples) * 1000.0,
+    }
+
+
+def print_table(title: str, results: dict[str, dict[str, float]]) -> None:
+    print(title)
+    for name, stats in results.items():
+        cols = "  ".join(f"{key}={value:10.3f}" for key, value in stats.items())
+        print(f"  {name:<24} {cols}")
@@ -0,0 +1,99 @@
+"""Minimal closed-loop HTTP load generator built on httpx.AsyncClient."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+import httpx
+
+
+@dataclass
+class LoadResult:
+    requests: int = 0
+    errors: int = 0
+    elapsed_s: float = 0.0
+    latencies_ms: list[float] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.elapsed_s if self.elapsed_s else 0.0
+
+    def percentile(self, pct: float) -> float:
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "requests": float(self.requests),
+            "errors": float(self.errors),
+            "rps": self.throughput,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+        }
+
+
+Call = Callable[..., Awaitable[httpx.Response]]
+Flow = Callable[[Call], Awaitable[None]]
+
+
+async def _drive_flow(
+    base_url: str, flow: Flow, concurrency: int, duration_s: float
+) -> LoadResult:
+    result = LoadResult()
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        deadline = time.perf_counter() + duration_s
+
+        async def call(method: str, path: str, **kwargs) -> httpx.Response | None:
+            """One timed request; ``None`` when it failed at the transport level."""
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, **kwargs)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                response, ok = None, False
+            result.latencies_ms.append((time.perf_counter() - started) * 1000.0)
+            result.requests += 1
+            result.errors += 0 if ok else 1
+            return response
+
+        async def worker() -> None:
+            while time.perf_counter() < deadline:
+                await flow(call)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        result.elapsed_s = time.perf_counter() - started
+    return result
+
+
+def drive_flow(
+    base_url: str, flow: Flow, concurrency: int, duration_s: float
+) -> LoadResult:
+    """Run ``flow`` in a loop on ``concurrency`` clients for ``duration_s`` seconds.
+
+    A flow issues one or more requests through the ``call`` it is given, so
+    multi-step scenarios (create, then delete what was created) are timed per
+    request.
+    """
+    return asyncio.run(_drive_flow(base_url, flow, concurrency, duration_s))
+
+
+def drive(
+    base_url: str, paths: list[str], concurrency: int, duration_s: float
+) -> LoadResult:
+    """Keep ``concurrency`` clients busy on ``paths`` for ``duration_s`` seconds."""
+    cycle = itertools.cycle(paths)
+
+    async def get_next(call: Call) -> None:
+        await call("GET", next(cycle))
+
+    return drive_flow(base_url, get_next, concurrency, duration_s)
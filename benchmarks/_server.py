@@ -0,0 +1,91 @@
+"""Run the app under a real uvicorn process for end-to-end benchmarks."""
+
+from __future__ import annotations
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator, NamedTuple
+
+import httpx
+
+STARTUP_TIMEOUT_S = 30.0
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_healthy(base_url: str, timeout: float = STARTUP_TIMEOUT_S) -> float:
+    """Poll /health and return the seconds it took to answer."""
+    started = time.perf_counter()
+    deadline = started + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1.0).status_code == 200:
+                return time.perf_counter() - started
+        except httpx.TransportError:
+            pass
+        time.sleep(0.05)
+    raise TimeoutError(f"server at {base_url} did not become healthy")
+
+
+class RunningServer(NamedTuple):
+    base_url: str
+    cold_start_s: float  # process start until /health first answered
+
+
+def _command(port: int, workers: int | None) -> list[str]:
+    if workers is None:
+        # Development server: one process, tables created in its startup hook
+        target = ["-m", "uvicorn", "backend.app:app"]
+    else:
+        target = ["-m", "backend.server", "--workers", str(workers)]
+    return [
+        sys.executable,
+        *target,
+        "--host",
+        "127.0.0.1",
+        "--port",
+        str(port),
+        "--log-level",
+        "warning",
+    ]
+
+
+@contextmanager
+def running_server(
+    database_url: str,
+    env: dict[str, str] | None = None,
+    args: list[str] | None = None,
+    workers: int | None = None,
+) -> Iterator[RunningServer]:
+    """Serve the app against ``database_url`` until the block exits.
+
+    Runs ``uvicorn backend.app:app``, or the production entry point
+    ``python -m backend.server`` with ``workers`` processes (0: one per CPU).
+    """
+    port = free_port()
+    child_env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "GRADEAPP_DATABASE_URL": database_url,
+        **(env or {}),
+    }
+    started = time.perf_counter()
+    proc = subprocess.Popen([*_command(port, workers), *(args or [])], env=child_env)
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        wait_until_healthy(base_url)
+        yield RunningServer(base_url, time.perf_counter() - started)
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
@@ -0,0 +1,73 @@
+"""Latency of the what-if allocation solver (``/stats/what-if/allocate``).
+
+    python -m benchmarks.bench_allocate --remaining 10 100 1000 --queries 2000
+
+Per gradebook size, reports the one-off cost of building the
+:class:`~backend.allocation.AllocationPlan` (sort and prefix sums, cached per
+data version by the API) and the per-query latency of :func:`allocate` on the
+cached plan, without bounds (a binary search) and with bounds on a tenth of
+the assessments (a linear pass in the presorted order).
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from types import SimpleNamespace
+
+from backend import schemas
+from backend.allocation import allocate, build_plan
+
+from ._common import print_table
+
+
+def fake_gradebook(graded: int, remaining: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [
+        SimpleNamespace(
+            id=i,
+            title=f"A{i}",
+            weight_pct=rng.uniform(0.5, 1.5) * 100.0 / (graded + remaining),
+            score_pct=round(rng.uniform(55.0, 95.0), 2) if i < graded else None,
+        )
+        for i in range(graded + remaining)
+    ]
+
+
+def per_query_us(plan, targets, bounds=()) -> float:
+    started = time.perf_counter()
+    for target in targets:
+        allocate(plan, target, bounds)
+    return (time.perf_counter() - started) / len(targets) * 1e6
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--remaining", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--graded", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(1)
+    targets = [rng.uniform(40.0, 100.0) for _ in range(args.queries)]
+    results = {}
+    for remaining in args.remaining:
+        rows = fake_gradebook(args.graded, remaining)
+        started = time.perf_counter()
+        plan = build_plan(rows)
+        build_us = (time.perf_counter() - started) * 1e6
+        bounds = [
+            schemas.ScoreBounds(id=item.id, min_score=20.0, max_score=90.0)
+            for item in plan.items[::10]
+        ]
+        results[f"remaining={remaining}"] = {
+            "build_plan_us": build_us,
+            "unbounded_us": per_query_us(plan, targets),
+            "bounded_us": per_query_us(plan, targets, bounds),
+        }
+    print_table(f"allocate, mean of {args.queries} targets", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Throughput of the sync (threadpool) and async (AsyncSession) stacks.
+
+Starts uvicorn once per mode against the same seeded SQLite file and keeps
+``--concurrency`` clients busy on the read endpoints:
+
+    python -m benchmarks.bench_async --concurrency 500 --duration 20
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from ._common import add_database_args, make_engine, print_table, seed, temp_sqlite_url
+from ._loadgen import drive
+from ._server import running_server
+
+READ_PATHS = ["/stats/current", "/stats/what-if?target=80", "/assessments?limit=50"]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=15.0)
+    add_database_args(parser)
+    args = parser.parse_args(argv)
+
+    database_url = args.database_url or temp_sqlite_url()
+    engine = make_engine(database_url)
+    seed(engine, args.rows)
+    engine.dispose()
+
+    results = {}
+    for mode, flag in (("sync", "false"), ("async", "true")):
+        env = {"GRADEAPP_ASYNC_DB": flag}
+        with running_server(database_url, env=env) as server:
+            base_url = server.base_url
+            drive(base_url, READ_PATHS, concurrency=10, duration_s=1.0)  # warm-up
+            load = drive(base_url, READ_PATHS, args.concurrency, args.duration)
+        results[mode] = load.summary()
+    print_table(f"{args.concurrency} concurrent clients, {args.rows} rows", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Compare the bulk endpoints' service path with N single-row calls.
+
+    python -m benchmarks.bench_bulk --items 200 --database-url postgresql://...
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import date
+
+from sqlalchemy import delete
+
+from backend import models, schemas, services
+
+from ._common import add_database_args, make_engine, make_session, print_table
+
+
+def _payloads(n: int) -> list[schemas.AssessmentIn]:
+    return [
+        schemas.AssessmentIn(title=f"Item {i}", weight_pct=0.5, due_date=date(2025, 9, 1))
+        for i in range(n)
+    ]
+
+
+def _timed(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000.0
+
+
+def run(items: int, database_url: str | None) -> dict[str, dict]:
+    engine = make_engine(database_url)
+    session = make_session(engine)
+    svc = services.AssessmentService(services.AssessmentRepository(session))
+    payloads = _payloads(items)
+    results: dict[str, dict] = {}
+
+    created: list[int] = []
+    single = {
+        "create_ms": _timed(
+            lambda: created.extend(svc.create_assessment(p).id for p in payloads)
+        ),
+        "update_ms": _timed(
+            lambda: [
+                svc.update_assessment(aid, schemas.AssessmentUpdate(score_pct=75.0))
+                for aid in created
+            ]
+        ),
+        "delete_ms": _timed(lambda: [svc.delete_assessment(aid) for aid in created]),
+    }
+    results["single_calls"] = single
+
+    session.execute(delete(models.Assessment))
+    session.commit()
+    session.expunge_all()
+
+    ids: list[int] = []
+
+    def updates() -> list[schemas.AssessmentBulkUpdate]:
+        return [schemas.AssessmentBulkUpdate(id=aid, score_pct=75.0) for aid in ids]
+
+    results["bulk"] = {
+        "create_ms": _timed(lambda: ids.extend(svc.bulk_create(payloads))),
+        "update_ms": _timed(lambda: svc.bulk_update(updates())),
+        "delete_ms": _timed(lambda: svc.bulk_delete(ids)),
+    }
+
+    session.close()
+    engine.dispose()
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, nargs="+", default=[200, 1000])
+    add_database_args(parser)
+    args = parser.parse_args(argv)
+
+    for n in args.items:
+        print_table(f"bulk vs single with {n} items", run(n, args.database_url))
+
+
+if __name__ == "__main__":
+    main()
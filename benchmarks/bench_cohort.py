@@ -0,0 +1,105 @@
+"""Cohort-wide stats: one ``current_stats``/``what_if`` call per student vs
+the columnar NumPy engine.
+
+    python -m benchmarks.bench_cohort --students 50000 --assessments 20
+
+Both paths see identical rows; the run fails if any student's result
+differs. Reports students/sec for each and the cohort's percentiles.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import time
+from types import SimpleNamespace
+
+from backend import calculations
+from backend.cohort import Cohort, percentiles
+
+from ._common import print_table
+
+QUANTILES = (10, 25, 50, 75, 90)
+
+
+def fake_cohort(students: int, assessments: int, graded_ratio: float, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        [
+            SimpleNamespace(
+                weight_pct=round(100.0 / assessments, 2),
+                score_pct=(
+                    round(rng.uniform(40.0, 100.0), 2)
+                    if rng.random() < graded_ratio
+                    else None
+                ),
+            )
+            for _ in range(assessments)
+        ]
+        for _ in range(students)
+    ]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--students", type=int, default=50_000)
+    parser.add_argument("--assessments", type=int, default=20)
+    parser.add_argument("--graded-ratio", type=float, default=0.6)
+    parser.add_argument("--target", type=float, default=80.0)
+    args = parser.parse_args(argv)
+
+    students = fake_cohort(args.students, args.assessments, args.graded_ratio)
+
+    started = time.perf_counter()
+    rows_path = [
+        (calculations.current_stats(rows), calculations.what_if(rows, args.target))
+        for rows in students
+    ]
+    row_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    cohort = Cohort.from_rows(students)
+    load_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    stats = cohort.current_stats()
+    result = cohort.what_if(args.target, stats)
+    columnar_seconds = time.perf_counter() - started
+
+    for i, (expected, what_if) in enumerate(rows_path):
+        required = result.required_avg[i]
+        assert (
+            stats.current_weighted[i] == expected.current_weighted
+            and stats.remaining_weight[i] == expected.remaining_weight
+            and (None if math.isnan(required) else required) == what_if.required_avg
+            and bool(result.attainable[i]) == what_if.attainable
+        ), f"student {i}: columnar result diverged from the row path"
+
+    n = args.students
+    print_table(
+        f"{n} students x {args.assessments} assessments",
+        {
+            "row_by_row": {"seconds": row_seconds, "students_per_s": n / row_seconds},
+            "numpy_cohort": {
+                "seconds": columnar_seconds,
+                "students_per_s": n / columnar_seconds,
+            },
+            "numpy_cohort_load": {
+                "seconds": load_seconds,
+                "students_per_s": n / load_seconds,
+            },
+        },
+    )
+    print_table(
+        "percentiles",
+        {
+            "current_weighted": percentiles(stats.current_weighted, QUANTILES),
+            f"required_avg@{args.target:g}": percentiles(
+                result.required_avg, QUANTILES
+            ),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""End-to-end HTTP benchmark of every route against a local uvicorn.
+
+Seeds a temporary SQLite file (offline, no services needed), then runs each
+scenario for ``--duration`` seconds at ``--concurrency`` clients and reports
+throughput and p50/p95/p99:
+
+    python -m benchmarks.bench_http --rows 1000 100000 --concurrency 20
+    python -m benchmarks.bench_http --rows 100000 --save-baseline
+    python -m benchmarks.bench_http --rows 100000 --baseline benchmarks/baselines/bench_http.json
+    python -m benchmarks.bench_http --rows 100000 --workers 0
+
+``--workers`` serves through the production entry point (``python -m
+backend.server``, 0 for one worker per CPU) instead of a single uvicorn. Each
+run also reports the server's cold start: process launch until ``/health``
+first answers.
+
+Results are written as JSON to ``--output``. The run exits non-zero when any
+scenario fails more requests than in the baseline, or its throughput drops or
+its p95 grows by more than ``--threshold`` (a fraction) against the baseline (``--baseline``, by default the committed
+``benchmarks/baselines/bench_http.json``) for the same row count. A row count
+missing from the baseline is skipped, unless ``--require-baseline`` is given,
+which makes it an error. A baseline recorded with other ``--concurrency``,
+``--duration`` or ``--workers`` is always an error. The committed baseline was
+recorded on a single CPU with ``--duration 2``; CI instead records one from the
+base commit on its own runner and compares the change against it:
+
+    python -m benchmarks.bench_http --rows 1000 --duration 2 --save-baseline --baseline base.json
+    python -m benchmarks.bench_http --rows 1000 --duration 2 --baseline base.json --require-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from ._common import add_database_args, make_engine, print_table, seed, temp_sqlite_url
+from ._loadgen import Call, Flow, drive_flow
+from ._server import running_server
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "bench_http.json"
+# Metrics compared against the baseline: (name, True when higher is better)
+GATED_METRICS = (("rps", True), ("p95_ms", False))
+# Flags that change the numbers: a baseline recorded with others is no baseline
+BASELINE_FLAGS = ("concurrency", "duration_s", "workers")
+
+_NEW_ROW = {"title": "Bench", "weight_pct": 1.0, "due_date": "2025-06-01"}
+BULK_SIZE = 10  # rows per bulk request
+# Routes that read the whole gradebook run at this many clients at most, or a
+# 100k-row gradebook times out the connection pool instead of measuring them
+WHOLE_GRADEBOOK = frozenset(
+    {"dashboard", "export", "stats_what_if_simulate", "stats_what_if_allocate"}
+)
+WHOLE_GRADEBOOK_CONCURRENCY = 2
+
+
+def _get(path: str) -> Flow:
+    async def flow(call: Call) -> None:
+        await call("GET", path)
+
+    return flow
+
+
+def scenarios(rows: int, rng: random.Random) -> dict[str, Flow]:
+    """Every route but the SSE stream, read-only ones first so writes do not skew them."""
+
+    def any_id() -> int:
+        return rng.randint(1, max(rows, 1))
+
+    async def get_one(call: Call) -> None:
+        await call("GET", f"/assessments/{any_id()}")
+
+    async def create(call: Call) -> None:
+        await call("POST", "/assessments", json=_NEW_ROW)
+
+    async def update(call: Call) -> None:
+        score = round(rng.uniform(0.0, 100.0), 2)
+        await call("PUT", f"/assessments/{any_id()}", json={"score_pct": score})
+
+    async def create_delete(call: Call) -> None:
+        created = await call("POST", "/assessments", json=_NEW_ROW)
+        if created is not None and created.status_code == 200:
+            await call("DELETE", f"/assessments/{created.json()['id']}")
+
+    async def allocate(call: Call) -> None:
+        await call("POST", "/stats/what-if/allocate", json={"target": 80})
+
+    async def bulk_create(call: Call) -> None:
+        await call("POST", "/assessments/bulk", json=[_NEW_ROW] * BULK_SIZE)
+
+    async def bulk_update(call: Call) -> None:
+        ids = rng.sample(range(1, max(rows, BULK_SIZE) + 1), BULK_SIZE)
+        body = [{"id": i, "score_pct": round(rng.uniform(0.0, 100.0), 2)} for i in ids]
+        await call("PUT", "/assessments/bulk", json=body)
+
+    async def bulk_create_delete(call: Call) -> None:
+        created = await call("POST", "/assessments/bulk", json=[_NEW_ROW] * BULK_SIZE)
+        if created is not None and created.status_code == 200:
+            ids = [item["id"] for item in created.json()]
+            await call("DELETE", "/assessments/bulk", json=ids)
+
+    return {
+        "health": _get("/health"),
+        "static_index": _get("/"),
+        "static_app_js": _get("/app.js"),
+        "dashboard": _get("/dashboard"),
+        "list_page": _get("/assessments?limit=50"),
+        "list_projection": _get("/assessments?limit=50&fields=title,score_pct"),
+        "export": _get("/assessments/export"),
+        "get_one": get_one,
+        "stats_current": _get("/stats/current"),
+        "stats_history": _get("/stats/history"),
+        "stats_what_if": _get("/stats/what-if?target=85"),
+        "stats_what_if_batch": _get("/stats/what-if/batch?target=70&target=80&target=90"),
+        "stats_what_if_simulate": _get("/stats/what-if/simulate?target=80&seed=1"),
+        "stats_what_if_allocate": allocate,
+        "stats_validate": _get("/stats/validate"),
+        "create": create,
+        "update": update,
+        "create_delete": create_delete,
+        "bulk_create": bulk_create,
+        "bulk_update": bulk_update,
+        "bulk_create_delete": bulk_create_delete,
+    }
+
+
+def run(
+    rows: int,
+    concurrency: int,
+    duration_s: float,
+    database_url: str | None,
+    selected: Callable[[str], bool],
+    workers: int | None = None,
+) -> tuple[dict[str, dict[str, float]], float]:
+    """Scenario results and the server's cold-start seconds."""
+    url = database_url or temp_sqlite_url()
+    engine = make_engine(url)
+    seed(engine, rows)
+    engine.dispose()
+
+    rng = random.Random(0)
+    results = {}
+    with running_server(url, workers=workers) as server:
+        base_url = server.base_url
+        for name, flow in scenarios(rows, rng).items():
+            if not selected(name):
+                continue
+            clients = concurrency
+            if name in WHOLE_GRADEBOOK:
+                clients = min(concurrency, WHOLE_GRADEBOOK_CONCURRENCY)
+            drive_flow(base_url, flow, concurrency=min(clients, 4), duration_s=0.5)
+            results[name] = drive_flow(base_url, flow, clients, duration_s).summary()
+    return results, server.cold_start_s
+
+
+def regressions(
+    current: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """Human readable lines for every gated metric worse than ``threshold``.
+
+    Errors are gated absolutely: a route that starts failing fast would
+    otherwise pass, its throughput even looking better.
+    """
+    found = []
+    for scenario, stats in current.items():
+        base = baseline.get(scenario)
+        old_errors, new_errors = (base or {}).get("errors", 0), stats.get("errors", 0)
+        if new_errors > old_errors:
+            found.append(f"{scenario}.errors: {old_errors:.0f} -> {new_errors:.0f}")
+        if base is None:
+            continue
+        for metric, higher_is_better in GATED_METRICS:
+            old, new = base.get(metric), stats.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            if worse > threshold:
+                found.append(
+                    f"{scenario}.{metric}: {old:.2f} -> {new:.2f} ({change:+.1%})"
+                )
+    return found
+
+
+def _load_json(path: Path) -> dict:
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 100_000])
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument(
+        "--only", nargs="+", default=None, metavar="SCENARIO", help="run a subset"
+    )
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--baseline", type=Path, default=None)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument(
+        "--require-baseline",
+        action="store_true",
+        help="fail instead of skipping row counts the baseline lacks",
+    )
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument(
+        "--workers", type=int, default=None, help="use backend.server (0: per CPU)"
+    )
+    add_database_args(parser)
+    args = parser.parse_args(argv)
+
+    def selected(name: str) -> bool:
+        return args.only is None or name in args.only
+
+    runs, cold_starts = {}, {}
+    for rows in args.rows:
+        results, cold_start_s = run(
+            rows,
+            args.concurrency,
+            args.duration,
+            args.database_url,
+            selected,
+            workers=args.workers,
+        )
+        print_table(f"{args.concurrency} clients, {rows} rows", results)
+        print(f"cold start: {cold_start_s * 1000:.0f} ms")
+        runs[str(rows)] = results
+        cold_starts[str(rows)] = cold_start_s
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "concurrency": args.concurrency,
+        "duration_s": args.duration,
+        "workers": args.workers,
+        "cold_start_s": cold_starts,
+        "runs": runs,
+    }
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    output = args.output or RESULTS_DIR / f"bench_http-{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"results written to {output}")
+
+    baseline_path = args.baseline or DEFAULT_BASELINE
+    if args.save_baseline:
+        # Merge so baselines for other row counts are kept
+        stored = _load_json(baseline_path)
+        stored.update(report, runs={**stored.get("runs", {}), **runs})
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(stored, indent=2))
+        print(f"baseline written to {baseline_path}")
+        return 0
+
+    stored = _load_json(baseline_path)
+    mismatched = [
+        f"{flag}={stored[flag]!r} (this run: {report[flag]!r})"
+        for flag in BASELINE_FLAGS
+        if flag in stored and stored[flag] != report[flag]
+    ]
+    if mismatched:
+        print(
+            f"ERROR {baseline_path} was recorded with {', '.join(mismatched)}",
+            file=sys.stderr,
+        )
+        return 2
+    baseline = stored.get("runs", {})
+    missing = [rows for rows in runs if rows not in baseline]
+    if missing:
+        message = f"no baseline in {baseline_path} for {', '.join(missing)} rows"
+        if args.require_baseline:
+            print(f"ERROR {message}", file=sys.stderr)
+            return 2
+        print(f"{message}; skipping them")
+    failures = [
+        f"{rows} rows: {line}"
+        for rows, results in runs.items()
+        for line in regressions(results, baseline.get(rows, {}), args.threshold)
+    ]
+    for line in failures:
+        print(f"REGRESSION {line}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Per-request cost of the metrics stack, measured in-process over raw ASGI.
+
+    python -m benchmarks.bench_instrumentation --requests 2000
+
+Runs the same route against apps built with metrics off, metrics on, and
+metrics plus the Server-Timing header, and reports the median microseconds
+per request for each and the overhead relative to the bare app. Also times
+one ``/metrics`` render, which happens per scrape, not per request.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy.orm import sessionmaker
+
+from backend.app import create_app, get_db
+from backend.settings import Settings
+
+from ._common import add_database_args, make_engine, print_table, seed
+
+MODES = {
+    "metrics_off": Settings(metrics_enabled=False, auto_create_tables=False),
+    "metrics_on": Settings(metrics_enabled=True, auto_create_tables=False),
+    "metrics_server_timing": Settings(
+        metrics_enabled=True, server_timing=True, auto_create_tables=False
+    ),
+}
+
+
+def _scope(path: str) -> dict:
+    raw_path, _, query = path.partition("?")
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "method": "GET",
+        "path": raw_path,
+        "raw_path": raw_path.encode(),
+        "query_string": query.encode(),
+        "headers": [],
+        "scheme": "http",
+        "server": ("bench", 80),
+        "client": ("bench", 1234),
+        "root_path": "",
+        "http_version": "1.1",
+    }
+
+
+async def _request_seconds(app, path: str, count: int) -> list[float]:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start" and message["status"] >= 400:
+            raise RuntimeError(f"{path} answered {message['status']}")
+
+    samples = []
+    for _ in range(count):
+        started = time.perf_counter()
+        await app(_scope(path), receive, send)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--path", default="/stats/current")
+    add_database_args(parser)
+    args = parser.parse_args(argv)
+
+    engine = make_engine(args.database_url)
+    seed(engine, args.rows)
+    factory = sessionmaker(bind=engine, autoflush=False)
+
+    def override_get_db():
+        with factory() as session:
+            yield session
+
+    results: dict[str, dict[str, float]] = {}
+    for mode, app_settings in MODES.items():
+        app = create_app(app_settings)
+        app.dependency_overrides[get_db] = override_get_db
+        asyncio.run(_request_seconds(app, args.path, 100))  # warm-up
+        samples = asyncio.run(_request_seconds(app, args.path, args.requests))
+        results[mode] = {"median_us": statistics.median(samples) * 1e6}
+
+    bare = results["metrics_off"]["median_us"]
+    for stats in results.values():
+        stats["overhead_us"] = stats["median_us"] - bare
+        stats["overhead_pct"] = 100.0 * stats["overhead_us"] / bare
+
+    scrape = asyncio.run(_request_seconds(app, "/metrics", 20))
+    results["metrics_scrape"] = {"median_us": statistics.median(scrape) * 1e6}
+    print_table(f"GET {args.path}, {args.requests} requests, {args.rows} rows", results)
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
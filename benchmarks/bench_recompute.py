@@ -0,0 +1,86 @@
+"""Scaling of the process-pool summary recompute from 1 to N workers.
+
+    python -m benchmarks.bench_recompute --tenants 2000 --assessments 20 --workers 1 2 4
+
+Seeds ``--tenants`` course gradebooks into a temporary SQLite file (pass
+``--database-url`` for Postgres, where writers do not serialize) and times
+``recompute_summaries`` for each worker count, reporting tenants/sec and the
+speedup over one worker.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import os
+
+from sqlalchemy import insert
+
+from backend import models
+from backend.recompute import recompute_summaries
+from backend.settings import Settings
+
+from ._common import (
+    SEED_CHUNK,
+    add_database_args,
+    iter_fake_rows,
+    make_engine,
+    print_table,
+    temp_sqlite_url,
+)
+
+
+def seed_tenants(engine, tenants: int, assessments: int) -> None:
+    """One course per tenant, each with ``assessments`` rows."""
+    with engine.begin() as conn:
+        conn.execute(
+            insert(models.Course), [{"name": f"Course {i}"} for i in range(tenants)]
+        )
+        rows = (
+            {**row, "course_id": i // assessments + 1}
+            for i, row in enumerate(iter_fake_rows(tenants * assessments))
+        )
+        while chunk := list(itertools.islice(rows, SEED_CHUNK)):
+            conn.execute(insert(models.Assessment), chunk)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tenants", type=int, default=2_000)
+    parser.add_argument("--assessments", type=int, default=20)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=None, help="default: 1..CPU count"
+    )
+    parser.add_argument("--batch-size", type=int, default=100)
+    add_database_args(parser)
+    args = parser.parse_args(argv)
+
+    url = args.database_url or temp_sqlite_url()
+    engine = make_engine(url)
+    seed_tenants(engine, args.tenants, args.assessments)
+    engine.dispose()
+
+    app_settings = Settings(database_url=url, auto_create_tables=False)
+    counts = args.workers or list(range(1, (os.cpu_count() or 1) + 1))
+    results = {}
+    for workers in counts:
+        status = recompute_summaries(
+            app_settings, workers=workers, batch_size=args.batch_size
+        )
+        results[f"workers={workers}"] = {
+            "seconds": status.elapsed_s,
+            "tenants_per_s": status.rate,
+            "rows_per_s": status.rows / status.elapsed_s,
+        }
+    base = results[f"workers={counts[0]}"]["seconds"]
+    for stats in results.values():
+        stats["speedup"] = base / stats["seconds"]
+    print_table(
+        f"{args.tenants} tenants x {args.assessments} assessments "
+        f"({os.cpu_count()} CPUs)",
+        results,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Rows/sec for the /assessments list: response-model path vs. row encoder.
+
+    python -m benchmarks.bench_serialization --rows 1000 10000 100000
+
+``orm_response_model`` reproduces what FastAPI did per request before: load
+ORM objects, validate each through ``AssessmentOut`` (``from_attributes``) and
+JSON-encode the dumped models. ``row_encoder`` is the current route: column
+rows turned into dicts and encoded by pydantic-core in one call.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+
+from pydantic import TypeAdapter
+
+from backend import schemas, services
+from backend.responses import RawJSONResponse
+
+from ._common import (
+    add_database_args,
+    make_engine,
+    make_session,
+    print_table,
+    seed,
+    summarize,
+    time_call,
+)
+
+_RESPONSE_MODEL = TypeAdapter(list[schemas.AssessmentOut])
+
+
+def _rows_per_sec(samples: list[float], rows: int) -> dict[str, float]:
+    stats = summarize(samples)
+    stats["rows_per_sec"] = rows / (stats["median_ms"] / 1000.0)
+    return stats
+
+
+def run(rows: int, repeat: int, database_url: str | None) -> dict[str, dict]:
+    engine = make_engine(database_url)
+    seed(engine, rows)
+    session = make_session(engine)
+    repo = services.AssessmentRepository(session)
+    svc = services.AssessmentService(repo)
+
+    def orm_response_model() -> bytes:
+        session.expunge_all()
+        models_ = _RESPONSE_MODEL.validate_python(repo.list(), from_attributes=True)
+        content = _RESPONSE_MODEL.dump_python(models_, mode="json")
+        return json.dumps(content, separators=(",", ":")).encode()
+
+    def row_encoder() -> bytes:
+        page, _ = svc.list_page(None)
+        return RawJSONResponse(page).body
+
+    assert json.loads(orm_response_model()) == json.loads(row_encoder())
+    results = {
+        "orm_response_model": _rows_per_sec(time_call(orm_response_model, repeat), rows),
+        "row_encoder": _rows_per_sec(time_call(row_encoder, repeat), rows),
+    }
+    session.close()
+    engine.dispose()
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    add_database_args(parser)
+    args = parser.parse_args(argv)
+
+    for n in args.rows:
+        print_table(f"/assessments with {n} rows", run(n, args.repeat, args.database_url))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Latency of the Monte Carlo what-if (``/stats/what-if/simulate``).
+
+    python -m benchmarks.bench_simulate --remaining 1 5 20 50 --requests 200
+
+Times :func:`backend.simulation.simulate_what_if` on fake gradebooks with
+``--remaining`` ungraded assessments, at the app's default time budget and
+trial cap, and reports p50/p99 latency, trials per run and how runs stopped.
+p99 should stay near the budget (plus one chunk of trials) at every size.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+from backend.settings import Settings
+from backend.simulation import simulate_what_if
+
+from ._common import print_table
+
+
+def fake_gradebook(graded: int, remaining: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    weight = 100.0 / (graded + remaining)
+    return [
+        SimpleNamespace(
+            id=i,
+            title=f"A{i}",
+            weight_pct=weight,
+            score_pct=round(rng.uniform(55.0, 95.0), 2) if i < graded else None,
+        )
+        for i in range(graded + remaining)
+    ]
+
+
+def quantile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--remaining", type=int, nargs="+", default=[1, 5, 20, 50])
+    parser.add_argument("--graded", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--precision", type=float, default=0.01)
+    args = parser.parse_args(argv)
+
+    defaults = Settings()
+    limits = {
+        "budget_s": defaults.what_if_simulation_budget_ms / 1000.0,
+        "max_trials": defaults.what_if_simulation_max_trials,
+    }
+    results = {}
+    for remaining in args.remaining:
+        rows = fake_gradebook(args.graded, remaining)
+        latencies, trials, stopped = [], [], Counter()
+        for i in range(args.requests):
+            # Targets around the expected grade are the slowest to converge
+            target = 70.0 + (i % 11)
+            started = time.perf_counter()
+            result = simulate_what_if(
+                rows, target, precision=args.precision, seed=i, **limits
+            )
+            latencies.append((time.perf_counter() - started) * 1000)
+            trials.append(result.trials)
+            stopped[result.stopped] += 1
+        results[f"remaining={remaining}"] = {
+            "p50_ms": quantile(latencies, 0.50),
+            "p99_ms": quantile(latencies, 0.99),
+            "mean_trials": statistics.fmean(trials),
+            **dict(sorted(stopped.items())),
+        }
+    print_table(
+        f"{args.requests} simulations each, budget "
+        f"{defaults.what_if_simulation_budget_ms:g} ms, precision {args.precision:g}",
+        results,
+    )
+
+
+if __name__ == "__main__":
+    main()
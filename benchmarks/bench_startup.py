@@ -0,0 +1,130 @@
+"""Startup cost: importing the app, building it, and a server's cold start.
+
+    python -m benchmarks.bench_startup --runs 5
+    python -m benchmarks.bench_startup --workers 0 --cold-start-budget-ms 4000
+
+Each measurement is the median of ``--runs`` fresh processes:
+
+- ``import_ms``: ``import backend.app`` (which must not build an app or engine)
+- ``create_app_ms``: one ``create_app()`` call after that import
+- ``cold_start_ms``: server launch until ``/health`` first answers, under a
+  single uvicorn or, with ``--workers``, the production entry point
+
+Exits non-zero when any median is over its budget, so CI can gate on it.
+``python -m backend.cli importtime`` shows where the import time goes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from ._common import add_database_args, make_engine, print_table, seed, temp_sqlite_url
+from ._server import running_server
+
+# Generous for CI runners; a laptop is well under half of each
+DEFAULT_BUDGETS_MS = {
+    "import_ms": 1500.0,
+    "create_app_ms": 250.0,
+    "cold_start_ms": 3000.0,
+}
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import backend.app
+imported = time.perf_counter()
+backend.app.create_app()
+built = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "create_app_ms": (built - imported) * 1000,
+    "lazy": sys.modules["backend.db"]._engine is None,
+}))
+"""
+
+
+def probe() -> dict:
+    """Import and build the app in a fresh interpreter."""
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True
+    )
+    return json.loads(out.stdout)
+
+
+def over_budget(results: dict[str, float], budgets: dict[str, float]) -> list[str]:
+    return [
+        f"{name}: {results[name]:.0f} ms > {budget:.0f} ms"
+        for name, budget in budgets.items()
+        if name in results and results[name] > budget
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--rows", type=int, default=1_000)
+    parser.add_argument(
+        "--workers", type=int, default=None, help="use backend.server (0: per CPU)"
+    )
+    parser.add_argument(
+        "--import-budget-ms", type=float, default=DEFAULT_BUDGETS_MS["import_ms"]
+    )
+    parser.add_argument(
+        "--create-app-budget-ms",
+        type=float,
+        default=DEFAULT_BUDGETS_MS["create_app_ms"],
+    )
+    parser.add_argument(
+        "--cold-start-budget-ms",
+        type=float,
+        default=DEFAULT_BUDGETS_MS["cold_start_ms"],
+    )
+    add_database_args(parser)
+    args = parser.parse_args(argv)
+
+    probes = [probe() for _ in range(args.runs)]
+    if not all(sample["lazy"] for sample in probes):
+        print("FAIL importing backend.app built the database engine")
+        return 1
+
+    url = args.database_url or temp_sqlite_url()
+    engine = make_engine(url)
+    seed(engine, args.rows)
+    engine.dispose()
+    cold_starts = []
+    for _ in range(args.runs):
+        with running_server(url, workers=args.workers) as server:
+            cold_starts.append(server.cold_start_s * 1000)
+
+    results = {
+        "import_ms": statistics.median(s["import_ms"] for s in probes),
+        "create_app_ms": statistics.median(s["create_app_ms"] for s in probes),
+        "cold_start_ms": statistics.median(cold_starts),
+    }
+    budgets = {
+        "import_ms": args.import_budget_ms,
+        "create_app_ms": args.create_app_budget_ms,
+        "cold_start_ms": args.cold_start_budget_ms,
+    }
+    label = "uvicorn" if args.workers is None else f"backend.server x{args.workers}"
+    print_table(
+        f"startup, median of {args.runs} ({label})",
+        {
+            name: {"median_ms": value, "budget_ms": budgets[name]}
+            for name, value in results.items()
+        },
+    )
+    failures = over_budget(results, budgets)
+    for line in failures:
+        print(f"OVER BUDGET {line}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Compare the row-by-row, SQL aggregate and grade_summary stats paths.
+
+    python -m benchmarks.bench_stats --rows 1000 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+
+from backend import calculations, services
+
+from ._common import (
+    add_database_args,
+    make_engine,
+    make_session,
+    print_table,
+    seed,
+    summarize,
+    time_call,
+)
+
+
+def same_stats(a: tuple, b: tuple) -> bool:
+    """Equal up to one rounding step: SQL and Python sum in different orders."""
+    for left, right in zip(a, b):
+        for key, value in left.model_dump().items():
+            other = getattr(right, key)
+            if isinstance(value, float):
+                if not math.isclose(value, other, abs_tol=0.011):
+                    return False
+            elif key != "message" and value != other:
+                return False
+    return True
+
+
+def run(rows: int, repeat: int, database_url: str | None) -> dict[str, dict]:
+    engine = make_engine(database_url)
+    seed(engine, rows)
+    session = make_session(engine)
+    repo = services.AssessmentRepository(session)
+
+    def row_by_row():
+        session.expunge_all()
+        rows_ = repo.list(ordered=False)
+        return (
+            calculations.current_stats(rows_),
+            calculations.validate_weights(rows_),
+        )
+
+    def from_totals(load):
+        def stats():
+            agg = load()
+            return (
+                calculations.current_stats_from_totals(agg),
+                calculations.validate_weights_from_totals(agg),
+            )
+
+        return stats
+
+    aggregate = from_totals(repo.aggregate_totals)
+    summary = from_totals(repo.totals)  # first call backfills the summary row
+    assert same_stats(row_by_row(), aggregate()), "aggregate diverged from row path"
+    assert same_stats(summary(), aggregate()), "summary row diverged from aggregate"
+    results = {
+        "row_by_row": summarize(time_call(row_by_row, repeat)),
+        "sql_aggregate": summarize(time_call(aggregate, repeat)),
+        "summary_lookup": summarize(time_call(summary, repeat)),
+    }
+    session.close()
+    engine.dispose()
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=10)
+    add_database_args(parser)
+    args = parser.parse_args(argv)
+
+    for n in args.rows:
+        print_table(f"/stats with {n} rows", run(n, args.repeat, args.database_url))
+
+
+if __name__ == "__main__":
+    main()
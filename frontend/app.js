@@ -71,9 +71,24 @@ async function fetchJSON(url, opts = {}) {
 }
 
 
-async function load() {
-  // List assessments
-  const rows = await fetchJSON(`${API}/assessments`);
+// --- Local copy of the rows; we patch the table, then refetch the dashboard ---
+let rows = [];
+
+function byDueDate(a, b) {
+  return a.due_date.localeCompare(b.due_date) || a.id - b.id;
+}
+
+function upsertRow(row) {
+  rows = rows.filter((r) => r.id !== row.id).concat(row).sort(byDueDate);
+  renderRows();
+}
+
+function removeRow(id) {
+  rows = rows.filter((r) => r.id !== id);
+  renderRows();
+}
+
+function renderRows() {
   els.tableBody.innerHTML = "";
   rows.forEach((r) => {
     const tr = document.createElement("tr");
@@ -98,18 +113,41 @@ async function load() {
     tr.innerHTML = `<td colspan="5">No assessments yet — add your first one above ✨</td>`;
     els.tableBody.appendChild(tr);
   }
+}
 
-
-  // Stats
-  const stats = await fetchJSON(`${API}/stats/current`);
+function renderStats(stats, v) {
   els.current.textContent = stats.current_weighted.toFixed(2);
   els.remaining.textContent = stats.remaining_weight.toFixed(2);
 
   // Weight validation
-  const v = await fetchJSON(`${API}/stats/validate`);
   els.weightsMsg.textContent = v.message;
 }
 
+async function load() {
+  // One round trip: assessments, current stats and weight validation
+  const data = await fetchJSON(`${API}/dashboard`);
+  rows = data.assessments;
+  renderRows();
+  renderStats(data.stats, data.validation);
+}
+
+// Stats and validation arrive over SSE after every committed write (ours or
+// another tab's); EventSource reconnects by itself and gets a fresh snapshot.
+// Events only come from the server worker that handled the write, so with
+// several workers our own writes may never reach this stream: refresh()
+// refetches after each of them.
+function subscribe() {
+  const source = new EventSource(`${API}/stats/stream`);
+  source.addEventListener("stats", (e) => {
+    const { stats, validation } = JSON.parse(e.data);
+    renderStats(stats, validation);
+  });
+}
+
+function refresh() {
+  load().catch((err) => console.error("dashboard refresh failed:", err));
+}
+
 
 // Create (Add / Update button)
 els.addBtn.onclick = async () => {
@@ -125,29 +163,34 @@ els.addBtn.onclick = async () => {
     return;
   }
 
+  let saved;
   if (editingId == null) {
-    await fetchJSON(`${API}/assessments`, {
+    saved = await fetchJSON(`${API}/assessments`, {
       method: "POST",
       body: JSON.stringify(payload),
     });
   } else {
-    await fetchJSON(`${API}/assessments/${editingId}`, {
+    saved = await fetchJSON(`${API}/assessments/${editingId}`, {
       method: "PUT",
       body: JSON.stringify(payload),
     });
   }
 
-  await load();
+  upsertRow(saved);
   clearEditingMode();
+  refresh();
 };
 
 
 // Delete via event delegation
 document.querySelector("#table").onclick = async (e) => {
   if (e.target.classList.contains("del")) {
-    const id = e.target.getAttribute("data-id");
-    await fetch(`${API}/assessments/${id}`, { method: "DELETE" });
-    await load();
+    const id = Number(e.target.getAttribute("data-id"));
+    const r = await fetch(`${API}/assessments/${id}`, { method: "DELETE" });
+    if (r.ok) {
+      removeRow(id);
+      refresh();
+    }
   }
 };
 // Edit via event delegation
@@ -172,3 +215,4 @@ els.calcBtn.onclick = async () => {
 };
 
 load();
+subscribe();
@@ -27,6 +27,8 @@ TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engin
 def _create_schema():
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    app.state.stats_cache.clear()
+    app.state.allocation_plans.clear()
     yield
 
 
@@ -0,0 +1,140 @@
+# tests/test_api_allocate.py
+import pytest
+
+from backend import allocation, schemas
+from backend.app import app
+
+
+def seed(client):
+    """51 points earned; Final (40%), Project (15%) and Quiz (5%) are open."""
+    ids = {}
+    for title, weight, due, score in [
+        ("A1", 20.0, "2025-09-01", 90.0),
+        ("A2", 20.0, "2025-09-15", 90.0),
+        ("Quiz", 5.0, "2025-10-01", None),
+        ("Project", 15.0, "2025-11-01", None),
+        ("Final", 40.0, "2025-12-01", None),
+    ]:
+        r = client.post(
+            "/assessments",
+            json={"title": title, "weight_pct": weight, "due_date": due, "score_pct": score},
+        )
+        ids[title] = r.json()["id"]
+    return ids
+
+
+def allocate(client, target, bounds=(), status=200):
+    r = client.post("/stats/what-if/allocate", json={"target": target, "bounds": list(bounds)})
+    assert r.status_code == status, r.text
+    return r.json()
+
+
+def scores(body):
+    return {row["title"]: row["score"] for row in body["assessments"]}
+
+
+def test_heaviest_assessment_is_raised_first(client):
+    seed(client)  # 36 points earned
+    body = allocate(client, 60)
+    assert body["feasible"] is True
+    # 24 points needed: 60% on the 40% final alone
+    assert scores(body) == {"Quiz": 0.0, "Project": 0.0, "Final": 60.0}
+    assert body["grade"] == 60.0
+    # Listed by due date, like /assessments
+    assert [row["title"] for row in body["assessments"]] == ["Quiz", "Project", "Final"]
+
+
+def test_spills_over_to_lighter_assessments(client):
+    seed(client)
+    body = allocate(client, 80)  # 44 needed: 40 from the final, 4 from the project
+    assert scores(body) == {"Quiz": 0.0, "Project": 26.67, "Final": 100.0}
+    assert body["feasible"] is True and body["grade"] >= 80
+
+
+def test_secured_and_unreachable_targets(client):
+    seed(client)
+    secured = allocate(client, 30)
+    assert secured["feasible"] is True
+    assert set(scores(secured).values()) == {0.0}
+    unreachable = allocate(client, 97)  # 36 + 60 at most
+    assert unreachable["feasible"] is False
+    assert set(scores(unreachable).values()) == {100.0}
+    assert unreachable["grade"] == 96.0
+
+
+def test_bounds_are_respected(client):
+    ids = seed(client)
+    body = allocate(
+        client,
+        80,
+        [
+            {"id": ids["Final"], "max_score": 85},
+            {"id": ids["Quiz"], "min_score": 50},
+        ],
+    )
+    # Quiz floor gives 2.5, the capped final 34, the project the remaining 7.5
+    assert scores(body) == {"Quiz": 50.0, "Project": 50.0, "Final": 85.0}
+    assert body["feasible"] is True
+
+    capped = allocate(client, 95, [{"id": ids["Final"], "max_score": 85}])
+    assert capped["feasible"] is False
+    assert scores(capped) == {"Quiz": 100.0, "Project": 100.0, "Final": 85.0}
+
+
+@pytest.mark.parametrize(
+    "bound",
+    [
+        {"id": 999},
+        {"title": "A1"},  # graded: not allocatable
+        {"title": "Final", "min_score": 90, "max_score": 80},
+    ],
+)
+def test_invalid_bounds(client, bound):
+    ids = seed(client)
+    if "title" in bound:
+        bound = {"id": ids[bound.pop("title")], **bound}
+    allocate(client, 80, [bound], status=422)
+
+
+def test_out_of_range_bound_is_rejected(client):
+    ids = seed(client)
+    allocate(client, 80, [{"id": ids["Final"], "max_score": 120}], status=422)
+
+
+def test_plan_is_reused_until_the_data_changes(client):
+    ids = seed(client)
+    plans = app.state.allocation_plans
+    misses, hits = plans.misses, plans.hits
+    allocate(client, 60)
+    allocate(client, 70)
+    assert (plans.misses - misses, plans.hits - hits) == (1, 1)
+
+    client.put(f"/assessments/{ids['Final']}", json={"score_pct": 70.0})
+    body = allocate(client, 70)
+    assert plans.misses - misses == 2
+    # 36 + 28 earned; 6 points left over Project (15%) then Quiz (5%)
+    assert scores(body) == {"Quiz": 0.0, "Project": 40.0}
+
+
+def test_course_scoped_allocation(client):
+    course = client.post("/courses", json={"name": "Math"}).json()["id"]
+    client.post(
+        f"/courses/{course}/assessments",
+        json={"title": "Exam", "weight_pct": 50.0, "due_date": "2025-12-01"},
+    )
+    r = client.post(f"/courses/{course}/stats/what-if/allocate", json={"target": 40})
+    assert r.status_code == 200
+    assert scores(r.json()) == {"Exam": 80.0}
+
+
+def test_prefix_sums_match_a_linear_scan():
+    rows = [
+        type("Row", (), {"id": i, "title": f"A{i}", "weight_pct": w, "score_pct": None})
+        for i, w in enumerate([5.0, 20.0, 0.0, 20.0, 10.0])
+    ]
+    plan = allocation.build_plan(rows)
+    assert [plan.items[i].weight_pct for i in plan.order] == [20.0, 20.0, 10.0, 5.0, 0.0]
+    for target in range(0, 60, 3):
+        fast = allocation.allocate(plan, target)
+        bounded = allocation.allocate(plan, target, [schemas.ScoreBounds(id=2)])
+        assert fast == bounded
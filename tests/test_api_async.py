@@ -0,0 +1,160 @@
+# tests/test_api_async.py
+import pytest
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import NullPool  # noqa: E402
+
+from backend import db  # noqa: E402
+from backend.app import create_app, get_async_db, get_db  # noqa: E402
+from backend.models import Base  # noqa: E402
+from backend.settings import Settings  # noqa: E402
+
+
+@pytest.fixture
+def async_client(tmp_path):
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    sync_engine = create_engine(url)
+    Base.metadata.create_all(bind=sync_engine)
+    sync_factory = sessionmaker(bind=sync_engine)
+    factory = async_sessionmaker(
+        create_async_engine(db.async_url(url), poolclass=NullPool),
+        expire_on_commit=False,
+    )
+
+    async def override_get_async_db():
+        async with factory() as session:
+            yield session
+
+    def override_get_db():
+        with sync_factory() as session:
+            yield session
+
+    app = create_app(Settings(async_db=True, auto_create_tables=False))
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    # Bulk, export and course routes stay on the sync stack
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as client:
+        yield client
+
+
+def test_async_url_swaps_drivers():
+    assert db.async_url("sqlite:///./x.db") == "sqlite+aiosqlite:///./x.db"
+    assert db.async_url("postgresql+psycopg2://u:p@h/d") == (
+        "postgresql+asyncpg://u:p@h/d"
+    )
+
+
+def test_async_crud_and_stats(async_client):
+    client = async_client
+    created = client.post(
+        "/assessments",
+        json={"title": "Midterm", "weight_pct": 40.0, "due_date": "2025-03-01"},
+    ).json()
+    client.post(
+        "/assessments",
+        json={
+            "title": "Quiz",
+            "weight_pct": 20.0,
+            "due_date": "2025-02-01",
+            "score_pct": 90.0,
+        },
+    )
+
+    r = client.put(f"/assessments/{created['id']}", json={"score_pct": 70.0})
+    assert r.status_code == 200
+    assert r.json()["score_pct"] == 70.0
+
+    rows = client.get("/assessments").json()
+    assert [row["title"] for row in rows] == ["Quiz", "Midterm"]
+
+    stats = client.get("/stats/current").json()
+    assert stats == {"current_weighted": 46.0, "weight_done": 60.0, "remaining_weight": 40.0}
+    assert client.get("/stats/what-if", params={"target": 66}).json()["required_avg"] == 50.0
+
+    dashboard = client.get("/dashboard").json()
+    assert dashboard["assessments"] == rows
+    assert dashboard["validation"]["total_weight"] == 60.0
+
+    assert client.delete(f"/assessments/{created['id']}").status_code == 200
+    assert client.get(f"/assessments/{created['id']}").status_code == 404
+    assert client.get("/stats/current").json()["weight_done"] == 20.0
+
+
+def test_async_course_scope(async_client):
+    client = async_client
+    course = client.post("/courses", json={"name": "Chem"}).json()["id"]
+    r = client.post(
+        f"/courses/{course}/assessments",
+        json={"title": "Lab", "weight_pct": 25.0, "due_date": "2025-03-01", "score_pct": 80},
+    )
+    assert r.status_code == 200
+    assert client.get(f"/courses/{course}/stats/current").json()["current_weighted"] == 20.0
+    assert client.get("/assessments").json() == []
+    assert client.get("/courses/999/assessments").status_code == 404
+
+
+def test_async_conditional_get(async_client):
+    client = async_client
+    etag = client.get("/stats/current").headers["etag"]
+    assert client.get("/stats/current", headers={"If-None-Match": etag}).status_code == 304
+    client.post(
+        "/assessments",
+        json={"title": "Quiz", "weight_pct": 10.0, "due_date": "2025-02-01"},
+    )
+    r = client.get("/stats/current", headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.headers["etag"] != etag
+
+
+def test_async_what_if_simulation(async_client):
+    client = async_client
+    client.post(
+        "/assessments",
+        json={"title": "Quiz", "weight_pct": 50.0, "due_date": "2025-02-01", "score_pct": 80},
+    )
+    client.post(
+        "/assessments",
+        json={"title": "Exam", "weight_pct": 50.0, "due_date": "2025-03-01"},
+    )
+    params = {"target": 75, "seed": 3, "precision": 0.05}
+    body = client.get("/stats/what-if/simulate", params=params).json()
+    assert body == client.get("/stats/what-if/simulate", params=params).json()
+    assert body["stopped"] == "converged"
+    assert body["assessments"][0]["required_score"] == 70.0
+
+
+def test_async_what_if_allocation(async_client):
+    client = async_client
+    client.post(
+        "/assessments",
+        json={"title": "Lab", "weight_pct": 20.0, "due_date": "2025-02-01"},
+    )
+    exam = client.post(
+        "/assessments",
+        json={"title": "Exam", "weight_pct": 60.0, "due_date": "2025-03-01"},
+    ).json()["id"]
+    body = client.post("/stats/what-if/allocate", json={"target": 66}).json()
+    assert [row["score"] for row in body["assessments"]] == [30.0, 100.0]
+    bounds = [{"id": exam, "max_score": 90}]
+    body = client.post(
+        "/stats/what-if/allocate", json={"target": 66, "bounds": bounds}
+    ).json()
+    assert [row["score"] for row in body["assessments"]] == [60.0, 90.0]
+
+
+def test_async_stats_history(async_client):
+    client = async_client
+    assert client.get("/stats/history").json()[-1]["current_weighted"] == 0.0
+    for score in (60.0, 80.0):
+        client.post(
+            "/assessments",
+            json={"title": "Quiz", "weight_pct": 50.0, "due_date": "2025-02-01", "score_pct": score},
+        )
+    history = client.get("/stats/history").json()
+    assert [point["current_weighted"] for point in history] == [0.0, 30.0, 70.0]
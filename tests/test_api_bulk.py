@@ -0,0 +1,76 @@
+# tests/test_api_bulk.py
+
+
+def items(n, **overrides):
+    rows = []
+    for i in range(n):
+        row = {"title": f"HW{i}", "weight_pct": 10.0, "due_date": f"2025-02-{10 + i}"}
+        row.update(overrides)
+        rows.append(row)
+    return rows
+
+
+def test_bulk_create_returns_per_item_results(client):
+    r = client.post("/assessments/bulk", json=items(3))
+    assert r.status_code == 200, r.text
+    results = r.json()
+    assert [res["index"] for res in results] == [0, 1, 2]
+    assert {res["status"] for res in results} == {"created"}
+
+    listed = client.get("/assessments").json()
+    assert [row["id"] for row in listed] == [res["id"] for res in results]
+    assert [row["title"] for row in listed] == ["HW0", "HW1", "HW2"]
+
+
+def test_bulk_create_is_all_or_nothing_on_validation(client):
+    rows = items(3)
+    rows[2]["weight_pct"] = 500
+    r = client.post("/assessments/bulk", json=rows)
+    assert r.status_code == 422
+    assert client.get("/assessments").json() == []
+
+
+def test_bulk_update(client):
+    ids = [res["id"] for res in client.post("/assessments/bulk", json=items(2)).json()]
+    r = client.put(
+        "/assessments/bulk",
+        json=[{"id": ids[0], "score_pct": 90.0}, {"id": ids[1], "title": "Renamed"}],
+    )
+    assert r.status_code == 200, r.text
+    assert [res["status"] for res in r.json()] == ["updated", "updated"]
+
+    first, second = client.get("/assessments").json()
+    assert first["score_pct"] == 90.0 and first["title"] == "HW0"
+    assert second["title"] == "Renamed" and second["score_pct"] is None
+
+    stats = client.get("/stats/current").json()
+    assert stats["weight_done"] == 10.0
+
+
+def test_bulk_update_missing_id_applies_nothing(client):
+    ids = [res["id"] for res in client.post("/assessments/bulk", json=items(1)).json()]
+    r = client.put(
+        "/assessments/bulk",
+        json=[{"id": ids[0], "score_pct": 50.0}, {"id": 999, "score_pct": 50.0}],
+    )
+    assert r.status_code == 404
+    assert r.json()["detail"] == [{"id": 999, "error": "Assessment not found"}]
+    assert client.get(f"/assessments/{ids[0]}").json()["score_pct"] is None
+
+
+def test_bulk_update_rejects_duplicate_ids(client):
+    ids = [res["id"] for res in client.post("/assessments/bulk", json=items(1)).json()]
+    r = client.put("/assessments/bulk", json=[{"id": ids[0]}, {"id": ids[0]}])
+    assert r.status_code == 422
+
+
+def test_bulk_delete(client):
+    ids = [res["id"] for res in client.post("/assessments/bulk", json=items(3)).json()]
+    r = client.request("DELETE", "/assessments/bulk", json=ids[:2])
+    assert r.status_code == 200
+    assert [res["status"] for res in r.json()] == ["deleted", "deleted"]
+    assert [row["id"] for row in client.get("/assessments").json()] == ids[2:]
+
+    r = client.request("DELETE", "/assessments/bulk", json=[ids[2], 12345])
+    assert r.status_code == 404
+    assert len(client.get("/assessments").json()) == 1
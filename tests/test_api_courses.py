@@ -0,0 +1,75 @@
+# tests/test_api_courses.py
+
+
+def make_course(client, name, student_id=None):
+    r = client.post("/courses", json={"name": name, "student_id": student_id})
+    assert r.status_code == 200, r.text
+    return r.json()["id"]
+
+
+def add(client, prefix, title, weight, score=None):
+    r = client.post(
+        f"{prefix}/assessments",
+        json={
+            "title": title,
+            "weight_pct": weight,
+            "due_date": "2025-04-01",
+            "score_pct": score,
+        },
+    )
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def test_students_and_courses(client):
+    student = client.post("/students", json={"name": "Ada"}).json()
+    math = make_course(client, "Math", student["id"])
+    make_course(client, "Art")
+
+    assert client.get("/students").json() == [student]
+    assert [c["name"] for c in client.get("/courses").json()] == ["Math", "Art"]
+    owned = client.get("/courses", params={"student_id": student["id"]}).json()
+    assert [c["id"] for c in owned] == [math]
+    assert client.get(f"/courses/{math}").json()["name"] == "Math"
+    assert client.get("/courses/999").status_code == 404
+    assert client.post("/courses", json={"name": "X", "student_id": 42}).status_code == 404
+
+
+def test_course_scoped_reads_and_stats_are_isolated(client):
+    math, art = make_course(client, "Math"), make_course(client, "Art")
+    add(client, f"/courses/{math}", "Exam", 60.0, 90.0)
+    art_row = add(client, f"/courses/{art}", "Portfolio", 50.0, 50.0)
+    add(client, "", "Legacy", 10.0, 100.0)
+
+    assert [r["title"] for r in client.get(f"/courses/{math}/assessments").json()] == [
+        "Exam"
+    ]
+    assert [r["title"] for r in client.get("/assessments").json()] == ["Legacy"]
+
+    math_stats = client.get(f"/courses/{math}/stats/current").json()
+    assert math_stats == {"current_weighted": 54.0, "weight_done": 60.0, "remaining_weight": 40.0}
+    art_stats = client.get(f"/courses/{art}/dashboard").json()["stats"]
+    assert art_stats["current_weighted"] == 25.0
+    assert client.get("/stats/validate").json()["total_weight"] == 10.0
+
+    # An assessment is invisible through another tenant's routes
+    assert client.get(f"/courses/{math}/assessments/{art_row['id']}").status_code == 404
+    assert client.delete(f"/assessments/{art_row['id']}").status_code == 404
+    r = client.request("DELETE", f"/courses/{math}/assessments/bulk", json=[art_row["id"]])
+    assert r.status_code == 404
+
+
+def test_course_bulk_and_export(client):
+    course = make_course(client, "Physics")
+    rows = [
+        {"title": f"Lab {i}", "weight_pct": 5.0, "due_date": "2025-06-01"} for i in range(3)
+    ]
+    assert client.post(f"/courses/{course}/assessments/bulk", json=rows).status_code == 200
+    export = client.get(f"/courses/{course}/assessments/export").text.splitlines()
+    assert len(export) == 3
+    assert client.get("/assessments").json() == []
+
+
+def test_unknown_course_returns_404(client):
+    assert client.get("/courses/123/assessments").status_code == 404
+    assert client.get("/courses/123/stats/current").status_code == 404
@@ -0,0 +1,21 @@
+# tests/test_api_dashboard.py
+from tests.test_api_stats import seed
+
+
+def test_dashboard_on_empty_db(client):
+    r = client.get("/dashboard")
+    assert r.status_code == 200
+    body = r.json()
+    assert body["assessments"] == []
+    assert body["stats"]["remaining_weight"] == 100
+    assert body["validation"]["total_weight"] == 0
+
+
+def test_dashboard_matches_individual_endpoints(client):
+    seed(client)
+    body = client.get("/dashboard").json()
+
+    assert body["assessments"] == client.get("/assessments").json()
+    assert body["stats"] == client.get("/stats/current").json()
+    assert body["validation"] == client.get("/stats/validate").json()
+    assert [row["title"] for row in body["assessments"]] == ["A1", "A2", "Final"]
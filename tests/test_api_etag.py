@@ -0,0 +1,111 @@
+# tests/test_api_etag.py
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+import pytest
+
+from backend.app import app
+from tests.test_api_stats import seed
+
+CONDITIONAL_PATHS = [
+    "/assessments",
+    "/assessments?fields=title",
+    "/stats/current",
+    "/stats/what-if?target=90",
+    "/stats/validate",
+    "/dashboard",
+]
+
+
+@pytest.fixture
+def statements():
+    seen = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        seen.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", record)
+    yield seen
+    event.remove(Engine, "before_cursor_execute", record)
+
+
+@pytest.mark.parametrize("path", CONDITIONAL_PATHS)
+def test_matching_etag_returns_304_without_loading_rows(client, statements, path):
+    seed(client)
+    first = client.get(path)
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "no-cache"
+
+    statements.clear()
+    again = client.get(path, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+    assert not any("FROM assessments" in sql for sql in statements)
+
+
+def test_every_write_changes_the_etag(client):
+    seed(client)
+    etags = [client.get("/stats/current").headers["etag"]]
+
+    created = client.post(
+        "/assessments",
+        json={"title": "Quiz", "weight_pct": 5, "due_date": "2025-12-01"},
+    ).json()
+    etags.append(client.get("/stats/current").headers["etag"])
+    client.put(f"/assessments/{created['id']}", json={"score_pct": 70})
+    etags.append(client.get("/stats/current").headers["etag"])
+    client.request("DELETE", "/assessments/bulk", json=[created["id"]])
+    etags.append(client.get("/stats/current").headers["etag"])
+
+    assert len(set(etags)) == len(etags)
+    stale = client.get("/stats/current", headers={"If-None-Match": etags[0]})
+    assert stale.status_code == 200
+
+
+def test_etags_are_per_course(client):
+    course = client.post("/courses", json={"name": "Math"}).json()
+    default = client.get("/stats/current").headers["etag"]
+    scoped = client.get(f"/courses/{course['id']}/stats/current").headers["etag"]
+    assert default != scoped
+    r = client.get(
+        f"/courses/{course['id']}/stats/current", headers={"If-None-Match": default}
+    )
+    assert r.status_code == 200
+
+
+def test_cached_version_tracks_the_database_across_bulk_writes(client):
+    def etag():
+        return client.get("/stats/current").headers["etag"]
+
+    def allocated_titles():
+        r = client.post("/stats/what-if/allocate", json={"target": 50})
+        return {row["title"] for row in r.json()["assessments"]}
+
+    seed(client)
+    etags = [etag()]
+
+    rows = [
+        {"title": f"HW{i}", "weight_pct": 5, "due_date": f"2025-12-0{i + 1}"}
+        for i in range(3)
+    ]
+    ids = [res["id"] for res in client.post("/assessments/bulk", json=rows).json()]
+    etags.append(etag())
+    allocated_titles()  # caches the plan for this version
+    # Invalidates the cache: the next read reloads the version from the table
+    client.put("/assessments/bulk", json=[{"id": ids[0], "score_pct": 80}])
+    etags.append(etag())
+    client.post(
+        "/assessments",
+        json={"title": "Quiz", "weight_pct": 5, "due_date": "2025-12-20"},
+    )
+    etags.append(etag())
+    assert "Quiz" in allocated_titles()
+
+    assert len(set(etags)) == len(etags)
+    app.state.stats_cache.clear()
+    assert etag() == etags[-1]  # the cached version is the stored one
+    for stale in etags[:-1]:
+        r = client.get("/stats/current", headers={"If-None-Match": stale})
+        assert r.status_code == 200
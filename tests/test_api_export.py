@@ -0,0 +1,158 @@
+# tests/test_api_export.py
+import asyncio
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from backend.app import app
+from backend.models import Base
+
+
+def seed(client):
+    for title, score in [("Quiz, 1", 80.0), ("Final", None)]:
+        client.post(
+            "/assessments",
+            json={
+                "title": title,
+                "weight_pct": 50.0,
+                "due_date": "2025-05-01",
+                "score_pct": score,
+            },
+        )
+
+
+def test_export_ndjson(client):
+    seed(client)
+    r = client.get("/assessments/export")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in r.text.splitlines()]
+    assert rows == client.get("/assessments").json()
+
+
+def test_export_csv(client):
+    seed(client)
+    r = client.get("/assessments/export", params={"format": "csv"})
+    assert r.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(r.text)))
+    assert [row["title"] for row in rows] == ["Quiz, 1", "Final"]
+    assert rows[1]["score_pct"] == ""
+
+
+def test_export_empty_csv_has_header(client):
+    r = client.get("/assessments/export", params={"format": "csv"})
+    assert r.text.strip() == "id,title,weight_pct,due_date,score_pct"
+
+
+def test_export_rejects_unknown_format(client):
+    assert client.get("/assessments/export", params={"format": "xml"}).status_code == 422
+
+
+# --- Memory stays flat regardless of row count ---------------------------
+
+
+def _insert_rows(engine, upto):
+    """Grow the table to ``upto`` rows in SQL, without Python-side buffers."""
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO assessments (title, weight_pct, due_date, score_pct) "
+                "WITH RECURSIVE n(x) AS ("
+                "  SELECT (SELECT COUNT(*) FROM assessments) + 1"
+                "  UNION ALL SELECT x + 1 FROM n WHERE x < :upto"
+                ") SELECT 'A' || x, 1.0, '2025-01-01', "
+                "CASE WHEN x % 2 = 0 THEN 75.0 END FROM n"
+            ),
+            {"upto": upto},
+        )
+
+
+async def _drain_export():
+    """Drive the endpoint over raw ASGI, discarding each streamed chunk."""
+    scope = {
+        "type": "http",
+        # spec 2.4: the server reports disconnects via send(), so the
+        # response does not poll receive() while streaming
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "method": "GET",
+        "path": "/assessments/export",
+        "raw_path": b"/assessments/export",
+        "query_string": b"format=ndjson",
+        "headers": [],
+        "scheme": "http",
+        "server": ("test", 80),
+        "client": ("test", 1234),
+        "root_path": "",
+        "http_version": "1.1",
+    }
+    received = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal received
+        if message["type"] == "http.response.body":
+            received += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return received
+
+
+# Runs one export in a fresh interpreter and prints its peak RSS in bytes
+_MEASURE_EXPORT = """
+import asyncio, json, resource, sys
+from tests.test_api_export import _drain_export
+received = asyncio.run(_drain_export())
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+# ru_maxrss is KiB on Linux, bytes on macOS
+print(json.dumps([received, peak * (1 if sys.platform == "darwin" else 1024)]))
+"""
+
+
+def _export_in_subprocess(database_url: str) -> tuple[int, int]:
+    """Bytes exported and the peak RSS of a process that did nothing else.
+
+    ``ru_maxrss`` is a high-water mark that only grows, so measured in this
+    process it would include whatever earlier tests allocated.
+    """
+    env = {
+        **os.environ,
+        "GRADEAPP_DATABASE_URL": database_url,
+        "GRADEAPP_METRICS_ENABLED": "false",
+    }
+    out = subprocess.run(
+        [sys.executable, "-c", _MEASURE_EXPORT],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parent.parent,
+        env=env,
+    )
+    received, peak = json.loads(out.stdout)
+    return received, peak
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs resource.getrusage")
+def test_export_peak_rss_is_flat_from_1k_to_1m_rows(tmp_path):
+    url = f"sqlite:///{tmp_path / 'export.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    try:
+        _insert_rows(engine, 1_000)
+        small, peak_small = _export_in_subprocess(url)
+
+        _insert_rows(engine, 1_000_000)
+        large, peak_large = _export_in_subprocess(url)
+    finally:
+        engine.dispose()
+
+    assert large > 500 * small
+    assert peak_large - peak_small < 32 * 1024 * 1024
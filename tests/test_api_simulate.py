@@ -0,0 +1,154 @@
+# tests/test_api_simulate.py
+import time
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from backend import simulation
+from backend.app import app
+from backend.settings import Settings
+
+
+def seed(client):
+    """Graded 90 and 80 on 60% of the course; the 40% final is open."""
+    for title, weight, due, score in [
+        ("A1", 30.0, "2025-10-01", 90.0),
+        ("A2", 30.0, "2025-11-01", 80.0),
+        ("Final", 40.0, "2025-12-01", None),
+    ]:
+        client.post(
+            "/assessments",
+            json={"title": title, "weight_pct": weight, "due_date": due, "score_pct": score},
+        )
+
+
+def simulate(client, **params):
+    params.setdefault("seed", 7)
+    params.setdefault("precision", 0.05)
+    r = client.get("/stats/what-if/simulate", params=params)
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def test_simulation_is_seeded_and_bracketed(client):
+    seed(client)
+    first = simulate(client, target=80)
+    assert first == simulate(client, target=80)
+    assert first["stopped"] == "converged"
+    assert first["trials"] > 0
+    assert first["ci_low"] <= first["probability"] <= first["ci_high"]
+    assert first["ci_high"] - first["ci_low"] <= 0.1
+    assert 0 < first["probability"] < 1
+    assert simulate(client, target=70)["probability"] >= first["probability"]
+
+
+def test_required_score_matches_flat_what_if(client):
+    seed(client)
+    body = simulate(client, target=80)
+    # One assessment left: the per-assessment answer is the flat required average
+    required_avg = client.get("/stats/what-if", params={"target": 80}).json()
+    assert body["assessments"] == [
+        {
+            "id": body["assessments"][0]["id"],
+            "title": "Final",
+            "weight_pct": 40.0,
+            "required_score": required_avg["required_avg"],
+        }
+    ]
+
+
+def test_secured_and_unreachable_targets_are_exact(client):
+    seed(client)
+    secured = simulate(client, target=50)  # 51 points already earned
+    assert (secured["probability"], secured["trials"], secured["stopped"]) == (
+        1.0,
+        0,
+        "exact",
+    )
+    unreachable = simulate(client, target=95)  # 51 + 40 at most
+    assert (unreachable["probability"], unreachable["stopped"]) == (0.0, "exact")
+
+
+def test_nothing_left_to_grade(client):
+    client.post(
+        "/assessments",
+        json={"title": "Only", "weight_pct": 100.0, "due_date": "2025-10-01", "score_pct": 70},
+    )
+    assert simulate(client, target=70)["probability"] == 1.0
+    body = simulate(client, target=71)
+    assert body["probability"] == 0.0
+    assert body["assessments"] == []
+
+
+def test_trial_cap_bounds_the_run(client, monkeypatch):
+    seed(client)
+    monkeypatch.setitem(app.state.simulation_limits, "max_trials", 1000)
+    body = simulate(client, target=80, precision=0.0001)
+    assert (body["trials"], body["stopped"]) == (1000, "max_trials")
+
+
+def test_time_budget_bounds_the_run(client, monkeypatch):
+    seed(client)
+    monkeypatch.setitem(app.state.simulation_limits, "budget_s", 0.0)
+    body = simulate(client, target=80, precision=0.0001)
+    assert (body["trials"], body["stopped"]) == (simulation.CHUNK_TRIALS, "budget")
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{}, {"target": 80, "precision": 0}, {"target": 80, "seed": -1}],
+)
+def test_invalid_parameters(client, params):
+    assert client.get("/stats/what-if/simulate", params=params).status_code == 422
+
+
+def test_time_budget_holds_for_large_gradebooks():
+    rows = [
+        SimpleNamespace(id=i, title=f"HW{i}", weight_pct=0.02, score_pct=None)
+        for i in range(5000)
+    ]
+    started = time.perf_counter()
+    body = simulation.simulate_what_if(
+        rows, 75, precision=0.0001, budget_s=0.05, seed=1
+    )
+    elapsed = time.perf_counter() - started
+    assert body.stopped == "budget"
+    assert body.trials < simulation.CHUNK_TRIALS
+    assert elapsed < 0.25  # a full 4096-trial chunk alone took over a second
+
+
+def test_trial_cap_must_be_positive():
+    with pytest.raises(ValidationError):
+        Settings(what_if_simulation_max_trials=0)
+    row = SimpleNamespace(id=1, title="Final", weight_pct=40.0, score_pct=None)
+    with pytest.raises(ValueError, match="max_trials"):
+        simulation.simulate_what_if([row], 80, max_trials=0)
+
+
+def test_conditional_get_skips_the_simulation(client):
+    seed(client)
+    r = client.get("/stats/what-if/simulate", params={"target": 80, "seed": 1})
+    etag = r.headers["etag"]
+    r = client.get(
+        "/stats/what-if/simulate",
+        params={"target": 80, "seed": 1},
+        headers={"If-None-Match": etag},
+    )
+    assert r.status_code == 304
+
+
+def test_fit_is_shrunk_towards_the_prior():
+    prior = simulation.fit_scores([])
+    assert prior.mean == pytest.approx(simulation.PRIOR_MEAN)
+    assert prior.sd == pytest.approx(simulation.PRIOR_SD)
+    perfect = simulation.fit_scores([100.0] * 20)
+    assert 0.95 < perfect.mean < 1 and perfect.sd > 0
+
+
+def test_wilson_interval():
+    assert simulation.wilson_interval(0, 0) == (0.0, 1.0)
+    low, high = simulation.wilson_interval(0, 1000)
+    assert low == 0.0 and 0 < high < 0.01
+    low, high = simulation.wilson_interval(500, 1000)
+    assert low == pytest.approx(0.469, abs=1e-3) and high == pytest.approx(0.531, abs=1e-3)
@@ -1,4 +1,8 @@
 # tests/test_api_stats.py
+from fastapi.testclient import TestClient
+
+from backend.app import app as default_app, create_app, get_db
+from backend.settings import Settings
 
 
 def seed(client):
@@ -57,3 +61,70 @@ def test_what_if(client):
     w = r.json()
     # With the seeded data: completed = 51, remaining = 40 → (70 - 51)*100/40 = 47.5
     assert round(w["required_avg"], 2) == 47.50
+
+
+def test_what_if_batch(client):
+    seed(client)
+    r = client.get("/stats/what-if/batch", params={"target": [90, 70, 50]})
+    assert r.status_code == 200
+    results = r.json()
+    assert [w["target"] for w in results] == [90, 70, 50]
+    assert results[1] == client.get("/stats/what-if", params={"target": 70}).json()
+    # (90 - 51) * 100 / 40 = 97.5 ; (50 - 51) * 100 / 40 = -2.5 (already past target)
+    assert results[0]["required_avg"] == 97.5
+    assert results[2]["attainable"] is False
+
+
+def test_stats_cache_counters_on_metrics(client):
+    seed(client)
+    client.get("/stats/current")
+    client.get("/stats/current")
+    body = client.get("/metrics").text
+    assert "gradeapp_stats_cache_hits_total" in body
+    assert "gradeapp_stats_cache_misses_total" in body
+
+
+def test_history_records_each_write(client):
+    seed(client)
+    final = client.get("/assessments").json()[-1]
+    first = client.get("/stats/history").json()
+    client.put(f"/assessments/{final['id']}", json={"score_pct": 50.0})
+    client.put(f"/assessments/{final['id']}", json={"score_pct": 75.0})
+
+    history = client.get("/stats/history").json()
+    assert history[0] == first[-1]
+    assert [point["version"] for point in history] == [
+        first[-1]["version"] + i for i in range(3)
+    ]
+    # 51 + 40% of 50 ; 51 + 40% of 75
+    assert [point["current_weighted"] for point in history] == [51.0, 71.0, 81.0]
+    assert history[-1]["remaining_weight"] == 0.0
+    current = client.get("/stats/current").json()
+    assert {k: history[-1][k] for k in current} == current
+
+
+def test_history_records_one_point_per_bulk_write(client):
+    seed(client)
+    before = client.get("/stats/history").json()
+    rows = [
+        {"title": f"HW{i}", "weight_pct": 0.0, "due_date": "2025-12-15", "score_pct": 100.0}
+        for i in range(3)
+    ]
+    client.post("/assessments/bulk", json=rows)
+
+    history = client.get("/stats/history").json()
+    assert history[:-1] == before
+    assert history[-1]["version"] == before[-1]["version"] + 1
+
+
+def test_history_without_the_stats_cache_is_the_current_version(client):
+    app = create_app(Settings(stats_cache_size=0, auto_create_tables=False))
+    # Share the test database the conftest wired into the default app
+    app.dependency_overrides[get_db] = default_app.dependency_overrides[get_db]
+    uncached = TestClient(app)
+    seed(uncached)  # three writes
+
+    history = uncached.get("/stats/history").json()
+    assert len(history) == 1
+    current = uncached.get("/stats/current").json()
+    assert {k: history[0][k] for k in current} == current
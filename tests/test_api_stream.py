@@ -0,0 +1,103 @@
+# tests/test_api_stream.py
+import asyncio
+import json
+
+import httpx
+
+from backend.app import app
+
+
+def _scope(path):
+    return {
+        "type": "http",
+        # spec 2.4: disconnects surface through send(), nothing polls receive()
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "method": "GET",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [],
+        "scheme": "http",
+        "server": ("test", 80),
+        "client": ("test", 1234),
+        "root_path": "",
+        "http_version": "1.1",
+    }
+
+
+def _parse(frame: bytes) -> dict:
+    fields = dict(line.split(": ", 1) for line in frame.decode().strip().split("\n"))
+    return {"id": int(fields["id"]), **json.loads(fields["data"])}
+
+
+async def _stream_while(path, writes):
+    """Open the SSE stream, run ``writes`` through the API, collect events."""
+    frames: asyncio.Queue = asyncio.Queue()
+
+    async def receive():
+        await asyncio.Event().wait()  # never disconnects on its own
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            await frames.put(dict(message["headers"]))
+        elif message.get("body"):
+            await frames.put(message["body"])
+
+    task = asyncio.create_task(app(_scope(path), receive, send))
+    try:
+        headers = await asyncio.wait_for(frames.get(), 5)
+        events = [_parse(await asyncio.wait_for(frames.get(), 5))]
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+            await writes(client)
+        events.append(_parse(await asyncio.wait_for(frames.get(), 5)))
+        assert frames.empty()
+        return headers, events
+    finally:
+        task.cancel()
+
+
+def test_stream_pushes_coalesced_stats_after_writes(monkeypatch):
+    monkeypatch.setattr(app.state.stats_events, "coalesce_s", 0.5)
+
+    async def writes(client):
+        for weight in (10.0, 20.0, 30.0):  # inside one coalescing window
+            await client.post(
+                "/assessments",
+                json={
+                    "title": "Quiz",
+                    "weight_pct": weight,
+                    "due_date": "2025-01-01",
+                    "score_pct": 50.0,
+                },
+            )
+
+    headers, (first, last) = asyncio.run(_stream_while("/stats/stream", writes))
+    assert headers[b"content-type"].startswith(b"text/event-stream")
+    assert first["stats"]["weight_done"] == 0.0
+    assert last["stats"] == {
+        "current_weighted": 30.0,
+        "weight_done": 60.0,
+        "remaining_weight": 40.0,
+    }
+    assert last["validation"]["total_weight"] == 60.0
+    assert last["id"] > first["id"]
+    assert app.state.stats_events.watching(None) is False
+
+
+def test_stream_is_scoped_to_its_course(client):
+    course = client.post("/courses", json={"name": "Math"}).json()["id"]
+
+    async def writes(client):
+        await client.post(
+            "/assessments",
+            json={"title": "Other", "weight_pct": 50.0, "due_date": "2025-01-01"},
+        )
+        await client.post(
+            f"/courses/{course}/assessments",
+            json={"title": "Mine", "weight_pct": 5.0, "due_date": "2025-01-01"},
+        )
+
+    _, (first, last) = asyncio.run(_stream_while(f"/courses/{course}/stats/stream", writes))
+    assert first["validation"]["total_weight"] == 0.0
+    assert last["validation"]["total_weight"] == 5.0
@@ -1,5 +1,9 @@
 from datetime import date
 
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
 from backend import calculations, schemas
 
 
@@ -47,3 +51,77 @@ def test_validate_weights_messages():
     assert res.total_weight == 70.0
     assert res.is_exactly_100 is False
     assert "You can still add" in res.message
+
+
+def test_from_totals_matches_row_path():
+    rows = [Obj(30.0, 90.0), Obj(20.0, 50.0), Obj(45.0, None)]
+    agg = calculations.totals(rows)
+    assert agg == calculations.WeightTotals(95.0, 50.0, 3700.0)
+    assert calculations.current_stats_from_totals(agg) == calculations.current_stats(rows)
+    assert calculations.what_if_from_totals(agg, 80.0) == calculations.what_if(rows, 80.0)
+    assert calculations.validate_weights_from_totals(
+        agg
+    ) == calculations.validate_weights(rows)
+
+
+def test_what_if_many_matches_single_calls():
+    rows = [Obj(40.0, 80.0), Obj(60.0, None)]
+    targets = [97.0, 90.0, 75.0, 50.0, 20.0]
+    results = calculations.what_if_many(rows, targets)
+    assert results == [calculations.what_if(rows, t) for t in targets]
+    assert [r.attainable for r in results] == [False, True, True, True, False]
+
+
+def test_apply_delta_covers_every_transition():
+    Snap = calculations.ScoreSnapshot
+    agg = calculations.totals([Obj(30.0, 90.0), Obj(20.0, None)])
+    # ungraded -> graded, with a weight change
+    agg = calculations.apply_delta(agg, Snap(20.0, None), Snap(25.0, 60.0))
+    assert agg == calculations.totals([Obj(30.0, 90.0), Obj(25.0, 60.0)])
+    # graded -> ungraded, then a delete
+    agg = calculations.apply_delta(agg, Snap(30.0, 90.0), Snap(30.0, None))
+    agg = calculations.apply_delta(agg, Snap(25.0, 60.0), None)
+    assert agg == calculations.totals([Obj(30.0, None)])
+
+
+def test_incremental_history_is_bounded():
+    engine = calculations.IncrementalTotals(history_size=3)
+    for weight in (10.0, 20.0, 30.0, 40.0):
+        engine.apply(None, calculations.ScoreSnapshot(weight, 100.0))
+    assert engine.version == 4
+    assert [s.version for s in engine.history()] == [2, 3, 4]
+    assert engine.history()[-1].totals == engine.totals
+
+
+_weights = st.floats(min_value=0, max_value=100, allow_nan=False)
+_scores = st.none() | st.floats(min_value=0, max_value=100, allow_nan=False)
+# (slot, weight, score, delete): write one of a few rows, or delete it
+_writes = st.lists(
+    st.tuples(st.integers(0, 5), _weights, _scores, st.booleans()), max_size=60
+)
+
+
+@settings(max_examples=200, deadline=None)
+@given(writes=_writes, history_size=st.integers(1, 10))
+def test_incremental_totals_equal_a_full_recompute(writes, history_size):
+    rows: dict[int, calculations.ScoreSnapshot] = {}
+    engine = calculations.IncrementalTotals(history_size=history_size)
+    for slot, weight, score, delete in writes:
+        old = rows.pop(slot, None)
+        new = None if delete else calculations.ScoreSnapshot(weight, score)
+        if new is not None:
+            rows[slot] = new
+        engine.apply(old, new)
+
+        expected = calculations.totals(rows.values())
+        assert engine.totals == pytest.approx(expected, abs=1e-6)
+        # Rounded stats may only differ where float drift crosses a 0.005 tie
+        stats = calculations.current_stats_from_totals(engine.totals).model_dump()
+        assert stats == pytest.approx(
+            calculations.current_stats(rows.values()).model_dump(), abs=0.011
+        )
+    history = engine.history()
+    assert len(history) == min(len(writes) + 1, history_size)
+    assert [s.version for s in history] == list(
+        range(len(writes) - len(history) + 1, len(writes) + 1)
+    )
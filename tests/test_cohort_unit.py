@@ -0,0 +1,109 @@
+import math
+import random
+from datetime import date
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend import calculations, models, services
+from backend.cohort import Cohort, percentiles, round2
+
+
+class Obj:
+    def __init__(self, weight_pct, score_pct):
+        self.weight_pct = weight_pct
+        self.score_pct = score_pct
+
+
+def _students(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        [
+            Obj(
+                round(rng.uniform(0.0, 15.0), 2),
+                None if rng.random() < 0.4 else round(rng.uniform(0.0, 100.0), 2),
+            )
+            for _ in range(rng.randint(0, 20))
+        ]
+        for _ in range(n)
+    ]
+
+
+def test_matches_row_path_exactly():
+    students = _students(2000)
+    cohort = Cohort.from_rows(students)
+    stats = cohort.current_stats()
+    result = cohort.what_if(77.5, stats)
+
+    for i, rows in enumerate(students):
+        expected = calculations.current_stats(rows)
+        assert stats.current_weighted[i] == expected.current_weighted
+        assert stats.weight_done[i] == expected.weight_done
+        assert stats.remaining_weight[i] == expected.remaining_weight
+
+        what_if = calculations.what_if(rows, 77.5)
+        required = result.required_avg[i]
+        assert (None if math.isnan(required) else required) == what_if.required_avg
+        assert bool(result.attainable[i]) == what_if.attainable
+
+
+def test_round2_matches_python_round_near_ties():
+    values = np.array([2.675, 1.005, 0.125, -0.125, 0.285, 1.115, 8.345, -2.675])
+    assert round2(values).tolist() == [round(v, 2) for v in values.tolist()]
+
+
+def test_from_columns_groups_contiguous_rows():
+    cohort = Cohort.from_columns(
+        [3, 3, 7], [40.0, 60.0, 100.0], [80.0, None, float("nan")]
+    )
+    assert cohort.keys == [3, 7]
+    assert cohort.weights.tolist() == [[40.0, 60.0], [100.0, 0.0]]
+    assert cohort.current_stats().current_weighted.tolist() == [32.0, 0.0]
+
+
+def test_percentiles_ignore_nan():
+    assert percentiles(np.array([10.0, np.nan, 20.0, 30.0]), [0, 50, 100]) == {
+        0: 10.0,
+        50: 20.0,
+        100: 30.0,
+    }
+    assert math.isnan(percentiles(np.array([np.nan]), [50])[50])
+
+
+def test_load_cohort_reads_every_gradebook():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    models.Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    course = models.Course(name="Math")
+    session.add(course)
+    session.flush()
+    session.add_all(
+        [
+            models.Assessment(
+                title="A", weight_pct=50.0, due_date=date(2025, 1, 1), score_pct=90.0
+            ),
+            models.Assessment(
+                title="B",
+                weight_pct=30.0,
+                due_date=date(2025, 1, 1),
+                course_id=course.id,
+                score_pct=70.0,
+            ),
+            models.Assessment(
+                title="C", weight_pct=70.0, due_date=date(2025, 1, 2), course_id=course.id
+            ),
+        ]
+    )
+    session.commit()
+
+    cohort = services.load_cohort(session)
+    assert cohort.keys == [models.DEFAULT_SCOPE_ID, course.id]
+    stats = cohort.current_stats()
+    assert stats.current_weighted.tolist() == [45.0, 21.0]
+    assert stats.remaining_weight.tolist() == [50.0, 70.0]
+    assert services.load_cohort(session, course_ids=[course.id]).keys == [course.id]
+    assert len(services.load_cohort(session, course_ids=[])) == 0
@@ -0,0 +1,66 @@
+import subprocess
+import sys
+
+from sqlalchemy import text
+
+from backend import db
+from backend.settings import Settings
+
+
+def test_normalize_url_maps_provider_postgres_urls():
+    assert db.normalize_url("postgresql://u:p@h:5432/d") == (
+        "postgresql+psycopg2://u:p@h:5432/d"
+    )
+    assert db.normalize_url("postgres://u@h/d") == "postgresql+psycopg2://u@h/d"
+    assert db.normalize_url("sqlite:///./grades.db") == "sqlite:///./grades.db"
+
+
+def test_engine_options_follow_settings():
+    s = Settings(db_pool_size=7, db_max_overflow=3, db_pool_recycle=60)
+    opts = db.engine_options("postgresql+psycopg2://u@h/d", s)
+    assert opts["pool_size"] == 7
+    assert opts["max_overflow"] == 3
+    assert opts["pool_recycle"] == 60
+    assert opts["poolclass"] is db.TimedQueuePool
+    assert opts["connect_args"] == {}
+
+    memory = db.engine_options("sqlite://", s)
+    assert "pool_size" not in memory
+    assert memory["connect_args"] == {"check_same_thread": False}
+
+
+def test_statement_timeout_connect_args():
+    s = Settings(db_statement_timeout_ms=2500)
+    assert db.engine_options("postgresql+psycopg2://u@h/d", s)["connect_args"] == {
+        "options": "-c statement_timeout=2500"
+    }
+    assert db.engine_options("postgresql+asyncpg://u@h/d", s)["connect_args"] == {
+        "server_settings": {"statement_timeout": "2500"}
+    }
+
+
+def test_sqlite_file_engine_uses_wal_and_pragmas(tmp_path):
+    s = Settings(
+        database_url=f"sqlite:///{tmp_path / 'pragmas.db'}",
+        sqlite_busy_timeout_ms=1234,
+    )
+    engine = db.build_engine(s)
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+    assert engine.pool.size() == s.db_pool_size
+    engine.dispose()
+
+
+def test_importing_the_app_builds_nothing():
+    # Fresh interpreter: this process has long since imported everything
+    probe = (
+        "import sys, backend.app; "
+        "print(sys.modules['backend.db']._engine, "
+        "sys.modules['backend.settings']._settings, backend.app._app)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.split() == ["None", "None", "None"]
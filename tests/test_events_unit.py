@@ -0,0 +1,70 @@
+import asyncio
+import threading
+
+from backend.calculations import WeightTotals
+from backend.events import StatsBroadcaster
+from backend.services import TenantSummary
+
+
+def _summary(version):
+    return TenantSummary(WeightTotals(float(version), 0.0, 0.0), version)
+
+
+def _broadcaster(**kwargs):
+    return StatsBroadcaster(lambda s: b"v%d" % s.version, coalesce_s=0.01, **kwargs)
+
+
+def test_burst_is_coalesced_to_newest_version():
+    async def scenario():
+        events = _broadcaster()
+        queue = events.subscribe("t")
+        for version in (1, 3, 2):  # 2 finished last but is older than 3
+            events.publish("t", _summary(version))
+        await asyncio.sleep(0.05)
+        return [queue.get_nowait() for _ in range(queue.qsize())]
+
+    assert asyncio.run(scenario()) == [b"v3"]
+
+
+def test_publish_from_worker_thread():
+    async def scenario():
+        events = _broadcaster()
+        queue = events.subscribe("t")
+        thread = threading.Thread(target=events.publish, args=("t", _summary(1)))
+        thread.start()
+        thread.join()
+        return await asyncio.wait_for(queue.get(), 1)
+
+    assert asyncio.run(scenario()) == b"v1"
+
+
+def test_slow_consumer_is_dropped_and_its_stream_ends():
+    async def scenario():
+        events = _broadcaster(queue_size=2)
+        slow = events.subscribe("t")
+        fast = events.subscribe("t")
+        for version in (1, 2, 3):
+            events.publish("t", _summary(version))
+            await asyncio.sleep(0.02)
+            fast.get_nowait()
+        frames = [frame async for frame in events.stream("t", slow, b"first")]
+        return frames, events.dropped, events.watching("t")
+
+    frames, dropped, watching = asyncio.run(scenario())
+    assert frames == [b"first"]  # backlog discarded, then the stream closes
+    assert dropped == 1
+    assert watching  # the fast subscriber is unaffected
+
+
+def test_idle_stream_sends_keepalive_and_unsubscribes_on_close():
+    async def scenario():
+        events = _broadcaster(keepalive_s=0.01)
+        queue = events.subscribe("t")
+        stream = events.stream("t", queue, b"first")
+        frames = [await stream.__anext__(), await stream.__anext__()]
+        await stream.aclose()
+        return frames, events.watching("t")
+
+    frames, watching = asyncio.run(scenario())
+    assert frames == [b"first", b": keep-alive\n\n"]
+    assert not watching
@@ -0,0 +1,111 @@
+# tests/test_instrumentation.py
+import asyncio
+import re
+import time
+
+from fastapi.testclient import TestClient
+
+from backend import instrumentation, metrics
+from backend.app import app as default_app, create_app, get_db
+from backend.settings import Settings
+from tests.test_api_stats import seed
+
+
+def _sample(body, name, **labels):
+    wanted = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    match = re.search(rf"^{name}\{{{wanted}\}} (\S+)$", body, re.MULTILINE)
+    return float(match.group(1)) if match else None
+
+
+def test_query_counts_are_labelled_by_route_template(client):
+    seed(client)
+    client.get("/stats/what-if", params={"target": 80})
+    body = client.get("/metrics").text
+
+    count = _sample(
+        body, "gradeapp_db_queries_per_request_count", endpoint="/stats/what-if"
+    )
+    assert count and count >= 1
+    assert 'gradeapp_db_query_seconds_bucket{endpoint="/stats/what-if"' in body
+    assert (
+        'gradeapp_function_seconds_count{endpoint="/stats/what-if",'
+        'function="calculations.what_if_from_totals"}'
+    ) in body
+    assert (
+        'gradeapp_function_seconds_count{endpoint="/stats/what-if",'
+        'function="AssessmentService.stats_summary"}'
+    ) in body
+
+
+def test_server_timing_header_is_opt_in(client):
+    assert "server-timing" not in client.get("/stats/current").headers
+
+    app = create_app(Settings(server_timing=True, auto_create_tables=False))
+    # Share the test database the conftest wired into the default app
+    app.dependency_overrides[get_db] = default_app.dependency_overrides[get_db]
+    header = TestClient(app).get("/stats/current").headers["server-timing"]
+    assert re.match(r'db;dur=[\d.]+;desc="\d+ queries", ', header)
+    assert "service;dur=" in header
+    assert "calc;dur=" in header
+
+
+def test_timed_is_a_passthrough_outside_requests():
+    calls = []
+
+    @instrumentation.timed("calc")
+    def double(x):
+        calls.append(instrumentation.current())
+        return 2 * x
+
+    assert double(2) == 4
+    assert calls == [None]
+
+
+def test_nested_timed_calls_count_once_per_category():
+    timings = instrumentation.RequestTimings()
+    token = instrumentation._current.set(timings)
+    try:
+
+        @instrumentation.timed("calc", "outer")
+        def outer():
+            return inner()
+
+        @instrumentation.timed("calc", "inner")
+        def inner():
+            return 1
+
+        outer()
+    finally:
+        instrumentation._current.reset(token)
+
+    assert [name for name, _ in timings.functions] == ["inner", "outer"]
+    assert timings.totals["calc"] == dict(timings.functions)["outer"]
+
+
+def test_single_metrics_route():
+    paths = [route.path for route in default_app.routes]
+    assert paths.count("/metrics") == 1
+    app = create_app(Settings(metrics_enabled=False, auto_create_tables=False))
+    assert "/metrics" not in [route.path for route in app.routes]
+
+
+def test_concurrent_scrapes_share_one_render(monkeypatch):
+    renders = []
+
+    def slow_render():
+        renders.append(1)
+        time.sleep(0.05)
+        return b"sample 1\n"
+
+    monkeypatch.setattr(metrics, "_render", slow_render)
+    endpoint = metrics.MetricsEndpoint()
+
+    async def scrape_together():
+        return await asyncio.gather(*(endpoint.scrape(None) for _ in range(5)))
+
+    responses = asyncio.run(scrape_together())
+    assert {response.body for response in responses} == {b"sample 1\n"}
+    assert len(renders) == 1
+
+    asyncio.run(endpoint.scrape(None))  # a later scrape renders afresh
+    assert len(renders) == 2
@@ -0,0 +1,97 @@
+# tests/test_migrate.py
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import Session
+
+from backend import migrate, services
+from backend.db import build_engine
+from backend.settings import Settings
+
+# assessments as created before courses, summaries and indexes existed
+_OLD_SCHEMA = """
+CREATE TABLE assessments (
+    id INTEGER NOT NULL,
+    title VARCHAR NOT NULL,
+    weight_pct FLOAT NOT NULL,
+    due_date DATE NOT NULL,
+    score_pct FLOAT,
+    PRIMARY KEY (id)
+);
+CREATE INDEX ix_assessments_id ON assessments (id);
+CREATE INDEX ix_assessments_due_date_id ON assessments (due_date, id);
+INSERT INTO assessments VALUES (1, 'Midterm', 40.0, '2025-03-01', 80.0);
+INSERT INTO assessments VALUES (2, 'Final', 60.0, '2025-05-01', NULL);
+"""
+
+
+def old_database(tmp_path) -> str:
+    path = tmp_path / "old.db"
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as conn:
+        for statement in _OLD_SCHEMA.split(";"):
+            if statement.strip():
+                conn.execute(text(statement))
+    engine.dispose()
+    return f"sqlite:///{path}"
+
+
+def test_upgrade_migrates_an_old_database_once(tmp_path):
+    engine = build_engine(Settings(database_url=old_database(tmp_path)))
+
+    applied = migrate.upgrade(engine)
+    assert "added assessments.course_id" in applied
+    assert "created index ix_assessments_course_due_date" in applied
+    assert "dropped index ix_assessments_due_date_id" in applied
+    assert "backfilled 1 grade_summary rows" in applied
+    assert migrate.upgrade(engine) == []  # idempotent
+
+    inspector = inspect(engine)
+    assert "course_id" in {c["name"] for c in inspector.get_columns("assessments")}
+    indexes = {ix["name"] for ix in inspector.get_indexes("assessments")}
+    assert "ix_assessments_course_due_date" in indexes
+    with Session(engine) as session:
+        repository = services.AssessmentRepository(session)
+        assert repository.stored_summary() == ((100.0, 40.0, 3200.0), 0)
+        assert [row.title for row in repository.list()] == ["Midterm", "Final"]
+    engine.dispose()
+
+
+_PROBE = """
+import json
+from fastapi.testclient import TestClient
+from backend.app import app
+with TestClient(app) as client:
+    print(json.dumps({
+        path: [r.status_code, r.json()]
+        for path in ("/assessments", "/stats/current", "/dashboard")
+        for r in [client.get(path)]
+    }))
+"""
+
+
+def test_app_serves_an_old_database_after_startup(tmp_path):
+    env = {
+        **os.environ,
+        "GRADEAPP_DATABASE_URL": old_database(tmp_path),
+        "GRADEAPP_METRICS_ENABLED": "false",
+    }
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parent.parent,
+        env=env,
+    )
+    responses = json.loads(out.stdout)
+    assert {path: status for path, (status, _) in responses.items()} == {
+        "/assessments": 200,
+        "/stats/current": 200,
+        "/dashboard": 200,
+    }
+    assert responses["/stats/current"][1]["current_weighted"] == 32.0
@@ -0,0 +1,121 @@
+import json
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+
+from backend import models, recompute, services
+from backend.recompute import (
+    load_checkpoint,
+    recompute_batch,
+    recompute_summaries,
+    tenant_totals,
+)
+from backend.settings import Settings
+
+
+@pytest.fixture()
+def database(tmp_path):
+    """A file database the worker processes can open on their own."""
+    url = f"sqlite:///{tmp_path / 'recompute.db'}"
+    engine = create_engine(url)
+    models.Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    courses = [models.Course(name=f"Course {i}") for i in range(3)]
+    session.add_all(courses)
+    session.flush()
+    for course_id in [None, *(course.id for course in courses)]:
+        repo = services.AssessmentRepository(session, course_id)
+        repo.save(models.Assessment(title="A", weight_pct=60.0, due_date=date(2025, 1, 1)))
+        repo.save(
+            models.Assessment(
+                title="B", weight_pct=40.0, due_date=date(2025, 1, 2), score_pct=75.0
+            )
+        )
+    # Summaries drift from the rows (e.g. an import that bypassed the app)
+    session.execute(update(models.GradeSummary).values(weighted_sum=0.0))
+    session.commit()
+    yield Settings(database_url=url), session, [c.id for c in courses]
+    session.close()
+    engine.dispose()
+
+
+def _stored(session, course_id):
+    session.expire_all()
+    return services.AssessmentRepository(session, course_id).stored_summary()
+
+
+def test_recompute_rewrites_every_tenant(database, tmp_path):
+    app_settings, session, course_ids = database
+    checkpoint = tmp_path / "recompute.json"
+    seen = []
+
+    status = recompute_summaries(
+        app_settings,
+        workers=2,
+        batch_size=1,
+        checkpoint=checkpoint,
+        progress=seen.append,
+    )
+
+    assert (status.done, status.total, status.rows) == (4, 4, 8)
+    assert status.invalid_weights == 0
+    assert [p.done for p in seen] == [1, 2, 3, 4]
+    assert not checkpoint.exists()
+    for course_id in [None, *course_ids]:
+        stored = _stored(session, course_id)
+        assert stored.totals == (100.0, 40.0, 3000.0)
+        assert stored.version == 3  # two saves, then the recompute
+
+
+def test_recompute_resumes_from_checkpoint(database, tmp_path):
+    app_settings, session, course_ids = database
+    checkpoint = tmp_path / "recompute.json"
+    checkpoint.write_text(json.dumps({"done": [None, course_ids[0]]}))
+    assert load_checkpoint(checkpoint) == {None, course_ids[0]}
+
+    status = recompute_summaries(
+        app_settings, workers=1, batch_size=10, checkpoint=checkpoint
+    )
+
+    assert (status.done, status.resumed, status.rows) == (4, 2, 4)
+    assert _stored(session, None).totals.weighted_sum == 0.0  # skipped
+    assert _stored(session, course_ids[1]).totals.weighted_sum == 3000.0
+
+
+def test_recompute_keeps_a_write_made_while_streaming(database, monkeypatch):
+    app_settings, session, _ = database
+    engine = create_engine(app_settings.database_url)
+    api_session = sessionmaker(bind=engine)()
+    passes, commits = [], []
+    commit = session.commit
+
+    def counted_commit():
+        commits.append(1)
+        commit()
+
+    monkeypatch.setattr(session, "commit", counted_commit)
+
+    def totals_then_write(repository, stream_batch):
+        # The retry reads in a new transaction, after the first one ended
+        assert len(commits) == len(passes)
+        result = tenant_totals(repository, stream_batch)
+        if not passes:  # an API write commits after the first pass
+            services.AssessmentRepository(api_session).save(
+                models.Assessment(
+                    title="C", weight_pct=10.0, due_date=date(2025, 1, 3), score_pct=50.0
+                )
+            )
+        passes.append(result)
+        return result
+
+    monkeypatch.setattr(recompute, "tenant_totals", totals_then_write)
+    recompute_batch(session, [None])
+    api_session.close()
+    engine.dispose()
+
+    assert len(passes) == 2  # the stale pass was not stored
+    stored = _stored(session, None)
+    assert stored.totals == (110.0, 50.0, 3500.0)
+    assert stored.version == 4
@@ -0,0 +1,29 @@
+import importlib.util
+
+from backend import server, workers
+from backend.settings import Settings
+
+
+def test_worker_count_defaults_to_cpus(monkeypatch):
+    monkeypatch.setattr(workers, "cpu_count", lambda: 6)
+    assert workers.worker_count(0) == 6
+    assert workers.worker_count(3) == 3
+
+
+def test_worker_settings_skip_table_creation():
+    app_settings = Settings(auto_create_tables=True, stats_cache_size=512)
+
+    single = server.worker_settings(app_settings, workers=1)
+    assert single.auto_create_tables is False
+    assert single.stats_cache_size == 512
+
+    # Each worker would hold its own cache that other workers' writes miss
+    several = server.worker_settings(app_settings, workers=4)
+    assert several.stats_cache_size == 0
+    assert app_settings.auto_create_tables is True
+
+
+def test_falls_back_without_uvloop_or_httptools(monkeypatch):
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+    assert server.event_loop() == "asyncio"
+    assert server.http_protocol() == "h11"
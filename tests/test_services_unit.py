@@ -4,7 +4,9 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from backend import models, schemas, services
+import pytest
+
+from backend import calculations, models, schemas, services
 
 
 def _session():
@@ -45,3 +47,160 @@ def test_service_crud_flow():
 
     svc.delete_assessment(created.id)
     assert svc.list_assessments() == []
+
+
+def test_repository_totals_matches_row_aggregation():
+    session = _session()
+    repo = services.AssessmentRepository(session)
+    assert repo.totals() == (0.0, 0.0, 0.0)
+
+    for weight, score in [(30.0, 90.0), (20.0, None), (25.5, 71.25)]:
+        repo.save(
+            models.Assessment(
+                title="A", weight_pct=weight, due_date=date(2025, 1, 1), score_pct=score
+            )
+        )
+
+    assert repo.totals() == pytest.approx(calculations.totals(repo.list()))
+
+
+def _payload(weight, score=None):
+    return schemas.AssessmentIn(
+        title="A", weight_pct=weight, due_date=date(2025, 1, 1), score_pct=score
+    )
+
+
+def test_stats_cache_write_through_keeps_totals_current():
+    session = _session()
+    repo = services.AssessmentRepository(session)
+    cache = services.StatsCache()
+    svc = services.AssessmentService(repo, cache=cache)
+
+    first = svc.create_assessment(_payload(40.0, 80.0))
+    assert svc.stats_totals() == repo.totals()  # miss, loads from DB
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    second = svc.create_assessment(_payload(60.0))
+    svc.update_assessment(first.id, schemas.AssessmentUpdate(weight_pct=30.0))
+    svc.update_assessment(second.id, schemas.AssessmentUpdate(score_pct=50.0))
+    svc.delete_assessment(first.id)
+
+    assert svc.stats_totals() == pytest.approx(repo.totals())
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_grade_summary_tracks_writes_by_delta():
+    session = _session()
+    course = services.CourseRepository(session).save(models.Course(name="Math"))
+    repo = services.AssessmentRepository(session, course.id)
+    svc = services.AssessmentService(repo)
+
+    first = svc.create_assessment(_payload(40.0, 80.0))
+    second = svc.create_assessment(_payload(60.0))
+    svc.update_assessment(second.id, schemas.AssessmentUpdate(score_pct=50.0))
+    svc.bulk_create([_payload(10.0, 100.0)])
+    svc.delete_assessment(first.id)
+
+    assert repo.stored_summary().totals == pytest.approx(repo.aggregate_totals())
+    # The default gradebook keeps its own row
+    assert services.AssessmentRepository(session).totals() == (0.0, 0.0, 0.0)
+
+
+def _two_sessions(tmp_path):
+    """Two connections to one file database, like two API requests."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'race.db'}")
+    models.Base.metadata.create_all(bind=engine)
+    make_session = sessionmaker(bind=engine)
+    return make_session(), make_session()
+
+
+def test_racing_writes_to_one_row_apply_one_delta_each(tmp_path):
+    first, second = _two_sessions(tmp_path)
+    a = services.AssessmentService(services.AssessmentRepository(first))
+    b = services.AssessmentService(services.AssessmentRepository(second))
+    a.create_assessment(_payload(20.0))
+    row_id = a.create_assessment(_payload(10.0)).id
+    # Both requests have loaded the row before either one writes (a
+    # double-click); held, so each session keeps its copy
+    loaded = [a.get_assessment(row_id), b.get_assessment(row_id)]
+
+    a.update_assessment(row_id, schemas.AssessmentUpdate(weight_pct=30.0))
+    b.update_assessment(row_id, schemas.AssessmentUpdate(score_pct=80.0))
+    repo = services.AssessmentRepository(first)
+    assert repo.stored_summary().totals == repo.aggregate_totals() == (50.0, 30.0, 2400.0)
+
+    a.delete_assessment(row_id)
+    with pytest.raises(services.AssessmentNotFound):
+        b.delete_assessment(row_id)
+    assert repo.stored_summary().totals == repo.aggregate_totals() == (20.0, 0.0, 0.0)
+    first.close()
+    second.close()
+
+
+def test_racing_writes_keep_the_stats_cache_exact(tmp_path):
+    first, second = _two_sessions(tmp_path)
+    cache = services.StatsCache()  # one process serving both requests
+    a = services.AssessmentService(services.AssessmentRepository(first), cache=cache)
+    b = services.AssessmentService(services.AssessmentRepository(second), cache=cache)
+    a.create_assessment(_payload(20.0))
+    row_id = a.create_assessment(_payload(10.0)).id
+    # Loaded by both requests before either writes; held, as in the test above
+    loaded = [a.get_assessment(row_id), b.get_assessment(row_id)]
+    a.stats_totals()  # warm
+
+    a.update_assessment(row_id, schemas.AssessmentUpdate(weight_pct=30.0))
+    b.update_assessment(row_id, schemas.AssessmentUpdate(score_pct=80.0))
+    a.delete_assessment(row_id)
+    with pytest.raises(services.AssessmentNotFound):
+        b.delete_assessment(row_id)
+
+    repo = services.AssessmentRepository(first)
+    assert cache.get(None) == repo.stored_summary()
+    assert cache.get(None).totals == repo.aggregate_totals()
+    first.close()
+    second.close()
+
+
+def test_reconcile_summaries_reports_and_repairs_drift():
+    session = _session()
+    repo = services.AssessmentRepository(session)
+    repo.save(models.Assessment(title="A", weight_pct=50.0, due_date=date(2025, 1, 1)))
+    # A write that bypassed the app leaves the summary behind
+    session.execute(
+        models.Assessment.__table__.insert().values(
+            title="B", weight_pct=25.0, due_date=date(2025, 1, 2), score_pct=90.0
+        )
+    )
+    session.commit()
+
+    drift = services.reconcile_summaries(session, fix=False)
+    assert [entry.course_id for entry in drift] == [None]
+    assert drift[0].stored == (50.0, 0.0, 0.0)
+    assert drift[0].actual == (75.0, 25.0, 2250.0)
+
+    services.reconcile_summaries(session)
+    assert repo.totals() == (75.0, 25.0, 2250.0)
+    assert services.reconcile_summaries(session, fix=False) == []
+
+
+def test_stats_cache_is_lru_bounded():
+    cache = services.StatsCache(max_entries=2)
+    agg = services.TenantSummary(calculations.WeightTotals(10.0, 0.0, 0.0), 1)
+    for key in ("a", "b"):
+        cache.put(key, agg, cache.token())
+    cache.get("a")  # "b" becomes least recently used
+    cache.put("c", agg, cache.token())
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == agg
+
+
+def test_stats_cache_drops_loads_that_raced_a_write():
+    cache = services.StatsCache()
+    stale = services.TenantSummary(calculations.WeightTotals(10.0, 0.0, 0.0), 1)
+
+    token = cache.token()
+    with cache.writing():
+        cache.put("t", stale, cache.token())  # load during an in-flight write
+    cache.put("t", stale, token)  # load that started before the write
+    assert cache.get("t") is None
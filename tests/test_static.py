@@ -0,0 +1,103 @@
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.static import (
+    IMMUTABLE,
+    REVALIDATE,
+    PrecompressedStaticFiles,
+    accepted_encodings,
+    build_frontend,
+)
+
+APP_JS = "console.log('grades');\n" * 200
+
+
+@pytest.fixture()
+def frontend(tmp_path):
+    src = tmp_path / "frontend"
+    src.mkdir()
+    (src / "app.js").write_text(APP_JS)
+    (src / "index.html").write_text(
+        '<link href="data:x" /><script src="app.js?v=2" defer></script>'
+    )
+    manifest = build_frontend(src)
+    app = FastAPI()
+    app.mount(
+        "/",
+        PrecompressedStaticFiles(directories=[src / "dist", src], html=True),
+        name="frontend",
+    )
+    return TestClient(app), manifest
+
+
+def test_build_fingerprints_and_rewrites_references(frontend):
+    client, manifest = frontend
+    hashed = manifest["app.js"]
+    assert hashed.startswith("app.") and hashed.endswith(".js") and hashed != "app.js"
+
+    html = client.get("/", headers={"Accept-Encoding": "identity"}).text
+    assert f'src="{hashed}"' in html
+    assert 'href="data:x"' in html
+
+
+def test_serves_precompressed_variant_as_immutable(frontend):
+    client, manifest = frontend
+    res = client.get(f"/{manifest['app.js']}", headers={"Accept-Encoding": "gzip"})
+    assert res.status_code == 200
+    assert res.headers["content-encoding"] == "gzip"
+    assert res.headers["cache-control"] == IMMUTABLE
+    assert res.headers["vary"] == "Accept-Encoding"
+    assert res.headers["content-type"].startswith("text/javascript")
+    assert int(res.headers["content-length"]) < len(APP_JS)
+    assert res.text == APP_JS
+
+
+def test_identity_and_html_revalidate(frontend):
+    client, manifest = frontend
+    res = client.get(f"/{manifest['app.js']}", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in res.headers
+    assert res.text == APP_JS
+
+    page = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert page.headers["cache-control"] == REVALIDATE
+    again = client.get(
+        "/", headers={"Accept-Encoding": "gzip", "If-None-Match": page.headers["etag"]}
+    )
+    assert again.status_code == 304
+
+
+def test_unbuilt_sources_are_still_served(frontend):
+    client, _ = frontend
+    res = client.get("/app.js", headers={"Accept-Encoding": "identity"})
+    assert res.status_code == 200
+    assert res.headers["cache-control"] == REVALIDATE
+
+
+def test_accepted_encodings_honours_zero_quality():
+    assert accepted_encodings("gzip, br;q=0") == {"gzip"}
+    assert accepted_encodings(None) == set()
+
+
+def test_api_responses_are_gzipped_above_threshold(client):
+    for i in range(30):
+        client.post(
+            "/assessments",
+            json={"title": f"Quiz {i}", "weight_pct": 1, "due_date": "2025-01-01"},
+        )
+    res = client.get("/assessments", headers={"Accept-Encoding": "gzip"})
+    assert res.headers["content-encoding"] == "gzip"
+    assert len(res.json()) == 30
+
+    small = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+
+def test_gzip_variant_matches_source(frontend, tmp_path):
+    _, manifest = frontend
+    built = tmp_path / "frontend" / "dist" / manifest["app.js"]
+    assert gzip.decompress(built.with_name(built.name + ".gz").read_bytes()) == (
+        APP_JS.encode()
+    )